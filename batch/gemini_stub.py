@@ -0,0 +1,37 @@
+"""Offline stand-in for google.generativeai so the app modules import without network access."""
+import sys
+import types
+
+STUB_MODEL_NAME = "models/local-stub"
+STUB_RESPONSE = "Stub insight: distribution looks stable; no action needed."
+
+
+class _Response:
+    text = STUB_RESPONSE
+
+
+class _ModelInfo:
+    name = STUB_MODEL_NAME
+    supported_generation_methods = ["generateContent"]
+
+
+class GenerativeModel:
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def generate_content(self, prompt):
+        return _Response()
+
+
+def install():
+    """Registers the stub as google.generativeai; must run before utils.eda_process is imported."""
+    genai = types.ModuleType("google.generativeai")
+    genai.configure = lambda **kwargs: None
+    genai.list_models = lambda: [_ModelInfo()]
+    genai.GenerativeModel = GenerativeModel
+
+    google = sys.modules.get("google") or types.ModuleType("google")
+    google.generativeai = genai
+    sys.modules["google"] = google
+    sys.modules["google.generativeai"] = genai
+    return genai
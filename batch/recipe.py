@@ -0,0 +1,168 @@
+"""Cleaning recipes for headless batch runs.
+
+A recipe is a JSON file with an ordered list of cleaning steps and the plot
+settings used for the report, for example:
+
+    {
+        "steps": [
+            {"op": "drop_duplicates"},
+            {"op": "standardize_text", "operations": ["Trim whitespace", "Case fold"]},
+            {"op": "missing", "method": "Fill with Median", "columns": "numeric"},
+            {"op": "missing", "method": "Fill with Mode", "columns": "text"},
+            {"op": "outliers", "action": "Cap Outliers", "columns": ["amount"]}
+        ],
+        "plots": {"numeric": "Histogram", "categorical": "Bar Chart", "max_columns": 20},
+        "ai_summaries": true,
+        "export": {"format": "Parquet", "compression": "zstd"}
+    }
+
+"columns" accepts a list of names or one of "all", "numeric" and "text";
+missing and outlier steps only touch the selected columns that need it.
+Line plots use the full column, downsampled, ordered by plots.line_order
+(a datetime or numeric column name) or by row order when it is unset.
+"""
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from utils.edit import (
+    MISSING_METHODS,
+    OUTLIER_ACTIONS,
+    drop_duplicate_rows,
+    handle_missing_values,
+    handle_outliers
+)
+from utils.export import EXPORT_FORMATS
+from utils.text_standardize import OPERATIONS as TEXT_OPERATIONS, standardize_columns, text_columns
+
+NUMERIC_PLOTS = ["Histogram", "Box Plot", "Line Plot"]
+CATEGORICAL_PLOTS = ["Bar Chart", "Pie Chart"]
+COLUMN_SELECTORS = ["all", "numeric", "text"]
+NUMERIC_ONLY_METHODS = ["Fill with Mean", "Fill with Median", "Interpolate"]
+
+DEFAULT_RECIPE = {
+    "steps": [
+        {"op": "drop_duplicates"},
+        {"op": "missing", "method": "Fill with Median", "columns": "numeric"},
+        {"op": "missing", "method": "Fill with Mode", "columns": "text"}
+    ],
+    "plots": {
+        "numeric": "Histogram",
+        "categorical": "Bar Chart",
+        "max_columns": 20,
+        "max_categories": 30,
+        "sample_size": 5000,
+        "correlation_heatmap": True,
+        "dpi": 150,
+        "line_order": None
+    },
+    "ai_summaries": True,
+    "export": None
+}
+
+
+class RecipeError(ValueError):
+    pass
+
+
+def _check_columns(step, i):
+    columns = step.get("columns", "all")
+    if isinstance(columns, str):
+        if columns not in COLUMN_SELECTORS:
+            raise RecipeError(f"step {i}: columns must be a list or one of {COLUMN_SELECTORS}")
+    elif not isinstance(columns, list):
+        raise RecipeError(f"step {i}: columns must be a list or one of {COLUMN_SELECTORS}")
+
+
+def validate_recipe(recipe):
+    """Fills in defaults and checks every step; raises RecipeError on the first problem."""
+    merged = {**DEFAULT_RECIPE, **recipe}
+    merged["plots"] = {**DEFAULT_RECIPE["plots"], **recipe.get("plots", {})}
+
+    for i, step in enumerate(merged["steps"]):
+        op = step.get("op")
+        if op == "drop_duplicates":
+            continue
+        if op == "missing":
+            if step.get("method") not in MISSING_METHODS:
+                raise RecipeError(f"step {i}: method must be one of {MISSING_METHODS}")
+            if step["method"] == "Fill with Constant value" and step.get("constant") in (None, ""):
+                raise RecipeError(f"step {i}: a constant value is required")
+            _check_columns(step, i)
+        elif op == "outliers":
+            if step.get("action") not in OUTLIER_ACTIONS:
+                raise RecipeError(f"step {i}: action must be one of {OUTLIER_ACTIONS}")
+            _check_columns(step, i)
+        elif op == "standardize_text":
+            unknown = [name for name in step.get("operations", []) if name not in TEXT_OPERATIONS]
+            if unknown:
+                raise RecipeError(f"step {i}: unknown text operations {unknown}")
+            _check_columns(step, i)
+        else:
+            raise RecipeError(f"step {i}: unknown op {op!r}")
+
+    plots = merged["plots"]
+    if plots["numeric"] not in NUMERIC_PLOTS:
+        raise RecipeError(f"plots.numeric must be one of {NUMERIC_PLOTS}")
+    if plots["categorical"] not in CATEGORICAL_PLOTS:
+        raise RecipeError(f"plots.categorical must be one of {CATEGORICAL_PLOTS}")
+
+    export = merged["export"]
+    if export:
+        fmt = export.get("format")
+        if fmt not in EXPORT_FORMATS:
+            raise RecipeError(f"export.format must be one of {list(EXPORT_FORMATS)}")
+        if export.get("compression") not in EXPORT_FORMATS[fmt]["compression"]:
+            raise RecipeError(f"export.compression for {fmt} must be one of {EXPORT_FORMATS[fmt]['compression']}")
+    return merged
+
+
+def load_recipe(path=None):
+    """Reads and validates a recipe file; without a path the default recipe is used."""
+    if path is None:
+        return validate_recipe({})
+    try:
+        recipe = json.loads(Path(path).read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        raise RecipeError(f"could not read recipe {path}: {e}") from e
+    return validate_recipe(recipe)
+
+
+def _select_columns(df, columns):
+    if columns == "all":
+        return df.columns.tolist()
+    if columns == "numeric":
+        return df.select_dtypes(include="number").columns.tolist()
+    if columns == "text":
+        return text_columns(df)
+    return [col for col in columns if col in df.columns]
+
+
+def apply_recipe(df, recipe):
+    """Runs the cleaning steps in order; returns (cleaned_df, per-step log)."""
+    log = []
+    for step in recipe["steps"]:
+        rows_before, cols_before = df.shape
+        op = step["op"]
+        if op == "drop_duplicates":
+            df = drop_duplicate_rows(df)
+        elif op == "missing":
+            selected = [col for col in _select_columns(df, step.get("columns", "all")) if df[col].isna().any()]
+            if step["method"] in NUMERIC_ONLY_METHODS:
+                selected = [col for col in selected if pd.api.types.is_numeric_dtype(df[col])]
+            if selected or step["method"] == "Drop rows with any missing value (entire row)":
+                df = handle_missing_values(df, step["method"], selected, step.get("constant"))
+        elif op == "outliers":
+            for col in _select_columns(df, step.get("columns", "numeric")):
+                if pd.api.types.is_numeric_dtype(df[col]) and df[col].notna().any():
+                    df = handle_outliers(df, col, step["action"])
+        elif op == "standardize_text":
+            selected = [col for col in _select_columns(df, step.get("columns", "text")) if col in text_columns(df)]
+            df = standardize_columns(df, selected, step.get("operations", []), step.get("mappings"))
+        log.append({
+            "op": op,
+            "rows": [rows_before, df.shape[0]],
+            "columns": [cols_before, df.shape[1]]
+        })
+    return df, log
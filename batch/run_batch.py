@@ -0,0 +1,478 @@
+"""Headless batch EDA over a directory of CSV/Excel extracts.
+
+Run from the repository root:
+
+    python -m batch.run_batch data/nightly --output reports/nightly --workers 8
+    python -m batch.run_batch data/nightly --recipe recipe.json --timeout 600 --memory-limit-mb 4096
+    python -m batch.run_batch data/a.csv data/b.xlsx --no-ai
+
+Each file is loaded, cleaned with the recipe (see batch/recipe.py), plotted and
+summarised with the same functions the Streamlit pages use, and written to
+<output>/<file>/ as report.pdf, PNG plots and optionally the cleaned dataset.
+Files run in a process pool. Each one has a wall-clock timeout and a limit on
+the resident memory it may add to its worker; a file that fails, times out or
+exceeds its memory is recorded in the manifest and the batch carries on.
+manifest.json and manifest.csv list the status, outputs, timing and peak
+memory of every file; the exit code is 1 if any file did not succeed.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import resource
+import shutil
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+# Parallelism comes from the pool, so each worker's math libraries stay single
+# threaded; this only takes effect if it runs before numpy is imported
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import pandas as pd  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx", ".xls")
+DEFAULT_OUTPUT = "batch_output"
+WATCHDOG_INTERVAL = 0.2
+# How long native code may ignore a limit breach before the worker is killed
+HARD_KILL_GRACE_SECONDS = 10
+AI_DISABLED_TEXT = "AI summaries were disabled for this batch run."
+MANIFEST_FIELDS = [
+    "file", "status", "seconds", "peak_rss_mb", "rows_in", "rows_out",
+    "columns_in", "columns_out", "report", "export", "error"
+]
+
+
+class LimitExceeded(Exception):
+    def __init__(self, status, error):
+        super().__init__(error)
+        self.status = status
+        self.error = error
+
+
+# The file the worker is processing; shared with the watchdog thread
+_job = None
+_job_lock = threading.Lock()
+
+
+def _rss_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _on_limit(signum, frame):
+    with _job_lock:
+        job = _job
+    if job is not None and job["breach"] is not None and not job["raised"]:
+        job["raised"] = True
+        raise LimitExceeded(*job["breach"])
+
+
+def _abort_marker(out_dir):
+    return Path(out_dir) / "_aborted.json"
+
+
+def _watchdog():
+    """Enforces the per-file timeout and memory limit from a side thread.
+
+    A breach raises LimitExceeded in the main thread at its next Python
+    bytecode. Native code that never returns (or that spins once allocations
+    fail) is handled by exiting the worker after a grace period; the abort
+    marker it leaves behind lets the parent report the right status.
+    """
+    main_thread = threading.main_thread().ident
+    while True:
+        time.sleep(WATCHDOG_INTERVAL)
+        with _job_lock:
+            job = _job
+            if job is None:
+                continue
+            now = time.monotonic()
+            if job["breach"] is None:
+                if job["deadline"] and now > job["deadline"]:
+                    job["breach"] = ("timeout", f"exceeded {job['timeout']}s")
+                elif job["rss_limit"] and _rss_bytes() > job["rss_limit"]:
+                    job["breach"] = ("memory_limit", f"exceeded the {job['memory_limit_mb']:g} MB memory limit")
+                if job["breach"] is not None:
+                    job["breached_at"] = now
+                    signal.pthread_kill(main_thread, signal.SIGUSR1)
+            elif now - job["breached_at"] > HARD_KILL_GRACE_SECONDS:
+                status, error = job["breach"]
+                marker = _abort_marker(job["out_dir"])
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.write_text(json.dumps({"status": status, "error": f"{error} (worker killed)"}))
+                os._exit(1)
+
+
+def _reset_peak_rss():
+    # Resets VmHWM so the next reading covers only the current file (Linux 4.0+)
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _quiet_streamlit():
+    # The app modules call Streamlit at import time, which only warns outside `streamlit run`
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+    import streamlit.logger
+    streamlit.logger.set_log_level(os.environ["STREAMLIT_LOGGER_LEVEL"])
+
+
+def _init_worker(ai_enabled):
+    """Imports the app modules once per worker and starts the limit watchdog."""
+    os.chdir(REPO_ROOT)
+    _quiet_streamlit()
+
+    if not ai_enabled:
+        # Avoids the Gemini model lookup that utils.eda_process performs on import
+        from batch import gemini_stub
+        gemini_stub.install()
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import utils.eda_process  # noqa: F401
+    import batch.recipe  # noqa: F401
+
+    signal.signal(signal.SIGUSR1, _on_limit)
+    threading.Thread(target=_watchdog, name="batch-watchdog", daemon=True).start()
+
+
+def _uncached(func):
+    """Skips st.cache_data; a worker never sees the same frame twice, so hashing it is wasted work."""
+    return getattr(func, "__wrapped__", func)
+
+
+def _safe_name(value):
+    return re.sub(r"[^\w.-]+", "_", str(value)).strip("_") or "column"
+
+
+def _latin1(text):
+    # The FPDF core fonts only cover Latin-1; Gemini output often contains emoji
+    return str(text).encode("latin-1", "replace").decode("latin-1")
+
+
+def output_dir_for(path, output_root):
+    path = Path(path)
+    return Path(output_root) / f"{path.stem}_{path.suffix.lstrip('.').lower()}"
+
+
+def _plot_columns(df, settings):
+    """Picks the columns to plot: numeric ones and low-cardinality categoricals, in order."""
+    chosen, skipped = [], []
+    for col in df.columns:
+        if len(chosen) >= settings["max_columns"]:
+            skipped.append({"column": str(col), "reason": "max_columns reached"})
+            continue
+        series = df[col]
+        if series.notna().sum() == 0:
+            skipped.append({"column": str(col), "reason": "all missing"})
+        elif pd.api.types.is_numeric_dtype(series):
+            chosen.append((col, settings["numeric"]))
+        elif series.nunique(dropna=True) <= settings["max_categories"]:
+            chosen.append((col, settings["categorical"]))
+        else:
+            skipped.append({"column": str(col), "reason": "too many categories"})
+    return chosen, skipped
+
+
+def _describe(df, col, plot_type):
+    # Same description the EDA page sends to Gemini
+    if pd.api.types.is_numeric_dtype(df[col]):
+        return f"Column: {col}\nPlot: {plot_type}\nStats:\n{df[col].describe().to_string()}"
+    return f"Column: {col}\nPlot: {plot_type}\nCounts:\n{df[col].value_counts().to_string()}"
+
+
+def _save(fig, path, dpi):
+    """Saves the figure as an RGB PNG; FPDF embeds those directly but decodes alpha channels pixel by pixel."""
+    import matplotlib.pyplot as plt
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    buffer.seek(0)
+    Image.open(buffer).convert("RGB").save(path, format="PNG")
+
+
+def run_pipeline(path, out_dir, recipe):
+    """Loads, cleans, plots and reports one file; returns the manifest fields it produced."""
+    from batch.recipe import apply_recipe
+    from utils import eda_process
+    from utils.downsample import line_plot_points
+    from utils.edit import read_dataset
+    from utils.export import export_dataset, export_file_name
+
+    df = read_dataset(str(path))
+    rows_in, columns_in = df.shape
+    df, steps = apply_recipe(df, recipe)
+
+    settings = recipe["plots"]
+    ai_enabled = recipe["ai_summaries"]
+    plots_dir = out_dir / "plots"
+    plots_dir.mkdir(parents=True, exist_ok=True)
+
+    sample_size = settings["sample_size"]
+    df_sampled = df.sample(n=sample_size, random_state=42) if len(df) > sample_size else df
+
+    columns, skipped = _plot_columns(df, settings)
+    report_plots = []
+    for i, (col, plot_type) in enumerate(columns):
+        fig_path = plots_dir / f"{i:02d}_{_safe_name(col)}.png"
+        if plot_type == "Line Plot":
+            order_col = settings["line_order"] if settings["line_order"] in df.columns else None
+            plot_df = df
+            if order_col is not None and not pd.api.types.is_numeric_dtype(df[order_col]):
+                # CSV inputs carry timestamps as text
+                plot_df = df.assign(**{order_col: pd.to_datetime(df[order_col], errors="coerce")})
+            points = line_plot_points(plot_df, col, order_col)
+            fig = _uncached(eda_process.generate_line_plot)(points, col, order_col)
+        else:
+            fig = _uncached(eda_process.generate_plot)(df_sampled, col, plot_type)
+        _save(fig, fig_path, settings["dpi"])
+        summary = (
+            _uncached(eda_process.analyze_data_with_gemini)(plot_type, _describe(df, col, plot_type))
+            if ai_enabled else AI_DISABLED_TEXT
+        )
+        report_plots.append({"column": str(col), "plot_type": plot_type, "path": str(fig_path), "summary": summary})
+
+    numeric_cols = df.select_dtypes(include=["float", "int"]).columns.tolist()[:settings["max_columns"]]
+    if settings["correlation_heatmap"] and len(numeric_cols) >= 2:
+        fig_path = plots_dir / "correlation_heatmap.png"
+        fig = _uncached(eda_process.generate_bivariate_plot)(df[numeric_cols], None, None, "Correlation Heatmap")
+        _save(fig, fig_path, settings["dpi"])
+        summary = (
+            _uncached(eda_process.analyze_data_with_gemini)(
+                "Correlation Heatmap", f"Correlation Matrix:\n{df[numeric_cols].corr().to_string()}"
+            )
+            if ai_enabled else AI_DISABLED_TEXT
+        )
+        report_plots.append({"column": None, "plot_type": "Correlation Heatmap", "path": str(fig_path), "summary": summary})
+
+    overall = _uncached(eda_process.generate_overall_eda_summary)(df) if ai_enabled else AI_DISABLED_TEXT
+    pdf = eda_process.create_pdf_report(
+        df,
+        _latin1(overall),
+        [{"path": plot["path"], "summary": _latin1(plot["summary"])} for plot in report_plots]
+    )
+    report_path = out_dir / "report.pdf"
+    report_path.write_bytes(pdf)
+    (out_dir / "summary.md").write_text(overall)
+
+    export_path = None
+    if recipe["export"]:
+        fmt, compression = recipe["export"]["format"], recipe["export"].get("compression")
+        tmp_path, _, _ = export_dataset(df, fmt, compression)
+        export_path = out_dir / export_file_name("cleaned", fmt, compression)
+        shutil.move(tmp_path, export_path)
+
+    return {
+        "rows_in": rows_in,
+        "columns_in": columns_in,
+        "rows_out": df.shape[0],
+        "columns_out": df.shape[1],
+        "steps": steps,
+        "plots": [{**plot, "path": os.path.relpath(plot["path"], out_dir)} for plot in report_plots],
+        "skipped_columns": skipped,
+        "report": str(report_path),
+        "export": str(export_path) if export_path else None,
+    }
+
+
+def process_file(path, output_root, recipe, timeout, memory_limit_mb):
+    """Worker entry point: never raises, so one bad file cannot stop the batch."""
+    global _job
+    import matplotlib.pyplot as plt
+
+    out_dir = output_dir_for(path, output_root)
+    _abort_marker(out_dir).unlink(missing_ok=True)
+    record = {"file": str(path), "status": "ok", "error": None, "output_dir": str(out_dir)}
+    _reset_peak_rss()
+    start = time.perf_counter()
+    try:
+        with _job_lock:
+            _job = {
+                "out_dir": out_dir,
+                "timeout": timeout,
+                "deadline": time.monotonic() + timeout if timeout else None,
+                "memory_limit_mb": memory_limit_mb,
+                # The limit applies to growth over what the worker holds between files
+                "rss_limit": _rss_bytes() + memory_limit_mb * 1024 ** 2 if memory_limit_mb else None,
+                "breach": None,
+                "raised": False,
+            }
+        record.update(run_pipeline(Path(path), out_dir, recipe))
+    except LimitExceeded as e:
+        record.update(status=e.status, error=e.error)
+    except MemoryError:
+        record.update(status="memory_limit", error="ran out of memory")
+    except Exception as e:
+        record.update(status="failed", error=f"{type(e).__name__}: {e}")
+    finally:
+        with _job_lock:
+            _job = None
+        plt.close("all")
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    record["peak_rss_mb"] = round(_peak_rss_mb(), 1)
+    return record
+
+
+def find_inputs(inputs, recursive=False):
+    """Expands files and directories into the sorted list of supported files."""
+    files = []
+    for item in inputs:
+        item = Path(item)
+        if item.is_dir():
+            pattern = "**/*" if recursive else "*"
+            files.extend(p for p in item.glob(pattern) if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS)
+        elif item.is_file():
+            files.append(item)
+        else:
+            raise FileNotFoundError(f"No such file or directory: {item}")
+    return sorted({p.resolve() for p in files})
+
+
+def _crashed(path, output_root):
+    """Record for a file whose worker died; uses the watchdog's abort marker when there is one."""
+    out_dir = output_dir_for(path, output_root)
+    record = {"file": str(path), "status": "crashed", "error": "worker process died",
+              "output_dir": str(out_dir), "seconds": None, "peak_rss_mb": None}
+    marker = _abort_marker(out_dir)
+    if marker.exists():
+        record.update(json.loads(marker.read_text()))
+        marker.unlink()
+    return record
+
+
+def _run_pool(files, output_root, recipe, args, workers, on_done):
+    """Runs files through one pool; returns the files whose worker died before reporting back."""
+    broken = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(recipe["ai_summaries"],)
+    ) as pool:
+        futures = {
+            pool.submit(process_file, str(path), str(output_root), recipe, args.timeout, args.memory_limit_mb): path
+            for path in files
+        }
+        for future in as_completed(futures):
+            try:
+                on_done(future.result())
+            except BrokenProcessPool:
+                broken.append(futures[future])
+            except Exception as e:
+                path = futures[future]
+                on_done({**_crashed(path, output_root), "status": "failed", "error": f"{type(e).__name__}: {e}"})
+    return broken
+
+
+def run_batch(files, output_root, recipe, args):
+    records = []
+
+    def on_done(record):
+        records.append(record)
+        seconds = f"{record['seconds']:8.2f}s" if record.get("seconds") is not None else " " * 9
+        print(f"[{len(records)}/{len(files)}] {record['status']:<12} {seconds}  {record['file']}", flush=True)
+        if record["error"]:
+            print(f"    {record['error']}", flush=True)
+
+    broken = _run_pool(files, output_root, recipe, args, args.workers, on_done)
+    # A worker that dies (watchdog kill, OOM killer) breaks the whole pool, so the
+    # files it took down are retried one at a time to find the one responsible
+    for path in broken:
+        if _run_pool([path], output_root, recipe, args, 1, on_done):
+            on_done(_crashed(path, output_root))
+    return sorted(records, key=lambda r: r["file"])
+
+
+def write_manifest(output_root, records, recipe, started):
+    manifest = {
+        "started": started,
+        "finished": datetime.now(timezone.utc).isoformat(),
+        "files": len(records),
+        "succeeded": sum(r["status"] == "ok" for r in records),
+        "recipe": recipe,
+        "results": records,
+    }
+    (output_root / "manifest.json").write_text(json.dumps(manifest, indent=2, default=str))
+    with open(output_root / "manifest.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=MANIFEST_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+    return manifest
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Auto EDA cleaning and report pipeline over many files.")
+    parser.add_argument("inputs", nargs="+", help="Files or directories of .csv/.xlsx/.xls files.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Directory for reports and the manifest.")
+    parser.add_argument("--recipe", help="Cleaning recipe JSON; defaults to batch.recipe.DEFAULT_RECIPE.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=int, default=900, help="Seconds allowed per file (0 disables).")
+    parser.add_argument("--memory-limit-mb", type=float, default=None,
+                        help="Resident memory a file may add on top of the worker's idle footprint.")
+    parser.add_argument("--recursive", action="store_true", help="Also search subdirectories.")
+    parser.add_argument("--no-ai", action="store_true", help="Skip Gemini summaries (no network access needed).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    _quiet_streamlit()
+    if args.no_ai:
+        # Before the first app import, so the parent process stays offline too
+        from batch import gemini_stub
+        gemini_stub.install()
+    from batch.recipe import RecipeError, load_recipe
+
+    try:
+        recipe = load_recipe(args.recipe)
+        files = find_inputs(args.inputs, args.recursive)
+    except (RecipeError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if args.no_ai:
+        recipe["ai_summaries"] = False
+    if not files:
+        print("No .csv/.xlsx/.xls files found.", file=sys.stderr)
+        return 2
+
+    output_root = Path(args.output).resolve()
+    output_root.mkdir(parents=True, exist_ok=True)
+    started = datetime.now(timezone.utc).isoformat()
+    print(f"Processing {len(files)} file(s) with {args.workers} worker(s) into {output_root}", flush=True)
+
+    records = run_batch(files, output_root, recipe, args)
+    manifest = write_manifest(output_root, records, recipe, started)
+    print(f"{manifest['succeeded']}/{manifest['files']} succeeded; manifest written to {output_root / 'manifest.json'}")
+    return 0 if manifest["succeeded"] == manifest["files"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
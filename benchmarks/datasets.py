@@ -0,0 +1,64 @@
+"""Synthetic dataset generators for the benchmark suite."""
+import numpy as np
+import pandas as pd
+
+SHAPES = ("narrow", "wide")
+WIDE_EXTRA_COLUMNS = 300
+MISSING_RATE = 0.05
+DUPLICATE_RATE = 0.02
+
+CITIES = np.array(["London", "Paris", "new york", "New York ", "Tokyo", "Berlin", "Madrid", "Rome"], dtype=object)
+SEGMENTS = np.array(["consumer", "corporate", "home office"], dtype=object)
+
+
+def _with_missing(values, rng):
+    values = values.astype(float) if values.dtype.kind in "iu" else values.copy()
+    mask = rng.random(len(values)) < MISSING_RATE
+    values[mask] = np.nan if values.dtype.kind == "f" else None
+    return values
+
+
+def make_dataset(rows, shape="narrow", seed=0):
+    """Builds a mixed-dtype frame with missing values, duplicates and outliers.
+
+    "narrow" has a dozen columns of every dtype the app handles; "wide" adds
+    WIDE_EXTRA_COLUMNS float sensor columns on top.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape: {shape}")
+    rng = np.random.default_rng(seed)
+
+    amount = rng.lognormal(3, 1, rows)
+    amount[rng.random(rows) < 0.01] *= 50
+    df = pd.DataFrame({
+        "order_id": np.arange(rows),
+        "customer_id": np.char.add("C", rng.integers(0, max(rows // 3, 1), rows).astype(str)).astype(object),
+        "age": _with_missing(rng.integers(18, 90, rows), rng),
+        "amount": _with_missing(amount, rng),
+        "cost": _with_missing(amount * rng.uniform(0.3, 0.9, rows), rng),
+        "quantity": rng.poisson(3, rows),
+        "score": rng.normal(0, 1, rows),
+        "city": _with_missing(CITIES[rng.integers(0, len(CITIES), rows)], rng),
+        "segment": SEGMENTS[rng.integers(0, len(SEGMENTS), rows)],
+        "is_returned": rng.random(rows) < 0.1,
+        "order_date": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 5 * 365 * 24, rows), unit="h"),
+        "year": rng.integers(2015, 2025, rows),
+    })
+
+    if shape == "wide":
+        sensors = rng.normal(0, 1, (rows, WIDE_EXTRA_COLUMNS))
+        sensors[rng.random(sensors.shape) < MISSING_RATE] = np.nan
+        df = pd.concat(
+            [df, pd.DataFrame(sensors, columns=[f"sensor_{i:04d}" for i in range(WIDE_EXTRA_COLUMNS)])],
+            axis=1
+        )
+
+    n_dupes = int(rows * DUPLICATE_RATE)
+    if n_dupes:
+        src = rng.integers(0, rows, n_dupes)
+        dst = rng.integers(0, rows, n_dupes)
+        for col in df.columns:
+            values = df[col].to_numpy(copy=True)
+            values[dst] = values[src]
+            df[col] = values
+    return df
@@ -0,0 +1,263 @@
+"""Benchmarks for the cleaning and EDA hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks.run_benchmarks --sizes 10000 100000 --shapes narrow wide
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+
+Each operation is timed over --repeat runs (best time is kept) and then run once
+more under tracemalloc for its peak allocation. Results are written as JSON and,
+when a baseline is given, compared against it; the exit code is 1 if any
+operation regressed beyond the thresholds. Gemini is replaced by a local stub so
+the suite runs offline.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+os.chdir(REPO_ROOT)
+
+from batch import gemini_stub  # noqa: E402
+
+gemini_stub.install()
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import streamlit as st  # noqa: E402
+
+from benchmarks.datasets import SHAPES, make_dataset  # noqa: E402
+from utils import edit, eda_process  # noqa: E402
+from utils.downsample import line_plot_points  # noqa: E402
+from utils.missingness import build_null_mask  # noqa: E402
+from utils.profile import null_counts  # noqa: E402
+from utils.session_store import set_working_df  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000]
+DEFAULT_OUTPUT = "benchmarks/results/latest.json"
+TIME_THRESHOLD = 0.25
+MEMORY_THRESHOLD = 0.25
+# Differences below these are treated as noise regardless of the relative change
+MIN_TIME_DELTA = 0.02
+MIN_MEMORY_DELTA_MB = 5.0
+# The annotated heatmap draws one text artist per cell, so on wide frames it is
+# benchmarked over the first numeric columns only; otherwise it dominates the run
+HEATMAP_MAX_COLUMNS = 12
+
+
+def _uncached(func):
+    """Returns the function underneath st.cache_data so every run does the work."""
+    return getattr(func, "__wrapped__", func)
+
+
+def _render_plot(fig):
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _setup(df, workdir):
+    csv_path = os.path.join(workdir, "dataset.csv")
+    df.to_csv(csv_path, index=False)
+
+    images = []
+    for i, col in enumerate(["amount", "segment"]):
+        plot_type = "Histogram" if i == 0 else "Bar Chart"
+        fig = _uncached(eda_process.generate_plot)(df.head(5000), col, plot_type)
+        path = os.path.join(workdir, f"plot_{i}.png")
+        fig.savefig(path, dpi=100)
+        plt.close(fig)
+        images.append({"path": path, "summary": gemini_stub.STUB_RESPONSE})
+
+    set_working_df(df)
+    return {"csv_path": csv_path, "images": images}
+
+
+def _numeric_columns(df):
+    return df.select_dtypes(include="number").columns.tolist()
+
+
+def _cold(func, df):
+    """func(df) with the cached profile dropped first, so every repeat does the work."""
+    st.session_state.pop("_profile_cache", None)
+    return func(df)
+
+
+OPERATIONS = {
+    "load_file": lambda df, ctx: edit.load_file(ctx["csv_path"]),
+    "null_counts": lambda df, ctx: _cold(null_counts, df),
+    "build_null_mask": lambda df, ctx: _cold(build_null_mask, df),
+    "handle_missing_values": lambda df, ctx: edit.handle_missing_values(
+        df, "Fill with Median", [c for c in _numeric_columns(df) if df[c].isna().any()]
+    ),
+    "find_duplicates": lambda df, ctx: df.duplicated(),
+    "drop_duplicate_rows": lambda df, ctx: edit.drop_duplicate_rows(df),
+    "detect_outliers": lambda df, ctx: edit.detect_outliers(df["amount"]),
+    "handle_outliers": lambda df, ctx: edit.handle_outliers(df, "amount", "Cap Outliers"),
+    "generate_plot_histogram": lambda df, ctx: _render_plot(
+        _uncached(eda_process.generate_plot)(df, "amount", "Histogram")
+    ),
+    "generate_plot_bar": lambda df, ctx: _render_plot(
+        _uncached(eda_process.generate_plot)(df, "city", "Bar Chart")
+    ),
+    "generate_line_plot_lttb": lambda df, ctx: _render_plot(
+        _uncached(eda_process.generate_line_plot)(line_plot_points(df, "amount"), "amount")
+    ),
+    "generate_bivariate_scatter": lambda df, ctx: _render_plot(
+        _uncached(eda_process.generate_bivariate_plot)(df, "amount", "cost", "Scatter Plot")
+    ),
+    "generate_bivariate_heatmap": lambda df, ctx: _render_plot(
+        _uncached(eda_process.generate_bivariate_plot)(
+            df[_numeric_columns(df)[:HEATMAP_MAX_COLUMNS]], None, None, "Correlation Heatmap"
+        )
+    ),
+    "create_pdf_report": lambda df, ctx: eda_process.create_pdf_report(
+        df, gemini_stub.STUB_RESPONSE, ctx["images"]
+    ),
+}
+
+
+def measure(func, repeat):
+    """Returns (best wall seconds over repeat runs, peak traced MB of one extra run)."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak / 1024 ** 2
+
+
+def run_suite(sizes, shapes, operations, repeat, seed):
+    results = []
+    for shape in shapes:
+        for rows in sizes:
+            df = make_dataset(rows, shape, seed)
+            with tempfile.TemporaryDirectory(prefix="auto_eda_bench_") as workdir:
+                ctx = _setup(df, workdir)
+                for name in operations:
+                    seconds, peak_mb = measure(lambda: OPERATIONS[name](df, ctx), repeat)
+                    results.append({
+                        "op": name,
+                        "shape": shape,
+                        "rows": rows,
+                        "columns": df.shape[1],
+                        "seconds": round(seconds, 6),
+                        "peak_mb": round(peak_mb, 3)
+                    })
+                    print(f"{name:<28} {shape:<7} {rows:>10,} rows  {seconds:9.4f}s  {peak_mb:10.2f} MB", flush=True)
+    return results
+
+
+def environment():
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+
+
+def compare(results, baseline, time_threshold, memory_threshold):
+    """Returns the list of regressions of results against baseline results."""
+    previous = {(r["op"], r["shape"], r["rows"]): r for r in baseline["results"]}
+    regressions = []
+    for current in results:
+        base = previous.get((current["op"], current["shape"], current["rows"]))
+        if base is None:
+            continue
+        slow = (
+            current["seconds"] > base["seconds"] * (1 + time_threshold)
+            and current["seconds"] - base["seconds"] > MIN_TIME_DELTA
+        )
+        heavy = (
+            current["peak_mb"] > base["peak_mb"] * (1 + memory_threshold)
+            and current["peak_mb"] - base["peak_mb"] > MIN_MEMORY_DELTA_MB
+        )
+        if slow or heavy:
+            regressions.append({
+                "op": current["op"],
+                "shape": current["shape"],
+                "rows": current["rows"],
+                "seconds": [base["seconds"], current["seconds"]],
+                "peak_mb": [base["peak_mb"], current["peak_mb"]],
+            })
+    return regressions
+
+
+def _write_json(path, payload):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Auto EDA cleaning and plotting hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Row counts to generate (10k to 10M are supported).")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--ops", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per operation; the best is kept.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", help="Baseline JSON to compare against.")
+    parser.add_argument("--save-baseline", help="Also write the results to this baseline path.")
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD,
+                        help="Allowed relative slowdown before flagging a regression.")
+    parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD,
+                        help="Allowed relative peak memory growth before flagging a regression.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    payload = {
+        "environment": environment(),
+        "results": run_suite(args.sizes, args.shapes, args.ops, args.repeat, args.seed),
+    }
+    _write_json(args.output, payload)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        _write_json(args.save_baseline, payload)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(payload["results"], baseline, args.time_threshold, args.memory_threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for r in regressions:
+                print(f"  {r['op']} {r['shape']} {r['rows']:,} rows: "
+                      f"{r['seconds'][0]:.4f}s -> {r['seconds'][1]:.4f}s, "
+                      f"{r['peak_mb'][0]:.1f} MB -> {r['peak_mb'][1]:.1f} MB")
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
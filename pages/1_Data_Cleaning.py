@@ -10,50 +10,73 @@ from pathlib import Path
 import pandas as pd
 from utils.edit import (
     load_file,
+    capture_baseline,
+    show_excel_options,
     preview_data,
     show_basic_stats,
     show_info,
     show_missing_values,
     show_duplicates,
     show_outliers,
-    show_data_standardization
+    show_data_standardization,
+    show_memory_optimization,
+    show_export,
+    show_comparison
 )
 from utils.eda_process import eda_section
+from utils.warmup import WARMUP_ENABLED
+from utils.session_store import get_working_df, idle_timeout_hours, set_working_df, spill_enabled
+from utils.perf import start_run, finish_run, render_perf_panel
+from utils.jobs import apply_finished_jobs, render_jobs_panel
 
+start_run("Data Cleaning")
+apply_finished_jobs()
 
 st.title("🧼 Data Upload & Cleaning")
 
-if "df" not in st.session_state:
-    st.session_state.df = None
-
-if st.session_state.df is None:
+if get_working_df() is None:
     uploaded_file = st.file_uploader("📁 Upload your CSV or Excel file", type=["csv", "xlsx"])
+    warmup = st.checkbox(
+        "Prepare EDA charts in the background", value=WARMUP_ENABLED, key="warmup_enabled",
+        help="Computes column profiles, value counts, histograms and correlations right after loading"
+    )
 
     if uploaded_file:
         file_name = uploaded_file.name
         save_path = Path("uploads") / file_name
         save_path.parent.mkdir(exist_ok=True)
 
-        with open(save_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        # Keep the saved copy (and its modification time) stable while sheet options are chosen
+        if st.session_state.get("saved_upload_id") != uploaded_file.file_id or not save_path.exists():
+            with open(save_path, "wb") as f:
+                f.write(uploaded_file.getbuffer())
+            st.session_state.saved_upload_id = uploaded_file.file_id
 
-        st.session_state.df = load_file(str(save_path))
-        if st.session_state.df is not None:
-            st.success("✅ File uploaded successfully")
-            st.rerun()
+        load_options = show_excel_options(str(save_path)) if save_path.suffix.lower() == ".xlsx" else {}
+        if load_options is not None:
+            loaded_df = load_file(str(save_path), **load_options)
+            if loaded_df is not None:
+                set_working_df(loaded_df)
+                capture_baseline(loaded_df, warm_up=warmup)
+                st.success("✅ File uploaded successfully")
+                st.rerun()
 
     st.info("Please upload a file to begin.")
+    if spill_enabled():
+        st.caption(f"Uploaded data is cleared after {idle_timeout_hours():g} hours without activity.")
 
 else:
-    df = st.session_state.df
+    df = get_working_df()
 
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
         "Data Overview",
         "Missing Values",
         "Duplicates",
         "Standardize Data",
         "Outliers",
-        "Export"
+        "Optimize Memory",
+        "Export",
+        "Compare"
     ])
 
     with tab1:
@@ -74,17 +97,14 @@ else:
         show_outliers(df)
     
     with tab6:
-        st.subheader("### Export Cleaned Data")
-        
-        @st.cache_data
-        def convert_df(df):
-            return df.to_csv(index=False).encode('utf-8')
-        
-        csv = convert_df(st.session_state.df)
-        st.download_button(
-            label="📥 Download Cleaned Data as CSV",
-            data=csv,
-            file_name='cleaned_data.csv',
-            mime='text/csv',
-            use_container_width=True
-        )
+        show_memory_optimization(df)
+
+    with tab7:
+        show_export(df)
+
+    with tab8:
+        show_comparison(df)
+
+render_jobs_panel()
+render_perf_panel()
+finish_run()
@@ -1,5 +1,11 @@
 import streamlit as st
 from utils.eda_process import eda_section
+from utils.session_store import get_working_df
+from utils.perf import start_run, finish_run, render_perf_panel
+from utils.jobs import apply_finished_jobs, render_jobs_panel
+
+start_run("EDA")
+apply_finished_jobs()
 
 query_params = st.query_params
 
@@ -8,8 +14,12 @@ if query_params.get("page") == "eda":
 
 st.title("📈 Exploratory Data Analysis (EDA)")
 
-if "df" not in st.session_state or st.session_state.df is None:
+df = get_working_df()
+if df is None:
     st.warning("⚠️ Please upload and clean your dataset in the 🧼 Data Cleaning tab first.")
 else:
-    df = st.session_state.df
     eda_section(df)
+
+render_jobs_panel()
+render_perf_panel()
+finish_run()
@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+# The app is run from the repository root and imports its modules as utils.*, batch.*
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from batch import gemini_stub  # noqa: E402
+
+# Keeps utils.eda_process from reaching the Gemini API when a test imports it
+gemini_stub.install()
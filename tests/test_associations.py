@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+from scipy.stats.contingency import association
+
+from utils.associations import association_report, top_associations
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    city = rng.choice(["A", "B", "C", "D"], 4000)
+    segment = np.where(rng.random(4000) < 0.7, np.char.lower(city), rng.choice(["a", "b", "c", "d"], 4000))
+    df = pd.DataFrame({
+        "city": city,
+        "segment": segment,
+        "noise": rng.choice(["x", "y"], 4000),
+        "spend": (city == "A") * 5.0 + rng.normal(size=4000),
+    })
+    df.loc[::9, "segment"] = None
+    return df
+
+
+def _mutual_info(x, y):
+    table = pd.crosstab(x, y).to_numpy()
+    p = table / table.sum()
+    expected = np.outer(p.sum(axis=1), p.sum(axis=0))
+    nonzero = p > 0
+    return (p[nonzero] * np.log(p[nonzero] / expected[nonzero])).sum()
+
+
+def _entropy(x):
+    p = x.value_counts(normalize=True).to_numpy()
+    return -(p * np.log(p)).sum()
+
+
+def test_measures_match_crosstab_computations():
+    df = _frame()
+    report = association_report(df, ["spend"])
+    both = df[["city", "segment"]].dropna()
+
+    expected_v = association(pd.crosstab(both["city"], both["segment"]).to_numpy(), method="cramer", correction=False)
+    assert np.isclose(report["Cramér's V"].at["city", "segment"], expected_v)
+    mi = _mutual_info(both["city"], both["segment"])
+    assert np.isclose(report["Mutual information"].at["city", "segment"], mi)
+    assert np.isclose(report["Theil's U"].at["city", "segment"], mi / _entropy(both["city"]))
+    assert np.isclose(report["Theil's U"].at["segment", "city"], mi / _entropy(both["segment"]))
+
+
+def test_correlation_ratio_matches_group_means():
+    df = _frame()
+    report = association_report(df, ["spend"])
+    means = df.groupby("city")["spend"].transform("mean")
+    eta = np.sqrt(((means - df["spend"].mean()) ** 2).sum() / ((df["spend"] - df["spend"].mean()) ** 2).sum())
+    assert np.isclose(report["Correlation ratio"].at["spend", "city"], eta)
+
+
+def test_strongest_pair_comes_first():
+    report = association_report(_frame(), [])
+    best = top_associations(report["Cramér's V"], 1)
+    assert {best.at[0, "x"], best.at[0, "y"]} == {"city", "segment"}
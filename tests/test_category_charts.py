@@ -0,0 +1,36 @@
+import matplotlib
+import numpy as np
+import pandas as pd
+
+matplotlib.use("Agg")
+
+from utils.eda_process import OTHER_LABEL, generate_category_plot, looks_like_identifier, top_n_counts  # noqa: E402
+
+
+def test_top_n_keeps_the_largest_counts_and_sums_the_rest_into_other():
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.zipf(1.5, 5000) % 300)
+    counts = values.value_counts()
+    reduced = top_n_counts(counts, 10)
+    assert len(reduced) == 11
+    pd.testing.assert_series_equal(reduced.iloc[:10], counts.iloc[:10], check_index_type=False, check_names=False)
+    assert reduced[OTHER_LABEL] == counts.iloc[10:].sum()
+    assert reduced.sum() == len(values)
+
+
+def test_short_counts_are_left_alone():
+    counts = pd.Series({"a": 3, "b": 1})
+    assert top_n_counts(counts, 10) is counts
+
+
+def test_identifier_columns_are_detected():
+    assert looks_like_identifier(pd.Series([f"id{i}" for i in range(1000)]).value_counts())
+    assert not looks_like_identifier(pd.Series(list("abc") * 400).value_counts())
+
+
+def test_charts_draw_one_artist_per_category():
+    counts = top_n_counts(pd.Series(range(40), index=[f"c{i}" for i in range(40)]).sort_values(ascending=False), 10)
+    bar = generate_category_plot.__wrapped__(counts, "col", "Bar Chart")
+    assert len(bar.axes[0].patches) == 11
+    pie = generate_category_plot.__wrapped__(counts, "col", "Pie Chart")
+    assert len(pie.axes[0].patches) == 11
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+from scipy.stats import ks_2samp
+
+from utils.compare import PSI_FLOOR, build_snapshot, compare_snapshots
+
+
+def _naive_psi(before, after, bins=10):
+    cuts = np.quantile(before, np.linspace(0, 1, bins + 1)[1:-1])
+    grid = np.concatenate([[-np.inf], cuts, [np.inf]])
+    expected = np.histogram(before, grid)[0] / len(before)
+    actual = np.histogram(after, grid)[0] / len(after)
+    expected, actual = np.clip(expected, PSI_FLOOR, None), np.clip(actual, PSI_FLOOR, None)
+    return ((actual - expected) * np.log(actual / expected)).sum()
+
+
+def _frames():
+    rng = np.random.default_rng(0)
+    before = pd.DataFrame({
+        "amount": rng.normal(0, 1, 20_000),
+        "city": rng.choice(["A", "B", "C"], 20_000, p=[0.5, 0.3, 0.2]),
+        "dropped": rng.normal(size=20_000),
+    })
+    after = pd.DataFrame({
+        "amount": rng.normal(0.3, 1.2, 15_000),
+        "city": rng.choice(["A", "B", "D"], 15_000, p=[0.3, 0.3, 0.4]),
+        "added": rng.normal(size=15_000),
+    })
+    after.loc[::10, "amount"] = np.nan
+    return before, after
+
+
+def test_numeric_shift_matches_ks_2samp_and_decile_psi():
+    before, after = _frames()
+    table = compare_snapshots(build_snapshot(before), build_snapshot(after)).set_index("Column")
+    values_after = after["amount"].dropna()
+    assert np.isclose(table.at["amount", "KS"], ks_2samp(before["amount"], values_after).statistic, atol=2e-3)
+    assert np.isclose(table.at["amount", "PSI"], _naive_psi(before["amount"], values_after), rtol=0.02)
+    assert table.at["amount", "Null Change"] == after["amount"].isna().sum()
+
+
+def test_category_shift_matches_the_exact_frequencies():
+    before, after = _frames()
+    table = compare_snapshots(build_snapshot(before), build_snapshot(after)).set_index("Column")
+    labels = ["A", "B", "C", "D"]
+    expected = before["city"].value_counts(normalize=True).reindex(labels, fill_value=0).to_numpy()
+    actual = after["city"].value_counts(normalize=True).reindex(labels, fill_value=0).to_numpy()
+    expected, actual = np.clip(expected, PSI_FLOOR, None), np.clip(actual, PSI_FLOOR, None)
+    assert np.isclose(table.at["city", "PSI"], ((actual - expected) * np.log(actual / expected)).sum())
+    assert (table.at["city", "New Categories"], table.at["city", "Lost Categories"]) == (1, 1)
+
+
+def test_added_and_removed_columns_are_listed():
+    before, after = _frames()
+    table = compare_snapshots(build_snapshot(before), build_snapshot(after)).set_index("Column")
+    assert table.at["dropped", "Status"] == "removed"
+    assert table.at["added", "Status"] == "added"
+    assert table.at["amount", "Status"] == "kept"
+
+
+def test_identical_frames_show_no_shift():
+    before, _ = _frames()
+    table = compare_snapshots(build_snapshot(before), build_snapshot(before))
+    assert (table["PSI"] == 0).all() and (table["KS"].dropna() == 0).all()
@@ -0,0 +1,39 @@
+import numpy as np
+from scipy.stats import gaussian_kde
+
+from utils.density import bandwidth, binned_kde, display_histogram, fine_histogram
+
+
+def _sample():
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.normal(0, 1, 20_000), rng.normal(6, 0.5, 5_000)])
+
+
+def test_binned_kde_matches_scipy():
+    values = _sample()
+    x, density, h = binned_kde(*fine_histogram(values))
+    reference = gaussian_kde(values)
+    assert np.isclose(h, reference.factor * values.std(ddof=1), rtol=1e-3)
+    inside = (x > values.min()) & (x < values.max())
+    expected = reference(x[inside])
+    assert np.abs(density[inside] - expected).max() < 1e-3 * expected.max()
+    assert np.isclose(np.trapezoid(density, x), 1.0, atol=1e-3)
+
+
+def test_silverman_is_narrower_than_scott_for_this_sample():
+    hist = fine_histogram(_sample())
+    assert bandwidth(*hist, rule="Silverman") < bandwidth(*hist, rule="Scott")
+
+
+def test_display_bins_merge_the_fine_counts():
+    values = _sample()
+    counts, edges = display_histogram(*fine_histogram(values))
+    assert counts.sum() == len(values)
+    assert len(edges) == len(counts) + 1
+    assert np.isclose(edges[0], values.min()) and np.isclose(edges[-1], values.max())
+    assert (counts == np.histogram(values, bins=edges)[0]).sum() >= len(counts) - 2
+
+
+def test_constant_or_empty_columns_have_no_density():
+    assert fine_histogram(np.array([np.nan, np.inf])) is None
+    assert binned_kde(*fine_histogram(np.array([1.0]))) is None
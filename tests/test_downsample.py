@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from utils.downsample import line_plot_points, lttb_indices, minmax_indices
+
+
+def _naive_lttb(x, y, n_out):
+    # Reference implementation with one Python loop per bucket and per point
+    n = len(x)
+    bucket = (n - 2) / (n_out - 2)
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        start, end = int(i * bucket) + 1, int((i + 1) * bucket) + 1
+        next_start, next_end = end, min(int((i + 2) * bucket) + 1, n)
+        if i == n_out - 3:
+            next_start, next_end = n - 1, n
+        mean_x, mean_y = np.mean(x[next_start:next_end]), np.mean(y[next_start:next_end])
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((x[a] - mean_x) * (y[j] - y[a]) - (x[a] - x[j]) * (mean_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    return selected + [n - 1]
+
+
+def test_lttb_keeps_both_ends_and_the_requested_count():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000, dtype="float64")
+    y = np.cumsum(rng.normal(size=10_000))
+    keep = lttb_indices(x, y, 500)
+    assert len(keep) == 500
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert (np.diff(keep) > 0).all()
+
+
+def test_lttb_matches_the_reference_on_even_buckets():
+    rng = np.random.default_rng(1)
+    x = np.sort(rng.uniform(0, 100, 1002))
+    y = np.sin(x) + rng.normal(scale=0.1, size=1002)
+    assert lttb_indices(x, y, 102).tolist() == _naive_lttb(x, y, 102)
+
+
+def test_lttb_returns_everything_when_there_is_nothing_to_drop():
+    assert lttb_indices(np.arange(5.0), np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_minmax_keeps_every_bucket_extreme():
+    rng = np.random.default_rng(2)
+    y = rng.normal(size=10_000)
+    y[1234], y[8765] = 50.0, -50.0
+    keep = minmax_indices(y, 200)
+    assert len(keep) <= 200
+    assert {0, len(y) - 1, 1234, 8765} <= set(keep.tolist())
+    assert y[keep].max() == y.max() and y[keep].min() == y.min()
+
+
+def test_line_plot_points_skip_missing_values_and_follow_the_order_column():
+    df = pd.DataFrame({
+        "value": [3.0, np.nan, 1.0, 2.0],
+        "when": pd.to_datetime(["2024-01-03", "2024-01-01", None, "2024-01-02"]),
+    })
+    points = line_plot_points(df, "value", "when", n_points=10)
+    assert points["y"].tolist() == [2.0, 3.0]
+    assert points["x"].tolist() == list(pd.to_datetime(["2024-01-02", "2024-01-03"]))
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_eda(df, tmp_path, monkeypatch):
+    # The page writes its figures under ./Figures and reads the API key from ./.streamlit
+    (tmp_path / ".streamlit").mkdir()
+    (tmp_path / ".streamlit" / "secrets.toml").write_text('GEMINI_API_KEY = "test"\n')
+    monkeypatch.chdir(tmp_path)
+    at = AppTest.from_file(str(ROOT / "pages" / "2_Eda.py"), default_timeout=120)
+    at.session_state["df"] = df
+    at.run()
+    return at
+
+
+def test_two_categorical_columns_show_their_single_association(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "value": rng.normal(size=500),
+        "city": rng.choice(["A", "B", "C"], 500),
+        "segment": rng.choice(["x", "y"], 500),
+    })
+    at = _run_eda(df, tmp_path, monkeypatch)
+    assert not at.exception
+    assert at.dataframe
+    assert not [slider for slider in at.slider if slider.key == "association_top_k"]
+
+
+def test_all_pairs_with_two_numeric_columns(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=500), "y": rng.normal(size=500)})
+    at = _run_eda(df, tmp_path, monkeypatch)
+    at.selectbox(key="bivariate_plot_type").set_value("All Pairs").run()
+    assert not at.exception
+    assert any(expander.label == "📋 All 1 pairs" for expander in at.expander)
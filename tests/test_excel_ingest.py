@@ -0,0 +1,44 @@
+import os
+import stat
+
+import pandas as pd
+from openpyxl import Workbook
+
+from utils import excel_ingest
+
+
+def test_trailing_columns_with_blank_headers_are_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(excel_ingest, "CACHE_DIR", str(tmp_path / "cache"))
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "two"
+    sheet.append(["a", None, "c", None])
+    sheet.append([1, 5, 3, None, 9])
+    sheet.append([2, None, 4])
+    path = str(tmp_path / "book.xlsx")
+    workbook.save(path)
+
+    expected = pd.read_excel(path, sheet_name="two", engine="openpyxl")
+    assert excel_ingest.read_sheet_header(path, "two") == list(expected.columns)
+    df = excel_ingest.read_excel_cached(path, "two")
+    assert list(df.columns) == list(expected.columns)
+    assert df["Unnamed: 4"].tolist()[0] == 9
+
+
+def test_mixed_type_sheets_are_not_cached(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(excel_ingest, "CACHE_DIR", str(cache))
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "mixed"
+    sheet.append(["code", "n"])
+    sheet.append([1, 1])
+    sheet.append(["A7", 2])
+    path = str(tmp_path / "book.xlsx")
+    workbook.save(path)
+
+    for _ in range(2):
+        df = excel_ingest.read_excel_cached(path, "mixed")
+        assert df["code"].tolist() == [1, "A7"]
+    assert os.listdir(cache) == []
+    assert stat.S_IMODE(os.stat(cache).st_mode) == 0o700
@@ -0,0 +1,33 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.export import export_dataset
+
+
+@pytest.mark.parametrize("fmt, reader", [("Parquet", pd.read_parquet), ("Feather", pd.read_feather)])
+def test_mixed_type_columns_export_as_text(fmt, reader):
+    # A numeric column filled with a constant typed into the UI holds floats and a string
+    df = pd.DataFrame({"amount": pd.Series([1.5, np.nan, 3.0], dtype=object).fillna("0"), "label": ["a", None, "c"]})
+    path, _, _ = export_dataset(df, fmt, "zstd", chunk_rows=2)
+    try:
+        back = reader(path)
+    finally:
+        os.remove(path)
+    assert back["amount"].tolist() == ["1.5", "0", "3.0"]
+    assert back["label"].isna().tolist() == [False, True, False]
+
+
+@pytest.mark.parametrize("fmt, reader", [("Parquet", pd.read_parquet), ("Feather", pd.read_feather)])
+def test_mixed_type_column_with_integer_name(fmt, reader):
+    df = pd.DataFrame({0: [1, "a", None], 1: [1, 2, 3]})
+    path, _, _ = export_dataset(df, fmt, None)
+    try:
+        back = reader(path)
+    finally:
+        os.remove(path)
+    assert back.iloc[:, 0].iloc[:2].tolist() == ["1", "a"]
+    assert back.iloc[:, 0].isna().tolist() == [False, False, True]
+    assert back.iloc[:, 1].tolist() == [1, 2, 3]
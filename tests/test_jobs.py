@@ -0,0 +1,82 @@
+import threading
+import time
+
+import streamlit as st
+
+from utils.jobs import JobRunner
+
+
+def _wait(job, timeout=5):
+    deadline = time.time() + timeout
+    while job.active and time.time() < deadline:
+        time.sleep(0.01)
+    assert not job.active
+
+
+def test_results_are_applied_once_on_the_script_thread():
+    runner = JobRunner()
+    applied = []
+    job = runner.submit("square", lambda x: x * x, 7, key="square", on_success=applied.append)
+    _wait(job)
+    assert runner.has_unapplied()
+    assert [j.label for j in runner.apply_finished()] == ["square"]
+    assert runner.apply_finished() == []
+    assert applied == [49] and job.result is None
+
+
+def test_an_active_job_with_the_same_key_is_reused():
+    runner = JobRunner()
+    release = threading.Event()
+    first = runner.submit("wait", release.wait, 5, key="same")
+    assert runner.submit("wait", release.wait, 5, key="same") is first
+    release.set()
+    _wait(first)
+
+
+def test_cancelling_stops_at_the_next_progress_report():
+    runner = JobRunner()
+    started = threading.Event()
+
+    def work(progress):
+        started.set()
+        while True:
+            progress(0.5, "working")
+            time.sleep(0.01)
+
+    job = runner.submit("loop", work, with_progress=True)
+    started.wait(5)
+    job.cancel()
+    _wait(job)
+    assert job.status == "cancelled"
+
+
+def test_results_for_a_replaced_dataset_are_discarded():
+    runner = JobRunner()
+    st.session_state.dataset_version = 1
+    applied = []
+    job = runner.submit("clean", lambda: "new frame", replaces_data=True, on_success=applied.append)
+    _wait(job)
+    st.session_state.dataset_version = 2
+    try:
+        runner.apply_finished()
+    finally:
+        del st.session_state["dataset_version"]
+    assert job.status == "stale" and applied == []
+
+
+def test_failures_are_reported_on_the_job():
+    runner = JobRunner()
+    job = runner.submit("fail", lambda: 1 / 0)
+    _wait(job)
+    assert job.status == "failed" and "ZeroDivisionError" in job.error
+
+
+def test_background_jobs_do_not_hold_up_other_jobs():
+    runner = JobRunner()
+    release = threading.Event()
+    background = runner.submit("warm up", release.wait, 5, background=True)
+    job = runner.submit("quick", lambda: 1)
+    _wait(job, timeout=1)
+    assert background.active
+    release.set()
+    _wait(background)
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from utils.memory_optimizer import analyze_memory, apply_memory_plan
+
+
+def test_signed_columns_stay_signed():
+    df = pd.DataFrame({
+        "count": np.arange(100, dtype=np.int64),
+        "whole": np.arange(100, dtype=np.float64),
+        "unsigned": np.arange(100, dtype=np.uint64),
+    })
+    optimized, _ = apply_memory_plan(df, analyze_memory(df))
+    assert optimized["count"].dtype == np.int8
+    assert optimized["whole"].dtype == np.int32
+    assert optimized["unsigned"].dtype == np.uint8
+    assert (optimized["count"] - 1).min() == -1
+
+
+def test_whole_number_floats_keep_int32_headroom():
+    df = pd.DataFrame({"score": np.full(1000, 100.0)})
+    plan = analyze_memory(df)
+    assert plan["Proposed Dtype"].iloc[0] == "int32"
+    assert "integer" in plan["Reason"].iloc[0]
+    optimized, _ = apply_memory_plan(df, plan)
+    assert optimized["score"].sum() == 100_000
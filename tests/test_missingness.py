@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from utils import missingness
+from utils.missingness import build_null_mask, co_missing, missing_counts, missing_patterns, rows_missing_any
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(1001, 6)), columns=list("abcdef"))
+    for col, rate in zip("abcd", (0.1, 0.3, 0.5, 0.02)):
+        df.loc[rng.random(1001) < rate, col] = np.nan
+    df.loc[::5, ["a", "b"]] = np.nan
+    return df
+
+
+def test_counts_match_isna():
+    df = _frame()
+    mask = build_null_mask(df)
+    isna = df.isna()
+    gappy = isna.columns[isna.any()]
+    assert list(mask["columns"]) == list(gappy)
+    pd.testing.assert_series_equal(missing_counts(mask), isna[gappy].sum())
+    pd.testing.assert_frame_equal(co_missing(mask), isna[gappy].astype(int).T @ isna[gappy].astype(int))
+    assert rows_missing_any(mask) == isna.any(axis=1).sum()
+    assert rows_missing_any(mask, ["a", "c"]) == isna[["a", "c"]].any(axis=1).sum()
+
+
+def test_patterns_match_grouping_rows_by_their_missing_columns():
+    df = _frame()
+    isna = df.isna()
+    labels = isna.apply(lambda row: ", ".join(row.index[row]), axis=1)
+    expected = labels[labels != ""].value_counts()
+
+    patterns = missing_patterns(build_null_mask(df), top=len(expected))
+    assert dict(zip(patterns["Missing Columns"], patterns["Rows"])) == expected.to_dict()
+
+
+def test_popcount_matches_counting_bits():
+    words = np.random.default_rng(0).integers(0, 2 ** 63, size=(3, 5), dtype=np.uint64)
+    expected = [[bin(int(word)).count("1") for word in row] for row in words]
+    assert missingness._popcount(words).tolist() == expected
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from utils import paging
+
+
+def _column_widgets_app():
+    # AppTest runs only this function's source, so it imports what it needs
+    import pandas as pd
+    import streamlit as st
+
+    from utils.paging import column_multiselect, column_selectbox, paged_column_table
+
+    columns = [f"c{i}" for i in range(300)]
+    st.session_state.picked = column_selectbox("Pick", columns, key="pick")
+    st.session_state.many = column_multiselect("Many", columns, key="many", default=columns[:2])
+
+    def build(page):
+        st.session_state.built = list(page.columns)
+        return page.head()
+
+    paged_column_table(pd.DataFrame(0, index=range(3), columns=columns), build, key="table")
+
+
+def test_wide_pickers_only_send_the_visible_page_and_keep_choices_across_pages():
+    at = AppTest.from_function(_column_widgets_app, default_timeout=30)
+    at.run()
+    assert len(at.selectbox(key="pick_choice").options) == 50
+    assert len(at.session_state["built"]) == 50
+
+    at.selectbox(key="pick_choice").set_value("c10").run()
+    at.number_input(key="pick_page").set_value(3).run()
+    assert at.session_state["picked"] == "c10"
+    assert at.selectbox(key="pick_choice").options[0] == "c10"
+
+    at.number_input(key="many_page").set_value(2).run()
+    at.multiselect(key="many_choice").select("c60").run()
+    at.number_input(key="many_page").set_value(1).run()
+    assert at.session_state["many"] == ["c0", "c1", "c60"]
+    assert at.multiselect(key="many_choice").value == ["c0", "c1"]
+
+
+def test_column_search_filters_the_pages():
+    at = AppTest.from_function(_column_widgets_app, default_timeout=30)
+    at.run()
+    at.text_input(key="table_search").input("c29").run()
+    assert at.session_state["built"] == ["c29"] + [f"c{i}" for i in range(290, 300)]
+
+
+def _rows():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "amount": rng.normal(size=500),
+        "city": rng.choice(["A", "B", "C"], 500),
+    }, index=rng.permutation(500) + 1000)
+    df.loc[df.index[::9], "amount"] = np.nan
+    return df
+
+
+def test_row_lookups_match_pandas():
+    df = _rows()
+    order = paging._sort_order(df, "amount", False)
+    expected = df.reset_index(drop=True)["amount"].sort_values(ascending=False, kind="stable", na_position="last")
+    assert order.tolist() == expected.index.tolist()
+
+    in_range = np.sort(paging._range_positions(df, "amount", -0.5, 1.0))
+    mask = df["amount"].between(-0.5, 1.0).to_numpy()
+    assert in_range.tolist() == np.flatnonzero(mask).tolist()
+
+    positions = paging._value_positions(df, "city", "B")
+    assert positions.tolist() == np.flatnonzero(df["city"].to_numpy() == "B").tolist()
+
+
+def _rows_app():
+    import numpy as np
+    import pandas as pd
+    import streamlit as st
+
+    from utils.paging import paged_dataframe
+
+    df = pd.DataFrame({"amount": np.arange(500.0)})
+    paged_dataframe(df, key="rows", mask=(df["amount"] % 2 == 0).to_numpy())
+
+
+def test_viewer_sends_one_page_of_the_masked_rows():
+    at = AppTest.from_function(_rows_app, default_timeout=30)
+    at.run()
+    page = at.dataframe[0].value
+    assert len(page) == 50
+    assert page["amount"].tolist() == [float(v) for v in range(0, 100, 2)]
+
+    at.selectbox(key="rows_sort_col").set_value("amount")
+    at.radio(key="rows_sort_dir").set_value("Descending")
+    at.number_input(key="rows_page").set_value(5).run()
+    assert at.dataframe[0].value["amount"].tolist() == [float(v) for v in range(98, -1, -2)]
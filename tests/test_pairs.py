@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from utils.pairs import bin_codes, correlation_matrix, pair_density, pair_statistics, top_pairs
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=3000)
+    df = pd.DataFrame({
+        "a": base * 3 + 1e6,
+        "b": base + rng.normal(scale=0.5, size=3000),
+        "c": rng.normal(size=3000),
+        "d": rng.integers(0, 10, 3000),
+    })
+    df.loc[::7, "a"] = np.nan
+    df.loc[::11, "b"] = np.nan
+    return df
+
+
+def test_correlations_match_dataframe_corr_across_chunks():
+    df = _frame()
+    columns = list(df.columns)
+    stats = pair_statistics(df, columns, chunk_rows=256)
+    pd.testing.assert_frame_equal(correlation_matrix(stats, columns), df.corr(), rtol=1e-10)
+
+
+def test_trend_and_overlap_match_a_fit_per_pair():
+    df = _frame()
+    stats = pair_statistics(df, list(df.columns), chunk_rows=1000)
+    for row in stats.itertuples():
+        both = df[[row.x, row.y]].dropna()
+        slope, intercept = np.polyfit(both[row.x], both[row.y], 1)
+        assert row.n == len(both)
+        assert np.isclose(row.slope, slope, rtol=1e-8)
+        assert np.isclose(row.intercept, intercept, rtol=1e-8, atol=1e-6)
+
+
+def test_top_pairs_rank_by_absolute_correlation():
+    stats = pair_statistics(_frame(), ["a", "b", "c", "d"])
+    best = top_pairs(stats, 2)
+    assert best[["x", "y"]].iloc[0].tolist() == ["a", "b"]
+    assert best["r"].abs().is_monotonic_decreasing
+
+
+def test_pair_density_matches_histogram2d():
+    df = _frame()
+    codes = bin_codes(df, ["a", "c"], bins=8)
+    both = df[["a", "c"]].dropna()
+    expected, _, _ = np.histogram2d(both["c"], both["a"], bins=8, range=[codes["c"][1:], codes["a"][1:]])
+    assert (pair_density(codes, "a", "c", bins=8) == expected).all()
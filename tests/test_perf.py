@@ -0,0 +1,43 @@
+import json
+import time
+
+from utils import perf
+
+
+def test_runs_record_nested_spans_and_append_to_the_log(tmp_path, monkeypatch):
+    log = tmp_path / "perf.jsonl"
+    monkeypatch.setattr(perf, "PERF_LOG_PATH", str(log))
+
+    @perf.timed(name="outer")
+    def outer():
+        with perf.span("inner"):
+            time.sleep(0.01)
+
+    perf.start_run("Test")
+    outer()
+    perf.finish_run()
+
+    record = json.loads(log.read_text().splitlines()[-1])
+    assert record["page"] == "Test" and not record["interrupted"]
+    spans = {span["name"]: span for span in record["spans"]}
+    assert spans["outer"]["depth"] == 0 and spans["inner"]["depth"] == 1
+    assert spans["outer"]["ms"] >= spans["inner"]["ms"] >= 10
+    assert record["total_ms"] >= spans["outer"]["ms"]
+
+
+def test_spans_outside_a_run_are_no_ops():
+    with perf.span("nothing"):
+        pass
+    assert perf._current_run() is None
+
+
+def test_cache_counters_count_calls_and_misses():
+    @perf.cache_data
+    def square_for_perf_test(x):
+        return x * x
+
+    square_for_perf_test.clear()
+    for x in (2, 2, 3):
+        square_for_perf_test(x)
+    summary = perf.cache_summary().set_index("Function").loc["square_for_perf_test"]
+    assert (summary["Calls"], summary["Misses"]) == (3, 2)
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.profile import carried_profile, describe, get_profile, keep_profile, null_counts, value_counts
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "amount": rng.normal(1e6, 5, 2000),
+        "score": rng.integers(0, 100, 2000),
+        "city": rng.choice(["A", "B", "C"], 2000),
+    })
+    df.loc[::13, "amount"] = np.nan
+    df.loc[::17, "city"] = None
+    return df
+
+
+def _assert_matches_pandas(df):
+    pd.testing.assert_frame_equal(describe(df), df.describe(), check_exact=False, rtol=1e-9)
+    pd.testing.assert_series_equal(null_counts(df), df.isna().sum(), check_names=False)
+    pd.testing.assert_series_equal(value_counts(df, "city"), df["city"].value_counts(), check_like=True)
+
+
+def test_profile_matches_pandas():
+    st.session_state.pop("_profile_cache", None)
+    _assert_matches_pandas(_frame())
+
+
+def test_profile_carried_across_row_drops_and_changed_columns_matches_a_rebuild():
+    st.session_state.pop("_profile_cache", None)
+    df = _frame()
+    get_profile(df)
+    value_counts(df, "city")
+
+    updated = df[df["score"] > 20].copy()
+    updated["score"] = updated["score"] * 2
+    profile = carried_profile(updated, ["score"])
+    assert profile is not None
+    keep_profile(updated, profile)
+    _assert_matches_pandas(updated)
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils import session_store
+from utils.frame_refs import DatasetRef, same_frame
+
+
+def test_spilled_frames_of_one_version_share_a_reference(tmp_path, monkeypatch):
+    # Over budget, so every full read assembles a new DataFrame
+    monkeypatch.setattr(session_store, "SESSION_BUDGET_BYTES", 1024)
+    store = session_store.SessionDataStore("test", str(tmp_path))
+    rng = np.random.default_rng(0)
+    store.put(pd.DataFrame({"x": rng.normal(size=1000), "label": rng.choice(["a", "b"], 1000)}))
+
+    first, second = store.frame(), store.frame()
+    assert first is not second
+    ref = DatasetRef(store, store.version)
+    assert same_frame(ref, first) and same_frame(ref, second)
+    assert not same_frame(ref, first.copy())
+    pd.testing.assert_frame_equal(ref(), first)
+
+    store.put(first.iloc[:10])
+    assert ref() is None
+    assert not same_frame(ref, store.frame())
+
+
+def test_idle_sessions_are_spilled_not_dropped(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_store, "GLOBAL_BUDGET_BYTES", 0)
+    monkeypatch.setattr(session_store, "SESSION_IDLE_SECONDS", 0)
+    idle = session_store.SessionDataStore("idle", str(tmp_path))
+    active = session_store.SessionDataStore("active", str(tmp_path))
+    df = pd.DataFrame({"x": np.arange(100.0)})
+    for store in (idle, active):
+        store.put(df)
+        session_store._touch(store)
+
+    session_store._enforce_global_budget(active)
+    assert idle.spilled
+    pd.testing.assert_frame_equal(idle.frame(), df)
+
+
+def test_spill_files_go_away_with_the_store(tmp_path):
+    store = session_store.SessionDataStore("gone", str(tmp_path))
+    store.put(pd.DataFrame({"x": np.arange(100.0)}))
+    store.spill()
+    directory = Path(store.directory)
+    assert directory.exists()
+    del store
+    assert not directory.exists()
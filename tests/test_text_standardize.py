@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from utils.text_standardize import standardize_series, suggest_merges
+
+OPERATIONS = ["Trim whitespace", "Case fold"]
+
+
+def _naive(series, operations):
+    def transform(value):
+        if not isinstance(value, str):
+            return value
+        value = value.strip() if "Trim whitespace" in operations else value
+        return value.casefold() if "Case fold" in operations else value
+    return pd.Series([transform(value) for value in series], index=series.index, dtype=object)
+
+
+def test_matches_applying_the_operations_row_by_row():
+    rng = np.random.default_rng(0)
+    series = pd.Series(rng.choice(np.array([" New York", "new york ", "Boston", np.nan], dtype=object), 1000), dtype=object)
+    result = standardize_series(series, OPERATIONS)
+    pd.testing.assert_series_equal(result, _naive(series, OPERATIONS))
+
+
+def test_categorical_labels_merge_after_the_operations():
+    series = pd.Series([" A", "a", None, "B "], dtype="category")
+    result = standardize_series(series, OPERATIONS)
+    assert list(result.cat.categories) == ["a", "b"]
+    assert result.isna().tolist() == [False, False, True, False]
+    assert result.astype(object).where(result.notna(), None).tolist() == ["a", "a", None, "b"]
+
+
+def test_all_missing_categorical_without_categories():
+    series = pd.Series([np.nan, np.nan], dtype="category")
+    result = standardize_series(series, OPERATIONS)
+    assert result.isna().all()
+    assert len(result.cat.categories) == 0
+
+
+def test_suggest_merges_proposes_the_most_frequent_spelling():
+    series = pd.Series(["New York"] * 3 + ["new  york", "York, New"])
+    table = suggest_merges(series, ["Collapse whitespace"])
+    assert set(table["Value"]) == {"new york", "York, New"}
+    assert set(table["Replace With"]) == {"New York"}
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+# Columns with more levels than this are skipped; their tables would be mostly empty cells
+MAX_LEVELS = 200
+ASSOCIATION_MEASURES = ["Cramér's V", "Theil's U", "Mutual information"]
+
+
+def categorical_columns(df):
+    """Non-numeric, non-datetime columns, plus booleans."""
+    return [
+        col for col in df.columns
+        if pd.api.types.is_bool_dtype(df[col])
+        or not (pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_datetime64_any_dtype(df[col]))
+    ]
+
+
+def factorize_columns(df, columns, max_levels=MAX_LEVELS):
+    """Integer codes (-1 for missing) and level counts for each column, computed once.
+
+    Returns (codes, skipped): columns above max_levels go to skipped.
+    """
+    codes, skipped = {}, []
+    for col in columns:
+        values, levels = pd.factorize(df[col], use_na_sentinel=True)
+        if len(levels) > max_levels:
+            skipped.append(col)
+        elif len(levels) > 0:
+            codes[col] = (values.astype(np.int64), len(levels))
+    return codes, skipped
+
+
+def contingency(a, b):
+    """Cross-tabulation of two factorized columns over rows where both are present."""
+    (codes_a, levels_a), (codes_b, levels_b) = a, b
+    both = (codes_a >= 0) & (codes_b >= 0)
+    table = np.bincount(codes_a[both] * levels_b + codes_b[both], minlength=levels_a * levels_b)
+    return table.reshape(levels_a, levels_b)
+
+
+def _entropy(p):
+    p = p[p > 0]
+    return float(-(p * np.log(p)).sum())
+
+
+def table_measures(table):
+    """(Cramér's V, mutual information in nats, H(rows), H(columns)) of a contingency table."""
+    n = table.sum()
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    # Levels that never co-occur with a present value of the other column do not count
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    p = table / n
+    p_rows, p_cols = p.sum(axis=1), p.sum(axis=0)
+    expected = np.outer(p_rows, p_cols)
+    chi2 = n * ((p - expected) ** 2 / expected).sum()
+    k = min(table.shape) - 1
+    cramers_v = np.sqrt(chi2 / (n * k)) if k > 0 else 0.0
+    nonzero = p > 0
+    mutual_info = float((p[nonzero] * np.log(p[nonzero] / expected[nonzero])).sum())
+    return cramers_v, max(mutual_info, 0.0), _entropy(p_rows), _entropy(p_cols)
+
+
+def categorical_associations(codes):
+    """Cramér's V, Theil's U and mutual information for every pair of factorized columns.
+
+    Each pair is one bincount over combined codes. Theil's U is asymmetric:
+    the entry at (x, y) is U(x | y), the share of x's entropy explained by
+    knowing y. Returns a dict of square frames keyed by measure name.
+    """
+    names = list(codes)
+    size = len(names)
+    cramers_v, mutual_info, theils_u = (np.eye(size) for _ in range(3))
+    for i in range(size):
+        for j in range(i + 1, size):
+            v, mi, h_i, h_j = table_measures(contingency(codes[names[i]], codes[names[j]]))
+            cramers_v[i, j] = cramers_v[j, i] = v
+            mutual_info[i, j] = mutual_info[j, i] = mi
+            theils_u[i, j] = mi / h_i if h_i > 0 else 1.0
+            theils_u[j, i] = mi / h_j if h_j > 0 else 1.0
+    for i, name in enumerate(names):
+        # A column's information about itself is its entropy
+        own = codes[name][0]
+        mutual_info[i, i] = _entropy(np.bincount(own[own >= 0]) / max((own >= 0).sum(), 1))
+    return {
+        "Cramér's V": pd.DataFrame(cramers_v, index=names, columns=names),
+        "Theil's U": pd.DataFrame(theils_u, index=names, columns=names),
+        "Mutual information": pd.DataFrame(mutual_info, index=names, columns=names),
+    }
+
+
+def correlation_ratios(df, numeric_columns, codes):
+    """Correlation ratio (eta) of each numeric column against each factorized column.
+
+    eta² is the share of the numeric column's variance explained by the
+    category means; group sums come from weighted bincounts.
+    """
+    result = pd.DataFrame(np.nan, index=list(numeric_columns), columns=list(codes))
+    for num_col in numeric_columns:
+        y = df[num_col].to_numpy(dtype="float64", na_value=np.nan)
+        finite = np.isfinite(y)
+        for cat_col, (cat_codes, levels) in codes.items():
+            both = finite & (cat_codes >= 0)
+            if both.sum() < 2:
+                continue
+            group, values = cat_codes[both], y[both]
+            counts = np.bincount(group, minlength=levels)
+            sums = np.bincount(group, weights=values, minlength=levels)
+            mean = values.mean()
+            total = ((values - mean) ** 2).sum()
+            present = counts > 0
+            between = (counts[present] * (sums[present] / counts[present] - mean) ** 2).sum()
+            result.at[num_col, cat_col] = np.sqrt(between / total) if total > 0 else 0.0
+    return result
+
+
+def association_report(df, numeric_columns, max_levels=MAX_LEVELS):
+    """Factorizes the categorical columns once and derives every association measure from the codes."""
+    codes, skipped = factorize_columns(df, categorical_columns(df), max_levels)
+    report = categorical_associations(codes)
+    report["Correlation ratio"] = correlation_ratios(df, numeric_columns, codes)
+    report["skipped"] = skipped
+    return report
+
+
+def top_associations(matrix, k, symmetric=True):
+    """The k strongest off-diagonal pairs of an association matrix, strongest first."""
+    values = matrix.to_numpy()
+    size = len(matrix)
+    if symmetric:
+        i, j = np.triu_indices(size, k=1)
+    else:
+        i, j = np.nonzero(~np.eye(size, dtype=bool))
+    pairs = pd.DataFrame({"x": matrix.index[i], "y": matrix.columns[j], "value": values[i, j]})
+    return pairs.sort_values("value", ascending=False, na_position="last").head(k).reset_index(drop=True)
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+
+from utils.density import fine_histogram
+from utils.profile import build_profile, get_profile, histogram, value_counts
+
+# Category sketches keep this many of the most frequent values
+SKETCH_TOP = 1000
+PSI_BINS = 10
+PSI_FLOOR = 1e-4
+
+
+def _category_sketch(counts):
+    return {"top": counts.head(SKETCH_TOP), "distinct": len(counts), "total": int(counts.sum())}
+
+
+def _sketch(profile, histogram_of, counts_of, columns):
+    stats = profile["stats"]
+    histograms, categories = {}, {}
+    for col in columns:
+        if stats.at[col, "numeric"]:
+            histograms[col] = histogram_of(col)
+        else:
+            categories[col] = _category_sketch(counts_of(col))
+    return {
+        "rows": profile["rows"],
+        "columns": list(columns),
+        "dtypes": stats["dtype"].to_dict(),
+        "nulls": stats["nulls"].astype("int64").to_dict(),
+        "histograms": histograms,
+        "categories": categories,
+    }
+
+
+def build_snapshot(df):
+    """Profile stats plus distribution sketches of every column; pure, so it can run in a background job."""
+    return _sketch(
+        build_profile(df),
+        lambda col: fine_histogram(df[col].to_numpy(dtype="float64", na_value=np.nan)),
+        lambda col: df[col].value_counts(),
+        df.columns
+    )
+
+
+def snapshot_from_profile(profile, counts):
+    """Snapshot from a fresh profile with every histogram filled in and the value counts of its other columns."""
+    return _sketch(profile, profile["histograms"].__getitem__, counts.__getitem__, profile["stats"].index)
+
+
+def current_snapshot(df):
+    """Snapshot of the working frame, assembled from its cached profile, histograms and value counts."""
+    return _sketch(get_profile(df), lambda col: histogram(df, col), lambda col: value_counts(df, col), df.columns)
+
+
+def _cdf(hist, points):
+    """Empirical CDF of a fine histogram at the given points, linear within bins."""
+    counts, edges = hist
+    cumulative = np.concatenate([[0], np.cumsum(counts)]) / counts.sum()
+    return np.interp(points, edges, cumulative, left=0.0, right=1.0)
+
+
+def psi(expected, actual):
+    """Population stability index between two sets of bin fractions."""
+    expected = np.clip(expected, PSI_FLOOR, None)
+    actual = np.clip(actual, PSI_FLOOR, None)
+    return float(((actual - expected) * np.log(actual / expected)).sum())
+
+
+def numeric_shift(before, after, bins=PSI_BINS):
+    """(PSI over the baseline's deciles, KS statistic) from two fine histograms."""
+    counts, edges = before
+    cumulative = np.concatenate([[0], np.cumsum(counts)]) / counts.sum()
+    # Baseline quantiles by inverting its CDF; repeated cuts (point masses) collapse
+    cuts = np.unique(np.interp(np.linspace(0, 1, bins + 1)[1:-1], cumulative, edges))
+    grid = np.concatenate([[-np.inf], cuts, [np.inf]])
+    expected = np.diff(_cdf(before, grid))
+    actual = np.diff(_cdf(after, grid))
+    points = np.union1d(before[1], after[1])
+    ks = float(np.abs(_cdf(before, points) - _cdf(after, points)).max())
+    return psi(expected, actual), ks
+
+
+def category_shift(before, after):
+    """(PSI over the union of top categories plus the rest, new categories, lost categories).
+
+    New and lost counts are exact only when both sketches hold every category;
+    otherwise they are None.
+    """
+    top_before, top_after = before["top"], after["top"]
+    labels = top_before.index.union(top_after.index, sort=False)
+    expected = top_before.reindex(labels, fill_value=0).to_numpy(dtype="float64")
+    actual = top_after.reindex(labels, fill_value=0).to_numpy(dtype="float64")
+    expected = np.append(expected, before["total"] - expected.sum()) / max(before["total"], 1)
+    actual = np.append(actual, after["total"] - actual.sum()) / max(after["total"], 1)
+    complete = before["distinct"] <= SKETCH_TOP and after["distinct"] <= SKETCH_TOP
+    new = len(top_after.index.difference(top_before.index)) if complete else None
+    lost = len(top_before.index.difference(top_after.index)) if complete else None
+    return psi(expected, actual), new, lost
+
+
+def compare_snapshots(before, after):
+    """Per-column differences between two snapshots; one row per column present in either."""
+    rows = []
+    columns = list(dict.fromkeys(before["columns"] + after["columns"]))
+    for col in columns:
+        in_before, in_after = col in before["dtypes"], col in after["dtypes"]
+        row = {
+            "Column": str(col),
+            "Status": "kept" if in_before and in_after else "removed" if in_before else "added",
+            "Dtype": before["dtypes"].get(col) if not in_after else after["dtypes"][col],
+            "Nulls Before": before["nulls"].get(col, np.nan),
+            "Nulls After": after["nulls"].get(col, np.nan),
+            "PSI": np.nan,
+            "KS": np.nan,
+            "Distinct Before": None,
+            "Distinct After": None,
+            "New Categories": None,
+            "Lost Categories": None,
+        }
+        if in_before and in_after:
+            if before["dtypes"][col] != after["dtypes"][col]:
+                row["Dtype"] = f"{before['dtypes'][col]} → {after['dtypes'][col]}"
+            hist_before, hist_after = before["histograms"].get(col), after["histograms"].get(col)
+            cats_before, cats_after = before["categories"].get(col), after["categories"].get(col)
+            if hist_before is not None and hist_after is not None:
+                row["PSI"], row["KS"] = numeric_shift(hist_before, hist_after)
+            elif cats_before is not None and cats_after is not None and cats_before["total"] and cats_after["total"]:
+                row["PSI"], row["New Categories"], row["Lost Categories"] = category_shift(cats_before, cats_after)
+                row["Distinct Before"], row["Distinct After"] = cats_before["distinct"], cats_after["distinct"]
+        rows.append(row)
+
+    table = pd.DataFrame(rows)
+    table["Null Change"] = table["Nulls After"] - table["Nulls Before"]
+    return table
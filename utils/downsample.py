@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+# Roughly two points per horizontal pixel of a full-width plot
+LINE_PLOT_POINTS = 2000
+DOWNSAMPLE_METHODS = ["LTTB", "Min/Max per bucket"]
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: positions of the n_out points that best keep the shape of (x, y).
+
+    x must be sorted. The first and last points are always kept; every other
+    bucket contributes the point forming the largest triangle with the point
+    kept from the previous bucket and the mean of the next one.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Means of each bucket, with the last point acting as the bucket after the last
+    starts = np.append(edges[:-1], n - 1)
+    lengths = np.diff(np.append(starts, n))
+    mean_x = np.add.reduceat(x, starts) / lengths
+    mean_y = np.add.reduceat(y, starts) / lengths
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - mean_x[i + 1]) * (y[start:end] - ay) - (ax - x[start:end]) * (mean_y[i + 1] - ay))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """Positions of the minimum and maximum of equal-count buckets, plus both end points.
+
+    Cheaper than LTTB and guarantees that every spike survives.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    size = -(-n // ((n_out - 2) // 2))
+    rows = -(-n // size)
+    # Pad with the last value; argmin/argmax return the first occurrence, which is the real one
+    padded = np.empty(rows * size, dtype=y.dtype)
+    padded[:n] = y
+    padded[n:] = y[-1]
+    grid = padded.reshape(rows, size)
+    offsets = np.arange(rows) * size
+    keep = np.concatenate([[0, n - 1], offsets + grid.argmin(axis=1), offsets + grid.argmax(axis=1)])
+    return np.unique(keep)
+
+
+def line_plot_points(df, col, order_col=None, method="LTTB", n_points=LINE_PLOT_POINTS):
+    """Reduces the full column to at most n_points rows for a line plot.
+
+    Rows are taken in order of order_col (row order if None); rows missing
+    either value are skipped. Returns a frame with "x" and "y" columns.
+    """
+    y = df[col].to_numpy(dtype="float64", na_value=np.nan)
+    x_values = pd.Series(np.arange(len(df))) if order_col is None else df[order_col].reset_index(drop=True)
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x = pd.DatetimeIndex(x_values).asi8.astype("float64")
+        x[x_values.isna().to_numpy()] = np.nan
+    else:
+        x = x_values.to_numpy(dtype="float64", na_value=np.nan)
+
+    positions = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+    x, y = x[positions], y[positions]
+    if len(x) > 1 and not (np.diff(x) >= 0).all():
+        order = np.argsort(x, kind="stable")
+        x, y, positions = x[order], y[order], positions[order]
+
+    if method == "LTTB":
+        keep = lttb_indices(x, y, n_points)
+    else:
+        keep = minmax_indices(y, n_points)
+    # Only the kept rows go back to the original (possibly datetime) values
+    return pd.DataFrame({"x": x_values.iloc[positions[keep]].to_numpy(), "y": y[keep]})
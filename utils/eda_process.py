@@ -6,9 +6,38 @@ import os
 import google.generativeai as genai
 from PIL import Image
 from fpdf import FPDF
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from utils.paging import column_selectbox, paged_column_table
+from utils.perf import cache_data, span, timed
+from utils.jobs import find_job, submit_job
+from utils.frame_refs import frame_cached
+from utils.profile import describe, histogram, null_counts, value_counts
+from utils.density import BANDWIDTH_RULES, binned_kde, display_histogram, fine_histogram
+from utils.pairs import (
+    THUMBNAIL_PIXELS,
+    bivariate_columns,
+    correlation_matrix,
+    pair_statistics,
+    render_thumbnails,
+    top_pairs
+)
+from utils.associations import (
+    ASSOCIATION_MEASURES,
+    MAX_LEVELS,
+    association_report,
+    categorical_columns,
+    top_associations
+)
+from utils.downsample import DOWNSAMPLE_METHODS, LINE_PLOT_POINTS, line_plot_points
+
+# Bar and pie charts draw at most this many categories plus an "Other" bucket
+TOP_N_CATEGORIES = 10
+OTHER_LABEL = "Other"
+ID_MIN_DISTINCT = 50
+ID_DISTINCT_RATIO = 0.9
 
 
 
@@ -162,7 +191,7 @@ if gemini_text_model_name:
 else:
     st.error("❌ No compatible text model found. AI analysis will be disabled.")
 
-@st.cache_data
+@cache_data
 def analyze_data_with_gemini(plot_type, data_description):
     """Analyzes data and summary statistics using the Gemini text model."""
     if not gemini_text_model:
@@ -183,7 +212,7 @@ def analyze_data_with_gemini(plot_type, data_description):
     except Exception as e:
         return f"❌ An error occurred while analyzing the data: {e}"
 
-@st.cache_data
+@cache_data
 def generate_overall_eda_summary(df):
     """Generates an overall EDA summary for the entire dataset using Gemini."""
     if not gemini_text_model:
@@ -212,9 +241,75 @@ def generate_overall_eda_summary(df):
     except Exception as e:
         return f"❌ An error occurred while generating overall EDA summary: {e}"
 
-@st.cache_data
-def generate_plot(df_to_plot, col, plot_type):
-    """Generates and returns a plot figure with professional styling."""
+def draw_histogram(ax, counts, edges, kde=None):
+    """Histogram bars with the binned KDE overlaid, scaled to the count axis."""
+    ax.stairs(counts, edges, fill=True, color='#667eea', alpha=0.7)
+    if kde is not None:
+        x, density, _ = kde
+        ax.plot(x, density * counts.sum() * (edges[1] - edges[0]), color='#667eea', linewidth=2)
+    ax.set_ylabel("Count")
+
+
+@cache_data
+def generate_histogram_plot(counts, edges, kde, col):
+    """Histogram figure from display_histogram() bins and a binned_kde() result."""
+    plt.style.use('seaborn-v0_8-whitegrid')
+    fig, ax = plt.subplots(figsize=(10, 6))
+    draw_histogram(ax, counts, edges, kde)
+    ax.set_title(f"Distribution of {col}", fontsize=16, fontweight='bold', pad=20)
+    ax.set_xlabel(col, fontsize=12, fontweight='medium')
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+
+def top_n_counts(counts, top_n=TOP_N_CATEGORIES):
+    """The top_n largest counts, with everything else summed into an "Other" entry."""
+    if len(counts) <= top_n:
+        return counts
+    top = counts.iloc[:top_n]
+    top.index = top.index.astype(object)
+    return pd.concat([top, pd.Series({OTHER_LABEL: counts.iloc[top_n:].sum()})])
+
+
+def looks_like_identifier(counts):
+    """True when almost every non-null value of the column is distinct, like a key or ID."""
+    non_null = counts.sum()
+    return len(counts) > ID_MIN_DISTINCT and len(counts) >= ID_DISTINCT_RATIO * non_null
+
+
+def draw_category_chart(ax, counts, col, plot_type):
+    """Bar or pie chart of already aggregated counts; one artist per entry."""
+    colors = ['#667eea', '#764ba2', '#f093fb', '#f5576c', '#4facfe', '#00f2fe']
+    labels = [str(label) for label in counts.index]
+    if plot_type == 'Bar Chart':
+        bars = ax.bar(range(len(counts)), counts.values, color=colors[:len(counts)])
+        ax.set_xticks(range(len(counts)))
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+        ax.bar_label(bars, labels=[f'{int(height)}' for height in counts.values])
+    elif plot_type == 'Pie Chart':
+        ax.pie(counts, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors[:len(counts)])
+        ax.axis('equal')
+    ax.set_title(f"Distribution of {col}", fontsize=16, fontweight='bold', pad=20)
+
+
+@cache_data
+def generate_category_plot(counts, col, plot_type):
+    """Bar or pie chart from counts already reduced by top_n_counts()."""
+    plt.style.use('seaborn-v0_8-whitegrid')
+    fig, ax = plt.subplots(figsize=(10, 6))
+    draw_category_chart(ax, counts, col, plot_type)
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+
+@cache_data
+def generate_plot(df_to_plot, col, plot_type, top_n=TOP_N_CATEGORIES):
+    """Generates and returns a plot figure with professional styling.
+
+    Line plots are drawn by generate_line_plot() from downsampled points instead.
+    """
     
     plt.style.use('seaborn-v0_8-whitegrid')
     fig, ax = plt.subplots(figsize=(10, 6))
@@ -224,36 +319,15 @@ def generate_plot(df_to_plot, col, plot_type):
     
     if pd.api.types.is_numeric_dtype(df_to_plot[col]):
         if plot_type == 'Histogram':
-            sns.histplot(df_to_plot[col].dropna(), kde=True, ax=ax, color=colors[0], alpha=0.7)
+            hist = fine_histogram(df_to_plot[col].to_numpy(dtype="float64", na_value=np.nan))
+            if hist is not None:
+                draw_histogram(ax, *display_histogram(*hist), binned_kde(*hist))
             ax.set_title(f"Distribution of {col}", fontsize=16, fontweight='bold', pad=20)
         elif plot_type == 'Box Plot':
             sns.boxplot(x=df_to_plot[col].dropna(), ax=ax, color=colors[1])
             ax.set_title(f"Box Plot of {col}", fontsize=16, fontweight='bold', pad=20)
-        elif plot_type == 'Line Plot':
-            df_to_plot[col].plot(ax=ax, color=colors[2], linewidth=2)
-            ax.set_title(f"Line Plot of {col}", fontsize=16, fontweight='bold', pad=20)
     else: 
-        if plot_type == 'Bar Chart':
-            value_counts = df_to_plot[col].value_counts()
-            bars = ax.bar(range(len(value_counts)), value_counts.values, color=colors[:len(value_counts)])
-            ax.set_xticks(range(len(value_counts)))
-            ax.set_xticklabels(value_counts.index, rotation=45, ha='right')
-            ax.set_title(f"Distribution of {col}", fontsize=16, fontweight='bold', pad=20)
-            
-            
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}', ha='center', va='bottom')
-                       
-        elif plot_type == 'Pie Chart':
-            value_counts = df_to_plot[col].value_counts()
-            if len(value_counts) > 10:
-                 value_counts = value_counts.head(10)
-            ax.pie(value_counts, labels=value_counts.index, autopct='%1.1f%%', 
-                  startangle=90, colors=colors[:len(value_counts)])
-            ax.set_title(f"Distribution of {col}", fontsize=16, fontweight='bold', pad=20)
-            ax.axis('equal')
+        draw_category_chart(ax, top_n_counts(df_to_plot[col].value_counts(), top_n), col, plot_type)
 
     
     ax.grid(True, alpha=0.3)
@@ -263,7 +337,34 @@ def generate_plot(df_to_plot, col, plot_type):
     plt.tight_layout()
     return fig
 
-@st.cache_data
+@cache_data
+def generate_line_plot(points, col, order_label=None):
+    """Line plot of the downsampled series returned by line_plot_points()."""
+    plt.style.use('seaborn-v0_8-whitegrid')
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(points["x"], points["y"], color='#f093fb', linewidth=1.5)
+    ax.set_title(f"Line Plot of {col}", fontsize=16, fontweight='bold', pad=20)
+    ax.set_xlabel(order_label or "Row", fontsize=12, fontweight='medium')
+    ax.set_ylabel(col, fontsize=12, fontweight='medium')
+    if pd.api.types.is_datetime64_any_dtype(points["x"]):
+        fig.autofmt_xdate()
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+@cache_data
+def generate_association_heatmap(matrix, measure):
+    """Heatmap of an association matrix; bounded measures use a fixed 0-1 scale."""
+    plt.style.use('seaborn-v0_8-whitegrid')
+    fig, ax = plt.subplots(figsize=(10, 8))
+    bounded = measure != "Mutual information"
+    sns.heatmap(matrix, annot=len(matrix) <= 15, fmt=".2f", cmap="Purples",
+               vmin=0, vmax=1 if bounded else None, ax=ax, cbar_kws={"shrink": .8})
+    ax.set_title(f"{measure} between categorical columns", fontsize=16, fontweight='bold', pad=20)
+    plt.tight_layout()
+    return fig
+
+@cache_data
 def generate_bivariate_plot(df_to_plot, x_axis, y_axis, plot_type):
     """Generates professional bivariate plots."""
     plt.style.use('seaborn-v0_8-whitegrid')
@@ -275,15 +376,27 @@ def generate_bivariate_plot(df_to_plot, x_axis, y_axis, plot_type):
         ax.set_title(f"Relationship between {x_axis} and {y_axis}", 
                     fontsize=16, fontweight='bold', pad=20)
     elif plot_type == 'Correlation Heatmap':
-        corr = df_to_plot.corr(numeric_only=True)
-        sns.heatmap(corr, annot=True, fmt=".2f", cmap="RdBu_r", 
-                   center=0, ax=ax, cbar_kws={"shrink": .8})
-        ax.set_title("Correlation Matrix", fontsize=16, fontweight='bold', pad=20)
+        draw_correlation_heatmap(ax, df_to_plot.corr(numeric_only=True))
     
     ax.grid(True, alpha=0.3)
     plt.tight_layout()
     return fig
 
+def draw_correlation_heatmap(ax, corr):
+    sns.heatmap(corr, annot=True, fmt=".2f", cmap="RdBu_r", 
+               center=0, ax=ax, cbar_kws={"shrink": .8})
+    ax.set_title("Correlation Matrix", fontsize=16, fontweight='bold', pad=20)
+
+@cache_data
+def generate_correlation_heatmap(corr):
+    """Correlation heatmap from a precomputed matrix; hashing it is far cheaper than hashing the frame."""
+    plt.style.use('seaborn-v0_8-whitegrid')
+    fig, ax = plt.subplots(figsize=(10, 6))
+    draw_correlation_heatmap(ax, corr)
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
 class PDF(FPDF):
     def header(self):
         self.set_font('Arial', 'B', 18)
@@ -328,6 +441,7 @@ class PDF(FPDF):
                 self.multi_cell(0, 5, f"Error adding image {os.path.basename(image_path)}: {e}")
                 self.ln(5)
 
+@timed
 def create_pdf_report(df, overall_summary, plot_data_for_report):
     pdf = PDF()
     pdf.alias_nb_pages()
@@ -343,6 +457,7 @@ def create_pdf_report(df, overall_summary, plot_data_for_report):
 
     return pdf.output(dest='S').encode('latin1')
 
+@timed
 def display_dataset_overview(df):
     """Display professional dataset overview with metrics cards (fixed responsive layout)."""
     
@@ -421,13 +536,101 @@ def display_dataset_overview(df):
 
     
     with st.expander("📋 View Data Types", expanded=False):
-        dtype_df = pd.DataFrame({
-            'Column': df.columns,
-            'Data Type': df.dtypes.astype(str),
-            'Non-Null Count': df.count(),
-            'Null Count': df.isnull().sum()
-        })
-        st.dataframe(dtype_df, use_container_width=True)
+        nulls = null_counts(df) if df.columns.is_unique else None
+        paged_column_table(df, lambda page: build_dtype_table(page, nulls), key="dtype_table")
+
+
+def build_dtype_table(df, nulls=None):
+    """Builds the data type table for the given (possibly column-sliced) frame."""
+    nulls = df.isnull().sum() if nulls is None else nulls.reindex(df.columns)
+    return pd.DataFrame({
+        'Column': df.columns,
+        'Data Type': df.dtypes.astype(str),
+        'Non-Null Count': len(df) - nulls,
+        'Null Count': nulls
+    })
+
+
+ROW_ORDER = "(row order)"
+MAX_PAIR_THUMBNAILS = 120
+
+
+def cached_pair_statistics(df, numeric_cols):
+    return frame_cached("pair_statistics", df, tuple(numeric_cols), lambda: pair_statistics(df, numeric_cols))
+
+
+def show_categorical_associations(df, numeric_cols):
+    """Association heatmap and strongest pairs between categorical columns, and against numeric ones."""
+    with span("eda.associations"):
+        report = frame_cached(
+            "association_report", df, tuple(numeric_cols), lambda: association_report(df, numeric_cols)
+        )
+    if report["skipped"]:
+        st.caption(
+            f"Skipped (more than {MAX_LEVELS} distinct values): {', '.join(map(str, report['skipped']))}"
+        )
+
+    names = list(report["Cramér's V"].columns)
+    if len(names) >= 2:
+        measure = st.selectbox(
+            "Association measure", ASSOCIATION_MEASURES, key="association_measure",
+            help="Theil's U is asymmetric: row x, column y shows how much y tells about x"
+        )
+        matrix = report[measure]
+        fig = generate_association_heatmap(matrix, measure)
+        with span("eda.render_plot"):
+            st.pyplot(fig, use_container_width=True)
+        plt.close(fig)
+
+        n_pairs = len(names) * (len(names) - 1) // (1 if measure == "Theil's U" else 2)
+        k = 1
+        if n_pairs > 1:
+            # A slider needs max_value above min_value; a single pair is simply shown
+            k = st.slider("Strongest pairs", min_value=1, max_value=n_pairs, value=min(n_pairs, 10), key="association_top_k")
+        st.dataframe(
+            top_associations(matrix, k, symmetric=measure != "Theil's U").rename(columns={"value": measure}),
+            use_container_width=True, hide_index=True
+        )
+    else:
+        st.info("Need at least 2 categorical columns for an association matrix.")
+
+    ratios = report["Correlation ratio"]
+    if not ratios.empty:
+        st.markdown("**📐 Numeric vs categorical (correlation ratio η)**")
+        pairs = ratios.stack().rename("η").rename_axis(["Numeric", "Categorical"]).reset_index()
+        st.dataframe(
+            pairs.sort_values("η", ascending=False).head(20), use_container_width=True, hide_index=True
+        )
+
+
+def show_all_pairs(df, numeric_cols):
+    """Correlation, trend and density thumbnail for every numeric pair, strongest first."""
+    with span("eda.pair_statistics"):
+        stats = cached_pair_statistics(df, numeric_cols)
+    n_pairs = len(stats)
+    k = 1
+    if n_pairs > 1:
+        k = st.slider(
+            "Pairs to show (strongest correlation first)",
+            min_value=1, max_value=min(n_pairs, MAX_PAIR_THUMBNAILS), value=min(n_pairs, 30),
+            key="all_pairs_k"
+        )
+    pairs = top_pairs(stats, k)
+    with span("eda.pair_thumbnails"):
+        images = frame_cached(
+            "pair_thumbnails", df, tuple(zip(pairs["x"], pairs["y"])), lambda: render_thumbnails(df, pairs)
+        )
+    st.image(
+        images,
+        caption=[f"{row.x} vs {row.y} · r = {row.r:.2f}" for row in pairs.itertuples()],
+        width=THUMBNAIL_PIXELS
+    )
+    with st.expander(f"📋 All {n_pairs:,} pairs"):
+        table = stats.assign(**{"|r|": stats["r"].abs(), "R²": stats["r"] ** 2})
+        st.dataframe(
+            table.sort_values("|r|", ascending=False).drop(columns="|r|"),
+            use_container_width=True, hide_index=True
+        )
 
 
 def eda_section(df):
@@ -474,7 +677,8 @@ def eda_section(df):
             help="Choose visualization theme"
         )
     
-    df_sampled = df.sample(n=sample_size, random_state=42) if len(df) > sample_size else df
+    with span("eda.sampling"):
+        df_sampled = df.sample(n=sample_size, random_state=42) if len(df) > sample_size else df
     
     if sample_size < len(df):
         st.markdown(f"""
@@ -490,7 +694,7 @@ def eda_section(df):
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        selected_col = st.selectbox(
+        selected_col = column_selectbox(
             "🔍 Select column for analysis",
             df.columns,
             key="univariate_col",
@@ -510,6 +714,44 @@ def eda_section(df):
                 ('Bar Chart', 'Pie Chart'),
                 key="categorical_plot_type"
             )
+            top_n = st.slider(
+                "Top categories", min_value=3, max_value=50, value=TOP_N_CATEGORIES, key="top_n_categories",
+                help=f"Remaining values are grouped into \"{OTHER_LABEL}\""
+            )
+
+    if plot_type == 'Line Plot':
+        order_options = [ROW_ORDER] + [
+            col for col in df.columns
+            if col != selected_col and (
+                pd.api.types.is_datetime64_any_dtype(df[col])
+                or pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])
+            )
+        ]
+        col1, col2 = st.columns(2)
+        with col1:
+            order_col = column_selectbox(
+                "🕒 Order by", order_options, key="line_order_col",
+                help="Datetime or numeric column the series is ordered by"
+            )
+        with col2:
+            line_method = st.selectbox(
+                "Downsampling", DOWNSAMPLE_METHODS, key="line_downsample_method",
+                help="LTTB keeps the overall shape; Min/Max keeps every spike"
+            )
+        order_col = None if order_col == ROW_ORDER else order_col
+
+    if plot_type == 'Histogram':
+        col1, col2 = st.columns(2)
+        with col1:
+            bandwidth_rule = st.selectbox(
+                "Density bandwidth rule", BANDWIDTH_RULES, key="kde_bandwidth_rule",
+                help="Rule of thumb for the kernel width of the density curve"
+            )
+        with col2:
+            bandwidth_adjust = st.slider(
+                "Bandwidth adjustment", min_value=0.1, max_value=3.0, value=1.0, step=0.1, key="kde_bandwidth_adjust",
+                help="Multiplies the rule's bandwidth; lower values show more detail"
+            )
 
     plot_key = f"{selected_col}_{plot_type.replace(' ', '_').lower()}"
     fig_path = f"Figures/{plot_key}.png"
@@ -517,36 +759,64 @@ def eda_section(df):
     
     col1, col2 = st.columns(2)
     
-    if pd.api.types.is_numeric_dtype(df[selected_col]):
-        with col1:
-            st.markdown("**📊 Summary Statistics**")
-            stats_df = df[selected_col].describe().round(3)
-            st.dataframe(stats_df, use_container_width=True)
+    with span("eda.column_stats"):
+        if pd.api.types.is_numeric_dtype(df[selected_col]):
+            with col1:
+                st.markdown("**📊 Summary Statistics**")
+                stats_df = describe(df, [selected_col])[selected_col].round(3)
+                st.dataframe(stats_df, use_container_width=True)
         
-        with col2:
-            st.markdown("**🎯 Key Metrics**")
-            missing_pct = (df[selected_col].isnull().sum() / len(df)) * 100
-            st.metric("Missing Values", f"{missing_pct:.1f}%")
-            st.metric("Unique Values", df[selected_col].nunique())
-            if df[selected_col].nunique() < len(df):
-                st.metric("Most Common", df[selected_col].mode().iloc[0] if len(df[selected_col].mode()) > 0 else "N/A")
-    else:
-        with col1:
-            st.markdown("**📊 Value Counts**")
-            value_counts = df[selected_col].value_counts().head(10)
-            st.dataframe(value_counts, use_container_width=True)
+            with col2:
+                st.markdown("**🎯 Key Metrics**")
+                missing_pct = (null_counts(df)[selected_col] / len(df)) * 100
+                st.metric("Missing Values", f"{missing_pct:.1f}%")
+                counts = value_counts(df, selected_col)
+                st.metric("Unique Values", len(counts))
+                if len(counts) < len(df):
+                    st.metric("Most Common", counts.index[0] if len(counts) > 0 else "N/A")
+        else:
+            counts = value_counts(df, selected_col)
+            with col1:
+                st.markdown("**📊 Value Counts**")
+                st.dataframe(counts.head(10), use_container_width=True)
         
-        with col2:
-            st.markdown("**🎯 Key Metrics**")
-            missing_pct = (df[selected_col].isnull().sum() / len(df)) * 100
-            st.metric("Missing Values", f"{missing_pct:.1f}%")
-            st.metric("Unique Values", df[selected_col].nunique())
-            st.metric("Most Common", df[selected_col].mode().iloc[0] if len(df[selected_col].mode()) > 0 else "N/A")
-
-    
-    fig = generate_plot(df_sampled, selected_col, plot_type)
-    fig.savefig(fig_path, dpi=300, bbox_inches='tight')
-    st.pyplot(fig, use_container_width=True)
+            with col2:
+                st.markdown("**🎯 Key Metrics**")
+                missing_pct = (null_counts(df)[selected_col] / len(df)) * 100
+                st.metric("Missing Values", f"{missing_pct:.1f}%")
+                st.metric("Unique Values", len(counts))
+                st.metric("Most Common", counts.index[0] if len(counts) > 0 else "N/A")
+
+    
+    if plot_type == 'Line Plot':
+        # The full column, not the sample, reduced to about one point per pixel
+        with span("eda.downsample"):
+            points = line_plot_points(df, selected_col, order_col, line_method)
+        fig = generate_line_plot(points, selected_col, order_col)
+        st.caption(f"Showing {len(points):,} of {len(df):,} points ({line_method}, up to {LINE_PLOT_POINTS:,}).")
+    elif plot_type == 'Histogram':
+        # One binning pass over the full column, reused by the bars and the FFT density
+        with span("eda.histogram"):
+            hist = histogram(df, selected_col)
+            kde = binned_kde(*hist, bandwidth_rule, bandwidth_adjust) if hist is not None else None
+            counts, edges = display_histogram(*hist) if hist is not None else (np.array([]), np.array([0.0]))
+        fig = generate_histogram_plot(counts, edges, kde, selected_col)
+        if kde is not None:
+            st.caption(f"Density bandwidth: {kde[2]:.4g} ({bandwidth_rule} × {bandwidth_adjust:g}), from all {int(counts.sum()):,} values.")
+    elif plot_type in ('Bar Chart', 'Pie Chart'):
+        # Counts come from the full column and are computed once per dataset version
+        if looks_like_identifier(counts):
+            st.warning(
+                f"⚠️ **{selected_col}** looks like an identifier: {len(counts):,} distinct values in "
+                f"{counts.sum():,} rows. Only the top {top_n} are plotted; a frequency chart says little here."
+            )
+        fig = generate_category_plot(top_n_counts(counts, top_n), selected_col, plot_type)
+    else:
+        fig = generate_plot(df_sampled, selected_col, plot_type)
+    with span("eda.savefig"):
+        fig.savefig(fig_path, dpi=300, bbox_inches='tight')
+    with span("eda.render_plot"):
+        st.pyplot(fig, use_container_width=True)
     plt.close(fig)
 
     
@@ -557,7 +827,7 @@ def eda_section(df):
                 if pd.api.types.is_numeric_dtype(df[selected_col]):
                     data_description = f"Column: {selected_col}\nPlot: {plot_type}\nStats:\n{df[selected_col].describe().to_string()}"
                 else:
-                    data_description = f"Column: {selected_col}\nPlot: {plot_type}\nCounts:\n{df[selected_col].value_counts().to_string()}"
+                    data_description = f"Column: {selected_col}\nPlot: {plot_type}\nCounts:\n{top_n_counts(counts, top_n).to_string()}"
                 
                 ai_text = analyze_data_with_gemini(plot_type, data_description)
                 st.session_state.plot_summaries_and_paths[plot_key] = {'path': fig_path, 'summary': ai_text}
@@ -573,7 +843,7 @@ def eda_section(df):
         st.info(st.session_state.plot_summaries_and_paths[plot_key]['summary'])
 
     
-    numeric_cols = df.select_dtypes(include=["float", "int"]).columns.tolist()
+    numeric_cols = bivariate_columns(df)
 
     if len(numeric_cols) >= 2:
         st.markdown('<div class="section-header"><h3>📊 Bivariate & Correlation Analysis</h3></div>', 
@@ -581,7 +851,7 @@ def eda_section(df):
         
         bivariate_plot_type = st.selectbox(
             "Select analysis type",
-            ('Scatter Plot', 'Correlation Heatmap'),
+            ('Scatter Plot', 'Correlation Heatmap', 'All Pairs'),
             key="bivariate_plot_type",
             help="Choose the type of bivariate analysis"
         )
@@ -592,14 +862,15 @@ def eda_section(df):
         if bivariate_plot_type == 'Scatter Plot':
             col1, col2 = st.columns(2)
             with col1:
-                x_axis = st.selectbox("📊 X-axis variable", numeric_cols, key="x_axis")
+                x_axis = column_selectbox("📊 X-axis variable", numeric_cols, key="x_axis")
             with col2:
                 y_axis_options = [col for col in numeric_cols if col != x_axis]
-                y_axis = st.selectbox("📊 Y-axis variable", y_axis_options, key="y_axis")
+                y_axis = column_selectbox("📊 Y-axis variable", y_axis_options, key="y_axis")
 
             if x_axis and y_axis:
                 
-                correlation = df[[x_axis, y_axis]].corr().iloc[0, 1]
+                with span("eda.pair_correlation"):
+                    correlation = df[[x_axis, y_axis]].corr().iloc[0, 1]
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
@@ -612,8 +883,10 @@ def eda_section(df):
                     st.metric("Direction", corr_direction)
                 
                 fig = generate_bivariate_plot(df_sampled, x_axis, y_axis, bivariate_plot_type)
-                fig.savefig(fig_path, dpi=300, bbox_inches='tight')
-                st.pyplot(fig, use_container_width=True)
+                with span("eda.savefig"):
+                    fig.savefig(fig_path, dpi=300, bbox_inches='tight')
+                with span("eda.render_plot"):
+                    st.pyplot(fig, use_container_width=True)
                 plt.close(fig)
 
                 if st.button("🤖 Generate AI Insights", key="ai_scatter_button"):
@@ -626,20 +899,27 @@ def eda_section(df):
                         st.rerun()
         
         elif bivariate_plot_type == 'Correlation Heatmap':
-            fig = generate_bivariate_plot(df, None, None, bivariate_plot_type)
-            fig.savefig(fig_path, dpi=300, bbox_inches='tight')
-            st.pyplot(fig, use_container_width=True)
+            with span("eda.pair_statistics"):
+                corr = correlation_matrix(cached_pair_statistics(df, numeric_cols), numeric_cols)
+            fig = generate_correlation_heatmap(corr)
+            with span("eda.savefig"):
+                fig.savefig(fig_path, dpi=300, bbox_inches='tight')
+            with span("eda.render_plot"):
+                st.pyplot(fig, use_container_width=True)
             plt.close(fig)
             
             if st.button("🤖 Generate AI Insights", key="ai_correlation_button"):
                 with st.spinner("🔄 Analyzing correlations..."):
-                    corr_description = f"Correlation Matrix:\n{df[numeric_cols].corr().to_string()}"
+                    corr_description = f"Correlation Matrix:\n{corr.to_string()}"
                     ai_text = analyze_data_with_gemini("Correlation Heatmap", corr_description)
                     st.session_state.plot_summaries_and_paths[bivariate_plot_key] = {
                         'path': fig_path, 'summary': ai_text
                     }
                     st.rerun()
         
+        elif bivariate_plot_type == 'All Pairs':
+            show_all_pairs(df, numeric_cols)
+
         if bivariate_plot_key in st.session_state.plot_summaries_and_paths:
             st.markdown("""
             <div class="success-box">
@@ -654,6 +934,11 @@ def eda_section(df):
         </div>
         """, unsafe_allow_html=True)
 
+    if categorical_columns(df):
+        st.markdown('<div class="section-header"><h3>🔗 Categorical Associations</h3></div>', 
+                    unsafe_allow_html=True)
+        show_categorical_associations(df, numeric_cols)
+
     
     st.markdown('<div class="section-header"><h3>📄 Professional Report Generation</h3></div>', 
                 unsafe_allow_html=True)
@@ -661,10 +946,16 @@ def eda_section(df):
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("🔍 Generate Overall EDA Summary", key="generate_overall_summary"):
-            with st.spinner("🔄 Generating comprehensive analysis..."):
-                st.session_state.overall_eda_summary = generate_overall_eda_summary(df)
-                st.rerun()
+        summary_job = find_job("overall_eda_summary")
+        if summary_job is not None and summary_job.active:
+            st.info("🔄 Generating comprehensive analysis in the background...")
+        elif st.button("🔍 Generate Overall EDA Summary", key="generate_overall_summary"):
+            submit_job(
+                "Overall EDA summary", generate_overall_eda_summary, df,
+                key="overall_eda_summary",
+                on_success=lambda summary: st.session_state.update(overall_eda_summary=summary)
+            )
+            st.rerun()
     
     with col2:
         plot_data_for_report = [
@@ -673,17 +964,32 @@ def eda_section(df):
         ]
         
         if st.session_state.overall_eda_summary and plot_data_for_report:
-            if st.button("📊 Download Complete PDF Report", key="download_pdf_report"):
-                with st.spinner("📝 Generating professional PDF report..."):
-                    pdf_output = create_pdf_report(
-                        df, st.session_state.overall_eda_summary, plot_data_for_report
-                    )
-                    st.download_button(
-                        label="📥 Download PDF Report",
-                        data=pdf_output,
-                        file_name="professional_eda_report.pdf",
-                        mime="application/pdf"
+            report_signature = (
+                st.session_state.get("dataset_version", 0),
+                st.session_state.overall_eda_summary,
+                tuple((plot['path'], plot['summary']) for plot in plot_data_for_report)
+            )
+            pdf_report = st.session_state.get("pdf_report")
+            pdf_job = find_job("pdf_report")
+            if pdf_report is not None and pdf_report["signature"] == report_signature:
+                st.download_button(
+                    label="📥 Download PDF Report",
+                    data=pdf_report["data"],
+                    file_name="professional_eda_report.pdf",
+                    mime="application/pdf"
+                )
+            elif pdf_job is not None and pdf_job.active:
+                st.info("📝 Generating professional PDF report in the background...")
+            elif st.button("📊 Generate Complete PDF Report", key="download_pdf_report"):
+                submit_job(
+                    "PDF report", create_pdf_report,
+                    df, st.session_state.overall_eda_summary, list(plot_data_for_report),
+                    key="pdf_report",
+                    on_success=lambda data: st.session_state.update(
+                        pdf_report={"signature": report_signature, "data": data}
                     )
+                )
+                st.rerun()
         else:
             st.markdown("""
             <div class="info-box">
@@ -2,6 +2,20 @@ import pandas as pd
 import streamlit as st
 import os
 import numpy as np
+from functools import partial
+from utils.text_standardize import OPERATIONS, standardize_columns, suggest_merges, text_columns
+from utils.memory_optimizer import analyze_memory, apply_memory_plan
+from utils.export import EXPORT_FORMATS, export_dataset, export_file_name, format_size, remove_export
+from utils.paging import column_multiselect, paged_column_table, paged_dataframe
+from utils.session_store import get_working_df, set_working_df
+from utils.perf import timed
+from utils.frame_refs import frame_ref, same_frame
+from utils.jobs import find_job, submit_job
+from utils.profile import describe, non_null_counts, null_counts
+from utils.missingness import co_missing, get_null_mask, missing_counts, missing_patterns, rows_missing_any
+from utils.compare import build_snapshot, compare_snapshots, current_snapshot
+from utils.warmup import start_warmup
+from utils.excel_ingest import list_sheets, read_excel_cached, read_sheet_header
 
 if "active_tab" not in st.session_state:
     st.session_state.active_tab = "Data Overview"
@@ -9,48 +23,226 @@ if "active_tab" not in st.session_state:
 def set_active_tab(tab_name):
     st.session_state.active_tab = tab_name
 
-def load_file(file_path):
-    try:
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext == ".csv":
+def read_dataset(file_path, sheet_name=0, columns=None):
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == ".csv":
+        try:
+            return pd.read_csv(file_path, encoding='utf-8')
+        except UnicodeDecodeError:
             try:
-                df = pd.read_csv(file_path, encoding='utf-8')
+                return pd.read_csv(file_path, encoding="ISO-8859-1")
             except UnicodeDecodeError:
-                try:
-                    df = pd.read_csv(file_path, encoding="ISO-8859-1")
-                except UnicodeDecodeError:
-                    df = pd.read_csv(file_path, encoding="cp1252")
-        elif ext in [".xlsx", ".xls"]:
-            df = pd.read_excel(file_path)
-        else:
-            raise ValueError("Unsupported File Format.")
-        return df
+                return pd.read_csv(file_path, encoding="cp1252")
+    elif ext == ".xlsx":
+        return read_excel_cached(file_path, sheet_name, columns)
+    elif ext == ".xls":
+        return pd.read_excel(file_path, sheet_name=sheet_name, usecols=columns)
+    raise ValueError("Unsupported File Format.")
+
+@timed
+def load_file(file_path, sheet_name=0, columns=None):
+    try:
+        return read_dataset(file_path, sheet_name, columns)
     except Exception as e:
         st.error(f"Error loading file: {e}")
         return None
 
+def show_excel_options(file_path):
+    """Sheet and column pickers for a workbook; returns load_file kwargs once the user confirms."""
+    try:
+        sheets = list_sheets(file_path)
+    except Exception as e:
+        st.error(f"Error reading workbook: {e}")
+        return None
+    sheet_name = st.selectbox("📄 Sheet", sheets, key="excel_sheet") if len(sheets) > 1 else sheets[0]
+    try:
+        header = read_sheet_header(file_path, sheet_name)
+    except Exception as e:
+        st.error(f"Error reading sheet: {e}")
+        return None
+    columns = st.multiselect(
+        "Columns to load (leave empty for all)", header, key=f"excel_columns_{sheet_name}"
+    )
+    if not st.button("📥 Load sheet", key="excel_load"):
+        return None
+    return {"sheet_name": sheet_name, "columns": columns or None}
+
+def _store_baseline(key, snapshot):
+    # A newer upload replaces the key; results of older baseline jobs are dropped
+    if st.session_state.get("baseline_key") == key:
+        st.session_state.baseline_snapshot = snapshot
+
+def capture_baseline(df, warm_up=False):
+    """Profiles the freshly loaded dataset in the background; later versions are compared against it.
+
+    With warm_up the same job also fills the EDA caches, so the data is scanned once.
+    """
+    key = f"baseline_snapshot_{st.session_state.get('dataset_version', 0)}"
+    st.session_state.baseline_key = key
+    st.session_state.baseline_snapshot = None
+    if warm_up and df.columns.is_unique:
+        start_warmup(df, key, on_snapshot=partial(_store_baseline, key))
+    else:
+        submit_job(
+            "Profile uploaded data", build_snapshot, df,
+            key=key, on_success=partial(_store_baseline, key), background=True
+        )
+
+@timed
 def preview_data(df):
     st.subheader("🧾 Data Preview")
-    st.dataframe(df.head())
+    paged_dataframe(df, key="preview")
     st.markdown(f"**Rows:** {df.shape[0]} | **Columns:** {df.shape[1]}")
 
+@timed
 def show_basic_stats(df):
     st.subheader("📊 Summary Statistics")
-    st.write(df.describe())
+    st.write(describe(df))
 
-def show_info(df):
-    st.subheader("📋 Data Info")
-    info_df = pd.DataFrame({
+def build_info_table(df, counts=None):
+    return pd.DataFrame({
         "Column": df.columns,
-        "Non-Null Count": df.notnull().sum(),
+        "Non-Null Count": df.notnull().sum() if counts is None else counts.reindex(df.columns),
         "Dtype": df.dtypes.astype(str)
     }).reset_index(drop=True)
-    st.write(info_df)
-
 
+@timed
+def show_info(df):
+    st.subheader("📋 Data Info")
+    counts = non_null_counts(df) if df.columns.is_unique else None
+    paged_column_table(df, lambda page: build_info_table(page, counts), key="info_table")
+
+
+MISSING_METHODS = [
+    "Drop rows with missing values (selected columns only)",
+    "Drop rows with any missing value (entire row)",
+    "Drop columns with missing values",
+    "Fill with Mean",
+    "Fill with Median",
+    "Fill with Mode",
+    "Fill with Constant value",
+    "Forward Fill (ffill)",
+    "Backward Fill (bfill)",
+    "Interpolate"
+]
+
+OUTLIER_ACTIONS = ["Remove Outliers", "Cap Outliers"]
+
+
+def _each_column(columns, progress):
+    for i, col in enumerate(columns):
+        yield col
+        if progress is not None:
+            progress((i + 1) / len(columns), f"Processed `{col}`")
+
+
+@timed
+def handle_missing_values(df, method, selected_cols, constant=None, progress=None):
+    updated_df = df.copy()
+
+    if method == "Drop rows with missing values (selected columns only)":
+        updated_df.dropna(subset=selected_cols, inplace=True)
+    elif method == "Drop rows with any missing value (entire row)":
+        updated_df.dropna(inplace=True)
+    elif method == "Drop columns with missing values":
+        updated_df.drop(columns=selected_cols, inplace=True)
+    elif method == "Fill with Mean":
+        for col in _each_column(selected_cols, progress):
+            updated_df[col] = updated_df[col].fillna(updated_df[col].mean())
+    elif method == "Fill with Median":
+        for col in _each_column(selected_cols, progress):
+            updated_df[col] = updated_df[col].fillna(updated_df[col].median())
+    elif method == "Fill with Mode":
+        for col in _each_column(selected_cols, progress):
+            updated_df[col] = updated_df[col].fillna(updated_df[col].mode()[0])
+    elif method == "Fill with Constant value":
+        if constant is None or constant == "":
+            raise ValueError("A constant value is required.")
+        for col in _each_column(selected_cols, progress):
+            column = updated_df[col]
+            if isinstance(column.dtype, pd.CategoricalDtype) and constant not in column.cat.categories:
+                # Columns made categorical by Optimize Memory only accept known categories
+                column = column.cat.add_categories([constant])
+            updated_df[col] = column.fillna(constant)
+    elif method == "Forward Fill (ffill)":
+        updated_df[selected_cols] = updated_df[selected_cols].ffill()
+    elif method == "Backward Fill (bfill)":
+        updated_df[selected_cols] = updated_df[selected_cols].bfill()
+    elif method == "Interpolate":
+        for col in _each_column(selected_cols, progress):
+            updated_df[col] = updated_df[col].interpolate()
+    return updated_df
+
+
+def missing_changed_columns(method, selected_cols):
+    """Columns whose values handle_missing_values rewrites; the drop methods only remove rows or columns."""
+    return [] if method.startswith("Drop") else list(selected_cols)
+
+
+@timed
+def drop_duplicate_rows(df):
+    return df.drop_duplicates()
+
+
+def outlier_bounds(series):
+    Q1 = series.quantile(0.25)
+    Q3 = series.quantile(0.75)
+    IQR = Q3 - Q1
+    return float(Q1 - 1.5 * IQR), float(Q3 + 1.5 * IQR)
+
+
+def detect_outliers(series):
+    """(lower bound, upper bound, mask of the values outside them) by the 1.5 × IQR rule."""
+    lower_bound, upper_bound = outlier_bounds(series)
+    return lower_bound, upper_bound, (series < lower_bound) | (series > upper_bound)
+
+
+@timed
+def handle_outliers(df, col, option):
+    lower_bound, upper_bound = outlier_bounds(df[col])
+    updated_df = df.copy()
+    if option == "Remove Outliers":
+        updated_df = updated_df[(updated_df[col] >= lower_bound) & (updated_df[col] <= upper_bound)]
+    elif option == "Cap Outliers":
+        updated_df[col] = np.where(updated_df[col] > upper_bound, upper_bound, updated_df[col])
+        updated_df[col] = np.where(updated_df[col] < lower_bound, lower_bound, updated_df[col])
+    return updated_df
+
+
+def missing_impact(mask, method, selected_cols):
+    """One-line preview of what a missing-value method would do, read off the null mask."""
+    rows = mask["rows"]
+    if method == "Drop rows with any missing value (entire row)":
+        dropped = rows_missing_any(mask)
+        return f"Drops {dropped:,} of {rows:,} rows ({dropped / rows:.1%})."
+    if method == "Drop rows with missing values (selected columns only)":
+        dropped = rows_missing_any(mask, selected_cols)
+        return f"Drops {dropped:,} of {rows:,} rows ({dropped / rows:.1%})."
+    if method == "Drop columns with missing values":
+        return f"Drops {len(selected_cols)} column(s)."
+    cells = int(missing_counts(mask).reindex(selected_cols).fillna(0).sum())
+    return f"Fills {cells:,} missing cell(s) in {len(selected_cols)} column(s)."
+
+def show_missing_patterns(mask):
+    """Most frequent row-level missing patterns and which columns go missing together."""
+    complete = mask["rows"] - rows_missing_any(mask)
+    with st.expander(f"🧩 Missing Patterns ({complete:,} complete rows, {complete / mask['rows']:.1%})"):
+        st.markdown("**Most frequent patterns**")
+        st.dataframe(missing_patterns(mask), use_container_width=True, hide_index=True)
+        if len(mask["columns"]) >= 2:
+            st.markdown("**Co-missingness** (rows where both columns are missing)")
+            matrix = co_missing(mask)
+            if len(matrix) <= 30:
+                st.dataframe(matrix, use_container_width=True)
+            else:
+                pairs = matrix.where(np.triu(np.ones(matrix.shape, dtype=bool), k=1)).stack()
+                pairs = pairs.rename("Rows").rename_axis(["Column A", "Column B"]).reset_index()
+                st.dataframe(pairs.sort_values("Rows", ascending=False).head(30), use_container_width=True, hide_index=True)
+
+@timed
 def show_missing_values(df):
     st.subheader("🔍 Missing Values")
-    missing_df = df.isnull().sum().reset_index()
+    missing_df = null_counts(df).reset_index()
     missing_df.columns = ["Column", "Missing Values"]
     missing_df["% Missing"] = (missing_df["Missing Values"] / len(df)) * 100
     missing_df = missing_df[missing_df["Missing Values"] > 0]
@@ -62,30 +254,24 @@ def show_missing_values(df):
 
     st.dataframe(missing_df.sort_values(by="% Missing", ascending=False))
 
+    mask = get_null_mask(df)
+    show_missing_patterns(mask)
+
     st.markdown("### 🔧 Handle Missing Values")
     method = st.selectbox(
         "Select a method",
-        [
-            "Drop rows with missing values (selected columns only)",
-            "Drop rows with any missing value (entire row)",
-            "Drop columns with missing values",
-            "Fill with Mean",
-            "Fill with Median",
-            "Fill with Mode",
-            "Fill with Constant value",
-            "Forward Fill (ffill)",
-            "Backward Fill (bfill)",
-            "Interpolate"
-        ],
+        MISSING_METHODS,
         key="missing_method_select"  
     )
 
-    selected_cols = st.multiselect(
+    missing_cols = missing_df["Column"].tolist()
+    selected_cols = column_multiselect(
         "Select columns to apply",
-        options=df.columns[df.isnull().any()],
-        default=df.columns[df.isnull().any()],
-        key="missing_cols_multiselect"  
+        missing_cols,
+        default=missing_cols,
+        key="missing_cols_multiselect"
     )
+    st.caption(missing_impact(mask, method, selected_cols))
 
     constant = None
     if method == "Fill with Constant value":
@@ -96,69 +282,109 @@ def show_missing_values(df):
             st.warning("⚠️ Please select at least one column.")
             return
 
-        updated_df = df.copy()
-
-        if method == "Drop rows with missing values (selected columns only)":
-            updated_df.dropna(subset=selected_cols, inplace=True)
-        elif method == "Drop rows with any missing value (entire row)":
-            updated_df.dropna(inplace=True)
-        elif method == "Drop columns with missing values":
-            updated_df.drop(columns=selected_cols, inplace=True)
-        elif method == "Fill with Mean":
-            for col in selected_cols:
-                updated_df[col] = updated_df[col].fillna(updated_df[col].mean())
-        elif method == "Fill with Median":
-            for col in selected_cols:
-                updated_df[col] = updated_df[col].fillna(updated_df[col].median())
-        elif method == "Fill with Mode":
-            for col in selected_cols:
-                updated_df[col] = updated_df[col].fillna(updated_df[col].mode()[0])
-        elif method == "Fill with Constant value":
-            if constant is None or constant == "":
-                st.warning("⚠️ Please enter a constant value.")
-                return
-            for col in selected_cols:
-                updated_df[col] = updated_df[col].fillna(constant)
-        elif method == "Forward Fill (ffill)":
-            updated_df[selected_cols] = updated_df[selected_cols].fillna(method='ffill')
-        elif method == "Backward Fill (bfill)":
-            updated_df[selected_cols] = updated_df[selected_cols].fillna(method='bfill')
-        elif method == "Interpolate":
-            for col in selected_cols:
-                updated_df[col] = updated_df[col].interpolate()
+        if method == "Fill with Constant value" and (constant is None or constant == ""):
+            st.warning("⚠️ Please enter a constant value.")
+            return
 
-        st.session_state.df = updated_df
-        st.success("✅ Missing value handling applied successfully.")
+        submit_job(
+            f"{method} ({len(selected_cols)} column(s))",
+            handle_missing_values, df, method, selected_cols, constant,
+            key="handle_missing", replaces_data=True, with_progress=True,
+            on_success=lambda updated: set_working_df(updated, missing_changed_columns(method, selected_cols))
+        )
 
+    job = find_job("handle_missing")
+    if job is not None and job.active:
+        st.info(f"⏳ {job.label} is running in the background; the table updates when it finishes.")
 
+
+@timed
 def show_duplicates(df):
     st.subheader("👥 Duplicated Rows")
-    duplicates_count = df.duplicated().sum()
+    version = st.session_state.get("dataset_version", 0)
+    scan = st.session_state.get("duplicate_scan")
+    if scan is None or scan["version"] != version:
+        job = find_job(f"duplicate_scan_{version}")
+        if job is not None and job.status == "failed":
+            st.error(f"Duplicate scan failed: {job.error}")
+            return
+        submit_job(
+            "Scan for duplicate rows", df.duplicated,
+            key=f"duplicate_scan_{version}", background=True,
+            on_success=lambda mask: st.session_state.update(duplicate_scan={"version": version, "mask": mask})
+        )
+        st.info("⏳ Scanning for duplicate rows in the background...")
+        return
+
+    duplicated = scan["mask"]
+    duplicates_count = int(duplicated.sum())
 
     if duplicates_count > 0:
         st.warning(f"⚠️ {duplicates_count} duplicate rows detected!")
-        if st.button("Drop Duplicate Rows", key="drop_duplicates_btn"):
-            st.session_state.df = df.drop_duplicates()
-            st.success(f"✅ {duplicates_count} duplicate rows have been dropped.")
+        paged_dataframe(df, key="duplicates_view", mask=duplicated)
+        job = find_job("drop_duplicates")
+        if job is not None and job.active:
+            st.info("⏳ Dropping duplicate rows in the background...")
+        elif st.button("Drop Duplicate Rows", key="drop_duplicates_btn"):
+            submit_job(
+                f"Drop {duplicates_count} duplicate rows", drop_duplicate_rows, df,
+                key="drop_duplicates", replaces_data=True,
+                on_success=lambda updated: set_working_df(updated, changed_columns=[])
+            )
+            st.rerun()
     else:
         st.success("✅ No duplicate rows detected in the dataset!")
 
+@timed
 def show_data_standardization(df):
     st.subheader("🔄 Data Standardization")
-    text_cols = df.select_dtypes(include='object').columns.tolist()
-    if text_cols:
-        cols_to_clean = st.multiselect("Select text columns to clean:", options=text_cols, key="standardize_text_cols")
-        if st.button("Convert to Lowercase", key="lower_case_btn") and cols_to_clean:
-            for col in cols_to_clean:
-                st.session_state.df[col] = st.session_state.df[col].str.lower()
-            st.success("✅ Converted to lowercase.")
+    text_cols = text_columns(df)
+    if not text_cols:
+        st.info("No text columns found.")
+        return
 
+    cols_to_clean = st.multiselect("Select text columns to clean:", options=text_cols, key="standardize_text_cols")
+    operations = st.multiselect(
+        "Operations (applied in the order selected):",
+        options=list(OPERATIONS),
+        default=["Trim whitespace", "Collapse whitespace"],
+        key="standardize_operations"
+    )
+
+    mappings = {}
+    for col in cols_to_clean:
+        with st.expander(f"🔗 Merge near-identical labels in `{col}`", expanded=False):
+            if st.button("Suggest merges", key=f"suggest_merges_{col}"):
+                st.session_state[f"merge_suggestions_{col}"] = suggest_merges(df[col], operations)
+            suggestions = st.session_state.get(f"merge_suggestions_{col}")
+            if suggestions is None:
+                st.caption("Group labels that differ only by case, spacing, accents or punctuation.")
+            elif suggestions.empty:
+                st.success("✅ No near-identical labels found.")
+            else:
+                edited = st.data_editor(
+                    suggestions,
+                    disabled=["Value", "Count"],
+                    use_container_width=True,
+                    key=f"merge_editor_{col}"
+                )
+                mappings[col] = dict(zip(edited["Value"], edited["Replace With"]))
+
+    if st.button("Apply Standardization", key="apply_standardization_btn"):
+        if not cols_to_clean or not (operations or mappings):
+            st.warning("⚠️ Please select at least one column and one operation.")
+            return
+        set_working_df(standardize_columns(df, cols_to_clean, operations, mappings), changed_columns=cols_to_clean)
+        for col in cols_to_clean:
+            st.session_state.pop(f"merge_suggestions_{col}", None)
+        st.success(f"✅ Standardized {len(cols_to_clean)} column(s).")
+
+@timed
 def show_outliers(df):
     st.subheader("📈 Outlier Detection & Handling")
 
-    if "df" in st.session_state and st.session_state.df is not None:
-        df = st.session_state.df.copy()
-    else:
+    df = get_working_df()
+    if df is None:
         st.warning("⚠️ Please upload and clean the data first.")
         return
 
@@ -170,46 +396,170 @@ def show_outliers(df):
     col_to_check = st.selectbox("Select a numerical column:", options=numeric_cols, key="outlier_col_select")
 
     if st.button("Detect Outliers", key="detect_outliers_btn"):
-        Q1 = df[col_to_check].quantile(0.25)
-        Q3 = df[col_to_check].quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = float(Q1 - 1.5 * IQR)
-        upper_bound = float(Q3 + 1.5 * IQR)
-        outliers = df[(df[col_to_check] < lower_bound) | (df[col_to_check] > upper_bound)]
+        lower_bound, upper_bound, outlier_mask = detect_outliers(df[col_to_check])
         st.session_state["outlier_info"] = {
             "col": col_to_check,
             "lb": lower_bound,
             "ub": upper_bound,
-            "count": int(len(outliers))
+            "count": int(outlier_mask.sum())
         }
         st.session_state.active_tab = "Outliers"  
 
     if "outlier_info" in st.session_state and st.session_state["outlier_info"].get("col") == col_to_check:
         info = st.session_state["outlier_info"]
         st.warning(f"⚠️ {info['count']} outliers detected in `{col_to_check}`.")
-        outliers = df[(df[col_to_check] < info['lb']) | (df[col_to_check] > info['ub'])]
-        st.dataframe(outliers)
+        outlier_mask = (df[col_to_check] < info['lb']) | (df[col_to_check] > info['ub'])
+        paged_dataframe(df, key="outliers_view", mask=outlier_mask)
 
-    option = st.selectbox("Select an action:", ["Remove Outliers", "Cap Outliers"], key="outlier_action")
+    option = st.selectbox("Select an action:", OUTLIER_ACTIONS, key="outlier_action")
 
     if st.button("Apply Outlier Handling", key="apply_outlier_btn"):
-        Q1 = df[col_to_check].quantile(0.25)
-        Q3 = df[col_to_check].quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-
-        updated_df = df.copy()
-        if option == "Remove Outliers":
-            updated_df = updated_df[(updated_df[col_to_check] >= lower_bound) & (updated_df[col_to_check] <= upper_bound)]
-        elif option == "Cap Outliers":
-            updated_df[col_to_check] = np.where(updated_df[col_to_check] > upper_bound, upper_bound, updated_df[col_to_check])
-            updated_df[col_to_check] = np.where(updated_df[col_to_check] < lower_bound, lower_bound, updated_df[col_to_check])
-
-        st.session_state.df = updated_df
-        st.success("✅ Outlier handling applied.")
+        submit_job(
+            f"{option} in `{col_to_check}`", handle_outliers, df, col_to_check, option,
+            key="handle_outliers", replaces_data=True,
+            on_success=lambda updated: set_working_df(
+                updated, changed_columns=[col_to_check] if option == "Cap Outliers" else []
+            )
+        )
         st.session_state.active_tab = "Outliers"
 
+    job = find_job("handle_outliers")
+    if job is not None and job.active:
+        st.info(f"⏳ {job.label} is running in the background.")
+
+
+@timed
+def show_memory_optimization(df):
+    st.subheader("🧠 Optimize Memory")
+    version = st.session_state.get("dataset_version", 0)
+
+    if st.button("Analyze Columns", key="analyze_memory_btn"):
+        with st.spinner("Analyzing column types..."):
+            st.session_state.memory_plan = {"version": version, "plan": analyze_memory(df)}
+
+    plan_state = st.session_state.get("memory_plan")
+    if plan_state and plan_state["version"] == version:
+        plan = plan_state["plan"]
+        st.dataframe(plan.drop(columns="Target"), use_container_width=True)
+        changes = int(plan["Target"].notna().sum())
+        if changes == 0:
+            st.success("✅ All columns already use compact types.")
+        elif st.button(f"Optimize Memory ({changes} columns)", key="apply_memory_btn"):
+            before = df.memory_usage(deep=True).sum()
+            optimized, report = apply_memory_plan(df, plan)
+            after = optimized.memory_usage(deep=True).sum()
+            set_working_df(optimized, changed_columns=[col for col, target in zip(plan["Column"], plan["Target"]) if target is not None])
+            st.session_state.memory_report = {"report": report, "before": before, "after": after}
+            st.session_state.memory_plan = None
+            st.rerun()
+    else:
+        st.info("Analyze the columns to see proposed downcasts and categorical conversions.")
+
+    result = st.session_state.get("memory_report")
+    if result:
+        st.markdown("### 📉 Last Optimization")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Before", format_size(result["before"]))
+        col2.metric("After", format_size(result["after"]))
+        col3.metric("Saved", f"{(1 - result['after'] / result['before']) * 100:.1f}%" if result["before"] else "0%")
+        st.dataframe(result["report"], use_container_width=True)
+
+
+@timed
+def show_export(df):
+    st.subheader("📤 Export Cleaned Data")
+    col1, col2 = st.columns(2)
+    with col1:
+        fmt = st.selectbox("File format", list(EXPORT_FORMATS), key="export_format")
+    with col2:
+        compression = st.selectbox(
+            "Compression",
+            EXPORT_FORMATS[fmt]["compression"],
+            format_func=lambda c: "None" if c is None else c,
+            key=f"export_compression_{fmt}"
+        )
+
+    result = st.session_state.get("export_result")
+    if result and (result["format"], result["compression"]) != (fmt, compression):
+        # A different format was chosen; the old file is no longer offered
+        st.session_state.export_result = result = None
+
+    if st.button("📦 Build Export File", key="build_export_btn"):
+        st.session_state.export_result = result = None
+        with st.spinner("Writing export file..."):
+            try:
+                path, size, seconds = export_dataset(df, fmt, compression)
+            except Exception as e:
+                st.error(f"Error exporting data: {e}")
+                return
+        # Read once: download_button would otherwise reopen the file on every rerun,
+        # and the temporary file would outlive the session
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        finally:
+            remove_export(path)
+        st.session_state.export_result = result = {
+            "data": data,
+            "size": size,
+            "seconds": seconds,
+            "format": fmt,
+            "compression": compression,
+            "name": export_file_name("cleaned_data", fmt, compression),
+            "mime": EXPORT_FORMATS[fmt]["mime"],
+            "ref": frame_ref(df)
+        }
+
+    if not result:
+        st.info("Choose a format and build the export file to download it.")
+        return
+    if not same_frame(result["ref"], df):
+        st.warning("⚠️ The data changed since the export was built. Rebuild it to include the latest changes.")
+
+    st.markdown(f"**{result['name']}** — {format_size(result['size'])}, built in {result['seconds']:.2f}s")
+    st.download_button(
+        label=f"📥 Download {result['name']}",
+        data=result["data"],
+        file_name=result["name"],
+        mime=result["mime"],
+        use_container_width=True
+    )
+
+
+@timed
+def show_comparison(df):
+    st.subheader("🆚 Before / After Cleaning")
+    baseline = st.session_state.get("baseline_snapshot")
+    if baseline is None:
+        key = st.session_state.get("baseline_key")
+        job = find_job(key) if key else None
+        if job is not None and job.active:
+            st.info("⏳ The uploaded data is still being profiled in the background.")
+        else:
+            st.info("No profile of the uploaded data is available; upload a file to compare against it.")
+        return
+    if not df.columns.is_unique:
+        st.warning("⚠️ Comparison needs unique column names.")
+        return
+
+    table = compare_snapshots(baseline, current_snapshot(df))
+    removed = table.loc[table["Status"] == "removed", "Column"].tolist()
+    added = table.loc[table["Status"] == "added", "Column"].tolist()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Rows", f"{df.shape[0]:,}", f"{df.shape[0] - baseline['rows']:+,}")
+    col2.metric("Columns", df.shape[1], f"{df.shape[1] - len(baseline['columns']):+d}")
+    missing_before, missing_after = sum(baseline["nulls"].values()), int(table["Nulls After"].sum())
+    col3.metric("Missing Values", f"{missing_after:,}", f"{missing_after - missing_before:+,}")
+    if removed:
+        st.markdown(f"**Removed columns:** {', '.join(removed)}")
+    if added:
+        st.markdown(f"**Added columns:** {', '.join(added)}")
+
+    st.caption("PSI below 0.1 means a stable distribution, 0.1–0.25 a moderate shift and above 0.25 a major one. KS is the largest gap between the two distribution functions.")
+    st.dataframe(
+        table.sort_values("PSI", ascending=False, na_position="last"),
+        use_container_width=True, hide_index=True
+    )
 
 tabs = ["Data Overview", "Missing Values", "Duplicates", "Standardize", "Outliers"]
 tab_objects = st.tabs(tabs)
@@ -217,17 +567,17 @@ tab_objects = st.tabs(tabs)
 for i, tab in enumerate(tab_objects):
     with tab:
         if tabs[i] == "Data Overview":
-            if "df" in st.session_state:
-                preview_data(st.session_state.df)
+            if get_working_df() is not None:
+                preview_data(get_working_df())
         elif tabs[i] == "Missing Values":
-            if "df" in st.session_state:
-                show_missing_values(st.session_state.df)
+            if get_working_df() is not None:
+                show_missing_values(get_working_df())
         elif tabs[i] == "Duplicates":
-            if "df" in st.session_state:
-                show_duplicates(st.session_state.df)
+            if get_working_df() is not None:
+                show_duplicates(get_working_df())
         elif tabs[i] == "Standardize":
-            if "df" in st.session_state:
-                show_data_standardization(st.session_state.df)
+            if get_working_df() is not None:
+                show_data_standardization(get_working_df())
         elif tabs[i] == "Outliers":
-            if "df" in st.session_state:
-                show_outliers(st.session_state.df)
\ No newline at end of file
+            if get_working_df() is not None:
+                show_outliers(get_working_df())
\ No newline at end of file
@@ -0,0 +1,226 @@
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+
+import pandas as pd
+import pyarrow as pa
+
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Converted sheets are written here, and the oldest are removed past CACHE_MAX_BYTES.
+# Unset, a private directory is created per process and removed at exit
+CACHE_DIR = os.environ.get("AUTO_EDA_EXCEL_CACHE_DIR")
+CACHE_MAX_BYTES = int(float(os.environ.get("AUTO_EDA_EXCEL_CACHE_MB", 1024)) * 1024 ** 2)
+CACHE_VERSION = 2
+
+
+def _load_workbook(file_path):
+    from openpyxl import load_workbook
+
+    # read_only streams rows from the sheet XML instead of building every cell object
+    return load_workbook(file_path, read_only=True, data_only=True)
+
+
+def _mtime(file_path):
+    return os.stat(file_path).st_mtime_ns
+
+
+@lru_cache(maxsize=32)
+def _sheet_names(file_path, mtime):
+    workbook = _load_workbook(file_path)
+    try:
+        return tuple(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def list_sheets(file_path):
+    """Sheet names in workbook order; parsed once per file version."""
+    return list(_sheet_names(os.path.abspath(file_path), _mtime(file_path)))
+
+
+def _column_names(header):
+    """Header cells as pandas would name them: blanks become "Unnamed: i", repeats get a suffix."""
+    names, seen = [], {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None or value == "" else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _filled_width(row):
+    """Cells up to and including the last non-empty one."""
+    width = len(row)
+    while width and row[width - 1] is None:
+        width -= 1
+    return width
+
+
+def _header_names(header, width):
+    """Names for the first width columns; trailing columns with a blank header still hold data."""
+    header = list(header[:width]) + [None] * (width - len(header))
+    return _column_names(header)
+
+
+@lru_cache(maxsize=32)
+def _sheet_header(file_path, mtime, sheet_name):
+    workbook = _load_workbook(file_path)
+    try:
+        sheet = workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, ())
+        width = _filled_width(header)
+        if sheet.max_column is None or sheet.max_column > width:
+            # Columns past the last header cell count if any row fills them
+            width = max([width] + [_filled_width(row) for row in rows])
+        return tuple(_header_names(header, width))
+    finally:
+        workbook.close()
+
+
+def read_sheet_header(file_path, sheet_name):
+    """Column names of a sheet as pandas would name them.
+
+    Only the first row is read unless the sheet extends past its last header
+    cell; parsed once per file version.
+    """
+    return list(_sheet_header(os.path.abspath(file_path), _mtime(file_path), sheet_name))
+
+
+def _stream_sheet(file_path, sheet_name, columns):
+    workbook = _load_workbook(file_path)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame(columns=columns)
+
+        records = []
+        last_filled = 0
+        width = _filled_width(header)
+        for row in rows:
+            filled = _filled_width(row)
+            records.append(row[:filled])
+            if filled:
+                last_filled = len(records)
+                width = max(width, filled)
+        # Formatting often stretches the sheet dimension past the last real row
+        del records[last_filled:]
+
+        names = _header_names(header, width)
+        if columns is None:
+            columns = names
+        missing = [col for col in columns if col not in names]
+        if missing:
+            raise ValueError(f"Columns not found in sheet {sheet_name!r}: {missing}")
+        positions = [names.index(col) for col in columns]
+        # Rows are ragged in the XML; cells past the end of a row are empty
+        records = [tuple(row[i] if i < len(row) else None for i in positions) for row in records]
+        return pd.DataFrame.from_records(records, columns=columns)
+    finally:
+        workbook.close()
+
+
+def read_sheet(file_path, sheet_name=0, columns=None):
+    """Parses one sheet (only the given columns) straight from the workbook."""
+    if isinstance(sheet_name, int):
+        sheet_name = list_sheets(file_path)[sheet_name]
+    if CALAMINE_AVAILABLE:
+        return pd.read_excel(file_path, sheet_name=sheet_name, usecols=columns, engine="calamine")
+    return _stream_sheet(file_path, sheet_name, columns)
+
+
+def _cache_dir():
+    """The cache directory, created readable by the current user only."""
+    global CACHE_DIR
+    if CACHE_DIR is None:
+        CACHE_DIR = tempfile.mkdtemp(prefix="auto_eda_columnar_cache_")
+        atexit.register(shutil.rmtree, CACHE_DIR, ignore_errors=True)
+    else:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    return CACHE_DIR
+
+
+def _cache_path(file_path, sheet_name, columns):
+    stat = os.stat(file_path)
+    key = json.dumps(
+        [CACHE_VERSION, os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, sheet_name, columns],
+        default=str
+    )
+    digest = hashlib.sha1(key.encode()).hexdigest()[:20]
+    return os.path.join(_cache_dir(), digest)
+
+
+def _prune_cache(keep):
+    """Removes the least recently used cache files until the cache fits CACHE_MAX_BYTES."""
+    entries = []
+    with os.scandir(_cache_dir()) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= CACHE_MAX_BYTES:
+            break
+        if os.path.splitext(path)[0] == keep:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _write_cache(df, path_base):
+    tmp = path_base + ".tmp"
+    try:
+        df.to_parquet(tmp, engine="pyarrow", index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type columns (numbers and text in one column) have no Arrow type;
+        # such sheets are not cached and are parsed from the workbook each time
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return
+    os.replace(tmp, path_base + ".parquet")
+    _prune_cache(keep=path_base)
+
+
+def _read_cache(path_base):
+    path = path_base + ".parquet"
+    if not os.path.exists(path):
+        return None
+    # Marks the entry as recently used even where access times are not tracked
+    os.utime(path)
+    return pd.read_parquet(path, engine="pyarrow")
+
+
+def read_excel_cached(file_path, sheet_name=0, columns=None):
+    """Reads a sheet through the columnar cache; the workbook is parsed once per sheet and column set.
+
+    The cache key covers the file's path, size and modification time, so a
+    re-uploaded workbook is converted again.
+    """
+    if isinstance(sheet_name, int):
+        sheet_name = list_sheets(file_path)[sheet_name]
+    columns = list(columns) if columns else None
+    path_base = _cache_path(file_path, sheet_name, columns)
+    df = _read_cache(path_base)
+    if df is None:
+        df = read_sheet(file_path, sheet_name, columns)
+        _write_cache(df, path_base)
+    return df
+
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+EXPORT_CHUNK_ROWS = 100_000
+
+# Compression choices per format; None means uncompressed
+EXPORT_FORMATS = {
+    "CSV": {"extension": ".csv", "mime": "text/csv", "compression": [None, "gzip", "zstd"]},
+    "Parquet": {"extension": ".parquet", "mime": "application/octet-stream", "compression": ["zstd", "snappy", "gzip", None]},
+    "Feather": {"extension": ".feather", "mime": "application/octet-stream", "compression": ["zstd", "lz4", None]},
+}
+
+COMPRESSED_SUFFIX = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def export_file_name(base_name, fmt, compression):
+    """Returns the download file name for a format/compression pair."""
+    name = base_name + EXPORT_FORMATS[fmt]["extension"]
+    if fmt == "CSV" and compression:
+        name += COMPRESSED_SUFFIX[compression]
+    return name
+
+
+def _iter_chunks(df, chunk_rows):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def _write_csv(df, path, compression, chunk_rows):
+    stream = pa.CompressedOutputStream(path, compression) if compression else pa.OSFile(path, "wb")
+    with stream:
+        stream.write(df.iloc[:0].to_csv(index=False).encode("utf-8"))
+        for chunk in _iter_chunks(df, chunk_rows):
+            stream.write(chunk.to_csv(index=False, header=False).encode("utf-8"))
+
+
+def _arrow_compatible(df):
+    """df in a shape Arrow can store: string column names, and mixed-type object
+    columns (e.g. numbers and text) turned into text since Arrow has no type for them.
+
+    Missing values stay missing. Only the affected columns are copied.
+    """
+    mixed = [
+        col for col in df.columns[(df.dtypes == object).to_numpy()]
+        if pd.api.types.infer_dtype(df[col], skipna=True) in ("mixed", "mixed-integer")
+    ]
+    renamed = not all(isinstance(col, str) for col in df.columns)
+    if not mixed and not renamed:
+        return df
+    # Assigned by label: column names need not be strings
+    out = df.copy(deep=False)
+    for col in mixed:
+        out[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    if renamed:
+        # The schema names every field by str(label), and chunks are looked up by those names
+        out.columns = out.columns.map(str)
+    return out
+
+
+def _write_parquet(df, path, compression, chunk_rows):
+    df = _arrow_compatible(df)
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema, compression=compression or "none") as writer:
+        for chunk in _iter_chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _write_feather(df, path, compression, chunk_rows):
+    df = _arrow_compatible(df)
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema, options=options) as writer:
+        for chunk in _iter_chunks(df, chunk_rows):
+            for batch in pa.Table.from_pandas(chunk, schema=schema, preserve_index=False).to_batches():
+                writer.write_batch(batch)
+
+
+WRITERS = {"CSV": _write_csv, "Parquet": _write_parquet, "Feather": _write_feather}
+
+
+def export_dataset(df, fmt, compression=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Streams df to a temporary file in chunks and returns (path, size_bytes, seconds).
+
+    Only one chunk is serialized at a time, so peak memory stays close to the
+    size of the frame itself instead of frame + full text copy + cache copy.
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if compression not in EXPORT_FORMATS[fmt]["compression"]:
+        raise ValueError(f"{fmt} export does not support {compression} compression.")
+
+    fd, path = tempfile.mkstemp(prefix="auto_eda_export_", suffix=EXPORT_FORMATS[fmt]["extension"])
+    os.close(fd)
+    start = time.perf_counter()
+    try:
+        WRITERS[fmt](df, path, compression, chunk_rows)
+    except Exception:
+        os.remove(path)
+        raise
+    return path, os.path.getsize(path), time.perf_counter() - start
+
+
+def remove_export(path):
+    """Deletes a previously built export file if it still exists."""
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def format_size(num_bytes):
+    """Human readable byte count."""
+    for unit in ["B", "KB", "MB", "GB"]:
+        if num_bytes < 1024 or unit == "GB":
+            return f"{num_bytes:,.1f} {unit}" if unit != "B" else f"{num_bytes} B"
+        num_bytes /= 1024
@@ -0,0 +1,68 @@
+import weakref
+
+import streamlit as st
+
+
+class DatasetRef:
+    """Reference to one version of the session's spilled working dataset.
+
+    A spilled dataset too large to keep assembled comes back from
+    get_working_df() as a new DataFrame on every call, so a weak reference to
+    any one of those objects is dead by the next rerun. This stands in for
+    weakref.ref(df) in the session caches: it matches every frame the store
+    hands out for that version, and calling it returns the dataset (or None
+    once a newer version replaced it).
+    """
+
+    def __init__(self, store, version):
+        self.store = store
+        self.version = version
+
+    def __call__(self, columns=None):
+        if self.store.version != self.version:
+            return None
+        return self.store.frame(columns)
+
+    def matches(self, df):
+        return self.store.issued(df, self.version)
+
+
+def frame_ref(df):
+    """Reference to df for identity-keyed caches; compare it with same_frame()."""
+    store = st.session_state.get("dataset_store")
+    if store is not None and store.issued(df, store.version):
+        return DatasetRef(store, store.version)
+    return weakref.ref(df)
+
+
+def same_frame(ref, df):
+    """Whether ref, from frame_ref(), refers to df."""
+    if isinstance(ref, DatasetRef):
+        return ref.matches(df)
+    return ref() is df
+
+
+def resolve(ref, columns=None):
+    """The frame behind ref (or some of its columns), or None if it is gone."""
+    if isinstance(ref, DatasetRef):
+        return ref(columns)
+    df = ref()
+    if df is None or columns is None:
+        return df
+    return df[columns]
+
+
+def frame_cached(name, df, key, compute):
+    """compute() cached in the session while df is the same frame and key is unchanged."""
+    entry = st.session_state.get(name)
+    if entry is None or not same_frame(entry["ref"], df) or entry["key"] != key:
+        entry = {"ref": frame_ref(df), "key": key, "value": compute()}
+        st.session_state[name] = entry
+    return entry["value"]
+
+
+def seed_frame_cache(name, df, key, value):
+    """Stores a value computed off the script thread where frame_cached() will find it."""
+    entry = st.session_state.get(name)
+    if entry is None or not same_frame(entry["ref"], df) or entry["key"] != key:
+        st.session_state[name] = {"ref": frame_ref(df), "key": key, "value": value}
@@ -0,0 +1,235 @@
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+# Threads per session; pandas releases the GIL for most heavy kernels. Jobs the
+# user asked for and background profiling each get their own threads, so an
+# upload's warm-up never holds up a cleaning step
+JOB_WORKERS = int(os.environ.get("AUTO_EDA_JOB_WORKERS", 2))
+BACKGROUND_JOB_WORKERS = int(os.environ.get("AUTO_EDA_BACKGROUND_JOB_WORKERS", 1))
+POLL_SECONDS = 1.0
+MAX_FINISHED_JOBS = 10
+
+_ids = itertools.count(1)
+
+ACTIVE = ("queued", "running", "cancelling")
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    """One background operation; the worker thread only ever writes its own fields."""
+
+    def __init__(self, label, key, on_success, replaces_data):
+        self.id = next(_ids)
+        self.label = label
+        self.key = key
+        self.on_success = on_success
+        self.replaces_data = replaces_data
+        self.dataset_version = st.session_state.get("dataset_version", 0)
+        self.status = "queued"
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.applied = False
+        self.future = None
+        self._cancel = threading.Event()
+
+    @property
+    def active(self):
+        return self.status in ACTIVE
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def report(self, fraction=None, message=None):
+        """Progress callback handed to the operation; doubles as its cancellation point."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        if fraction is not None:
+            self.progress = min(max(float(fraction), 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self.status, self.finished = "cancelled", time.time()
+        elif self.active:
+            # Running operations stop at their next progress report, or their result is dropped
+            self.status = "cancelling"
+
+    def _run(self, func, args, kwargs):
+        if self._cancel.is_set():
+            self.status = "cancelled"
+            return
+        self.status, self.started = "running", time.time()
+        try:
+            result = func(*args, **kwargs)
+            if self._cancel.is_set():
+                raise JobCancelled()
+            self.result, self.progress, self.status = result, 1.0, "done"
+        except JobCancelled:
+            self.status = "cancelled"
+        except Exception as e:
+            self.error, self.status = f"{type(e).__name__}: {e}", "failed"
+        finally:
+            self.finished = time.time()
+
+
+class JobRunner:
+    """Background jobs of one session; lives in st.session_state so it survives reruns.
+
+    Each runner has its own thread pools, so one session's jobs never queue
+    behind another's. The idle threads exit once the session is dropped.
+    """
+
+    def __init__(self):
+        self.jobs = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="auto-eda-job")
+        self._background_executor = ThreadPoolExecutor(
+            max_workers=BACKGROUND_JOB_WORKERS, thread_name_prefix="auto-eda-background-job"
+        )
+
+    def submit(self, label, func, *args, key=None, on_success=None, replaces_data=False, with_progress=False,
+               background=False, **kwargs):
+        """Queues func(*args, **kwargs) and returns its Job.
+
+        A job with the same key that is still active (or finished but not yet
+        applied) is returned instead of starting a duplicate. on_success(result) runs on the script thread in
+        apply_finished(); with replaces_data it is skipped if the working
+        dataset changed after submission. with_progress passes the job's
+        report callback to func as its progress argument. background jobs
+        (profiling the user did not ask for) run on their own pool.
+        """
+        if key is not None:
+            existing = self.find(key)
+            if existing is not None and (existing.active or existing.status == "done" and not existing.applied):
+                return existing
+        job = Job(label, key, on_success, replaces_data)
+        if with_progress:
+            kwargs["progress"] = job.report
+        executor = self._background_executor if background else self._executor
+        job.future = executor.submit(job._run, func, args, kwargs)
+        self.jobs[job.id] = job
+        self._prune()
+        return job
+
+    def find(self, key):
+        """Most recent job submitted under key, or None."""
+        for job in reversed(self.jobs.values()):
+            if job.key == key:
+                return job
+        return None
+
+    def has_active(self):
+        return any(job.active for job in self.jobs.values())
+
+    def has_unapplied(self):
+        return any(job.status == "done" and not job.applied for job in self.jobs.values())
+
+    def apply_finished(self):
+        """Swaps finished results into the session; returns the jobs applied on this call."""
+        applied = []
+        version = st.session_state.get("dataset_version", 0)
+        for job in self.jobs.values():
+            if job.status != "done" or job.applied:
+                continue
+            job.applied = True
+            if job.replaces_data and job.dataset_version != version:
+                job.status = "stale"
+                job.result = None
+                continue
+            if job.on_success is not None:
+                job.on_success(job.result)
+            # Results now live in the session; the job only keeps its summary
+            job.result = None
+            applied.append(job)
+        return applied
+
+    def clear_finished(self):
+        for job_id in [job_id for job_id, job in self.jobs.items() if not job.active]:
+            del self.jobs[job_id]
+
+    def _prune(self):
+        finished = [
+            job_id for job_id, job in self.jobs.items()
+            if not job.active and (job.applied or job.status != "done")
+        ]
+        for job_id in finished[:-MAX_FINISHED_JOBS]:
+            del self.jobs[job_id]
+
+
+def get_job_runner():
+    if "job_runner" not in st.session_state:
+        st.session_state.job_runner = JobRunner()
+    return st.session_state.job_runner
+
+
+def submit_job(label, func, *args, **kwargs):
+    """Shortcut for get_job_runner().submit(...)."""
+    return get_job_runner().submit(label, func, *args, **kwargs)
+
+
+def find_job(key):
+    return get_job_runner().find(key)
+
+
+def apply_finished_jobs():
+    """Call at the top of each page, before anything reads the results."""
+    for job in get_job_runner().apply_finished():
+        st.toast(f"✅ {job.label} finished in {job.elapsed:.1f}s")
+
+
+def _render_job(job):
+    if job.active:
+        text = f"{job.label} — {job.message or job.status}"
+        st.progress(job.progress, text=text)
+        if job.status != "cancelling" and st.button("Cancel", key=f"cancel_job_{job.id}"):
+            job.cancel()
+    elif job.status == "failed":
+        st.error(f"{job.label} failed: {job.error}")
+    elif job.status == "stale":
+        st.warning(f"{job.label} was discarded: the dataset changed while it ran.")
+    elif job.status == "cancelled":
+        st.caption(f"⏹️ {job.label} cancelled")
+    else:
+        st.caption(f"✅ {job.label} ({job.elapsed:.1f}s)")
+
+
+def render_jobs_panel():
+    """Sidebar list of this session's jobs; polls while any job is active."""
+    runner = get_job_runner()
+    if not runner.jobs:
+        return
+
+    polling = runner.has_active()
+
+    @st.fragment(run_every=POLL_SECONDS if polling else None)
+    def jobs_panel():
+        if runner.has_unapplied() or (polling and not runner.has_active()):
+            # A job finished since the last full run; rerun the page so it picks up the result
+            st.rerun()
+        st.markdown("### ⏳ Background Jobs")
+        for job in reversed(runner.jobs.values()):
+            _render_job(job)
+        if not runner.has_active() and st.button("Clear finished", key="clear_finished_jobs"):
+            runner.clear_finished()
+            st.rerun()
+
+    with st.sidebar:
+        jobs_panel()
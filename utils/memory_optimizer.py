@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+# Text columns whose distinct/total ratio is below this become categoricals
+CATEGORY_RATIO = 0.5
+
+INT_CANDIDATES = [np.int8, np.int16, np.int32, np.uint8, np.uint16, np.uint32]
+# Whole-number floats become at least this wide: they never had integer overflow
+# to worry about, and later sums or capping should keep some headroom
+FLOAT_TO_INT_MIN = np.dtype(np.int32)
+ARROW_STRING = "string[pyarrow]"
+
+
+def _smallest_int(col_min, col_max, unsigned=False, min_itemsize=1):
+    """Narrowest integer type holding the range, of the same signedness as the input.
+
+    Signed data never becomes unsigned: arithmetic like `col - 1` would
+    silently wrap around below zero.
+    """
+    kind = np.unsignedinteger if unsigned else np.signedinteger
+    candidates = (t for t in INT_CANDIDATES if np.issubdtype(t, kind) and np.dtype(t).itemsize >= min_itemsize)
+    for candidate in candidates:
+        info = np.iinfo(candidate)
+        if info.min <= col_min and col_max <= info.max:
+            return np.dtype(candidate)
+    return None
+
+
+def _propose(series, category_ratio):
+    """Returns (target dtype, reason) for one column, or (None, reason) to leave it alone."""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return None, "already compact"
+
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        if series.empty:
+            return None, "empty"
+        target = _smallest_int(series.min(), series.max(), unsigned=dtype.kind == "u")
+        if target is not None and target.itemsize < dtype.itemsize:
+            return target, "value range fits"
+        return None, "needs full width"
+
+    if pd.api.types.is_float_dtype(dtype) and dtype == np.float64:
+        values = series.to_numpy()
+        if values.size and not np.isnan(values).any() and np.array_equal(values, np.round(values)):
+            target = _smallest_int(values.min(), values.max(), min_itemsize=FLOAT_TO_INT_MIN.itemsize)
+            if target is not None:
+                return target, "whole numbers without nulls; arithmetic becomes integer (kept at int32 or wider)"
+        if np.array_equal(values.astype(np.float32).astype(np.float64), values, equal_nan=True):
+            return np.dtype(np.float32), "exact in float32"
+        return None, "needs float64 precision"
+
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        non_null = series.count()
+        if non_null == 0:
+            return None, "all missing"
+        if pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+            return None, "mixed types"
+        unique = series.nunique(dropna=True)
+        if unique / non_null < category_ratio:
+            return "category", f"{unique:,} distinct values"
+        if pd.api.types.is_object_dtype(dtype):
+            return ARROW_STRING, "high-cardinality text"
+        return None, "high-cardinality text"
+
+    return None, "unsupported dtype"
+
+
+def analyze_memory(df, category_ratio=CATEGORY_RATIO):
+    """Proposes a dtype per column; returns a plan table with one row per column."""
+    rows = []
+    memory = df.memory_usage(index=False, deep=True)
+    for i, col in enumerate(df.columns):
+        target, reason = _propose(df.iloc[:, i], category_ratio)
+        rows.append({
+            "Column": col,
+            "Current Dtype": str(df.dtypes.iloc[i]),
+            "Proposed Dtype": str(target) if target is not None else "—",
+            "Reason": reason,
+            "Memory Before (MB)": memory.iloc[i] / 1024 ** 2,
+            "Target": target
+        })
+    return pd.DataFrame(rows)
+
+
+def apply_memory_plan(df, plan):
+    """Applies every proposed conversion in a single astype call; returns (new_df, report)."""
+    targets = {col: target for col, target in zip(plan["Column"], plan["Target"]) if target is not None}
+    optimized = df.astype(targets) if targets else df
+
+    report = plan[["Column", "Current Dtype", "Proposed Dtype", "Memory Before (MB)"]].copy()
+    report["Memory After (MB)"] = optimized.memory_usage(index=False, deep=True).to_numpy() / 1024 ** 2
+    report["Saved (%)"] = np.where(
+        report["Memory Before (MB)"] > 0,
+        (1 - report["Memory After (MB)"] / report["Memory Before (MB)"]) * 100,
+        0.0
+    )
+    return optimized, report
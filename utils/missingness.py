@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from utils.profile import get_profile, null_counts
+
+# Row patterns are keyed on one 64-bit word, so they cover the 64 most-missing columns
+MAX_PATTERN_COLUMNS = 64
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words):
+        return _BYTE_COUNTS[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1)
+
+
+def build_null_mask(df):
+    """Null mask of the columns that have missing values, packed 64 rows to a word.
+
+    Columns without missing values are left out, so a wide frame with a few
+    gappy columns costs a few bits per row, not one byte per cell.
+    """
+    counts = null_counts(df) if df.columns.is_unique else df.isna().sum()
+    positions = np.flatnonzero(counts.to_numpy() > 0)
+    words = -(-len(df) // 64)
+    bits = np.zeros((len(positions), words), dtype=np.uint64)
+    for row, i in enumerate(positions):
+        packed = np.packbits(df.iloc[:, i].isna().to_numpy(), bitorder="little")
+        bits[row].view(np.uint8)[:len(packed)] = packed
+    return {"rows": len(df), "columns": df.columns[positions], "bits": bits}
+
+
+def get_null_mask(df):
+    """The frame's packed null mask, built once and kept with its profile."""
+    if not df.columns.is_unique:
+        return build_null_mask(df)
+    profile = get_profile(df)
+    if "null_mask" not in profile:
+        profile["null_mask"] = build_null_mask(df)
+    return profile["null_mask"]
+
+
+def missing_counts(mask):
+    """Missing values per (gappy) column, by popcount."""
+    return pd.Series(_popcount(mask["bits"]).sum(axis=1, dtype=np.int64), index=mask["columns"])
+
+
+def co_missing(mask):
+    """Rows where both columns are missing, for every pair of gappy columns; the diagonal is each column's count."""
+    bits = mask["bits"]
+    size = len(bits)
+    matrix = np.zeros((size, size), dtype=np.int64)
+    for i in range(size):
+        # One vectorized AND + popcount of column i against every later column
+        matrix[i, i:] = _popcount(bits[i:] & bits[i]).sum(axis=1, dtype=np.int64)
+        matrix[i:, i] = matrix[i, i:]
+    return pd.DataFrame(matrix, index=mask["columns"], columns=mask["columns"])
+
+
+def rows_missing_any(mask, columns=None):
+    """Number of rows missing a value in any of the given columns (all gappy columns if None)."""
+    bits = mask["bits"]
+    if columns is not None:
+        bits = bits[mask["columns"].isin(columns)]
+    if len(bits) == 0:
+        return 0
+    return int(_popcount(np.bitwise_or.reduce(bits, axis=0)).sum())
+
+
+def missing_patterns(mask, top=10):
+    """The most frequent row-level missing patterns, with the rows showing each.
+
+    Only rows with at least one missing value are counted; if more than
+    MAX_PATTERN_COLUMNS columns are gappy, the pattern covers the most-missing ones.
+    """
+    bits, columns = mask["bits"], mask["columns"]
+    if len(bits) > MAX_PATTERN_COLUMNS:
+        keep = np.argsort(-_popcount(bits).sum(axis=1), kind="stable")[:MAX_PATTERN_COLUMNS]
+        bits, columns = bits[keep], columns[keep]
+    keys = np.zeros(mask["rows"], dtype=np.uint64)
+    for k in range(len(bits)):
+        column_bits = np.unpackbits(bits[k].view(np.uint8), count=mask["rows"], bitorder="little")
+        keys |= column_bits.astype(np.uint64) << np.uint64(k)
+    counts = pd.Series(keys[keys > 0]).value_counts().head(top)
+
+    rows = []
+    for key, count in counts.items():
+        members = [columns[k] for k in range(len(columns)) if int(key) >> k & 1]
+        rows.append({
+            "Missing Columns": ", ".join(map(str, members)),
+            "Columns": len(members),
+            "Rows": int(count),
+            "% Rows": count / mask["rows"] * 100,
+        })
+    return pd.DataFrame(rows, columns=["Missing Columns", "Columns", "Rows", "% Rows"])
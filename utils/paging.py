@@ -0,0 +1,257 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.frame_refs import frame_ref, same_frame
+
+# Frames with more columns than this switch to searchable, paged column widgets
+WIDE_DATA_THRESHOLD = 200
+COLUMN_PAGE_SIZE = 50
+ROW_PAGE_SIZES = [25, 50, 100, 500]
+NO_SORT = "(no sorting)"
+NO_FILTER = "(no filter)"
+
+
+def is_wide(df):
+    """Returns True when the frame has too many columns for plain widgets."""
+    return df.shape[1] > WIDE_DATA_THRESHOLD
+
+
+def _filter_columns(columns, query):
+    columns = list(columns)
+    query = query.strip().lower()
+    if not query:
+        return columns
+    return [c for c in columns if query in str(c).lower()]
+
+
+def _page_controls(total, page_size, key, label="Page"):
+    """Renders a page number input and returns the (start, stop) slice for it."""
+    n_pages = max(1, math.ceil(total / page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    page = st.number_input(
+        f"{label} (of {n_pages})",
+        min_value=1,
+        max_value=n_pages,
+        step=1,
+        key=page_key
+    )
+    start = (int(page) - 1) * page_size
+    return start, min(start + page_size, total)
+
+
+def _column_page(columns, key, page_size):
+    """Search box plus pager; returns the visible slice of matching columns."""
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        query = st.text_input("🔎 Search columns", key=f"{key}_search")
+    matches = _filter_columns(columns, query)
+    with col2:
+        start, stop = _page_controls(len(matches), page_size, key)
+    st.caption(f"{len(matches):,} matching columns, showing {start + 1 if matches else 0}–{stop}")
+    return matches[start:stop]
+
+
+def _sync_choice(widget_key, value_key):
+    st.session_state[value_key] = st.session_state[widget_key]
+
+
+def column_selectbox(label, columns, key, help=None, page_size=COLUMN_PAGE_SIZE):
+    """Selectbox that only ships one searchable page of options when the list is long."""
+    columns = list(columns)
+    if len(columns) <= WIDE_DATA_THRESHOLD:
+        return st.selectbox(label, columns, key=key, help=help)
+
+    st.markdown(f"**{label}**")
+    visible = _column_page(columns, key, page_size)
+
+    # The choice lives in its own entry so it survives paging; the widget key
+    # stays the same whatever page is shown
+    widget_key, value_key = f"{key}_choice", f"{key}_value"
+    current = st.session_state.get(value_key)
+    if current not in columns:
+        current = columns[0]
+        st.session_state[value_key] = current
+    # Keep the current choice selectable even when it is not on the visible page
+    options = visible if current in visible else [current] + visible
+    st.session_state[widget_key] = current
+    return st.selectbox(
+        label,
+        options,
+        key=widget_key,
+        on_change=_sync_choice,
+        args=(widget_key, value_key),
+        help=help,
+        label_visibility="collapsed"
+    )
+
+
+def _sync_selection(widget_key, value_key, shown_key):
+    """Replaces the part of the selection on the page that was shown with the widget's value."""
+    shown = set(st.session_state[shown_key])
+    kept = [c for c in st.session_state[value_key] if c not in shown]
+    st.session_state[value_key] = kept + list(st.session_state[widget_key])
+
+
+def column_multiselect(label, columns, key, default=None, help=None, page_size=COLUMN_PAGE_SIZE):
+    """Multiselect counterpart of column_selectbox; selections persist across pages.
+
+    Only the visible page is offered as options; choices on other pages are
+    kept in session state and included in the returned list.
+    """
+    columns = list(columns)
+    if len(columns) <= WIDE_DATA_THRESHOLD:
+        return st.multiselect(label, columns, default=default, key=key, help=help)
+
+    st.markdown(f"**{label}**")
+    visible = _column_page(columns, key, page_size)
+
+    widget_key, value_key, shown_key = f"{key}_choice", f"{key}_value", f"{key}_shown"
+    known = set(columns)
+    selected = [c for c in st.session_state.get(value_key, default or []) if c in known]
+    st.session_state[value_key] = selected
+    st.session_state[shown_key] = visible
+    visible_set = set(visible)
+    st.session_state[widget_key] = [c for c in selected if c in visible_set]
+    st.multiselect(
+        label,
+        visible,
+        key=widget_key,
+        on_change=_sync_selection,
+        args=(widget_key, value_key, shown_key),
+        help=help,
+        label_visibility="collapsed"
+    )
+    st.caption(f"{len(selected):,} columns selected")
+    return selected
+
+
+def paged_column_table(df, build_table, key, page_size=COLUMN_PAGE_SIZE):
+    """Renders build_table(df) but only evaluates it for the visible page of columns."""
+    if df.shape[1] <= WIDE_DATA_THRESHOLD:
+        st.dataframe(build_table(df), use_container_width=True)
+        return
+
+    visible = _column_page(df.columns, key, page_size)
+    if not visible:
+        st.info("No columns match the search.")
+        return
+    st.dataframe(build_table(df[visible]), use_container_width=True)
+
+
+def _row_index(df):
+    """Returns the per-frame lookup structures, rebuilt only when the frame changes."""
+    cache = st.session_state.get("_row_index_cache")
+    if cache is None or not same_frame(cache["ref"], df):
+        cache = {"ref": frame_ref(df), "order": {}, "groups": {}}
+        st.session_state["_row_index_cache"] = cache
+    return cache
+
+
+def _sort_order(df, col, ascending):
+    """Row positions of df sorted by col (nulls last), cached per frame and direction."""
+    cache = _row_index(df)["order"]
+    if (col, ascending) not in cache:
+        values = df[col].reset_index(drop=True)
+        try:
+            ordered = values.sort_values(ascending=ascending, kind="stable", na_position="last")
+        except TypeError:
+            ordered = values.astype(str).where(values.notna()).sort_values(
+                ascending=ascending, kind="stable", na_position="last"
+            )
+        cache[(col, ascending)] = ordered.index.to_numpy()
+    return cache[(col, ascending)]
+
+
+def _value_positions(df, col, value):
+    """Row positions where str(df[col]) == value, served from a cached group index."""
+    cache = _row_index(df)["groups"]
+    if col not in cache:
+        values = df[col].reset_index(drop=True)
+        groups = values.groupby(values.astype(str), sort=False).indices
+        cache[col] = {key: np.asarray(pos) for key, pos in groups.items()}
+    return cache[col].get(value, np.empty(0, dtype=np.intp))
+
+
+def _range_positions(df, col, low, high):
+    """Row positions with low <= df[col] <= high, via binary search on the cached sort order."""
+    order = _sort_order(df, col, True)
+    values = df[col].to_numpy()[order]
+    valid = int(df[col].notna().sum())
+    start = np.searchsorted(values[:valid], low, side="left")
+    stop = np.searchsorted(values[:valid], high, side="right")
+    return order[start:stop]
+
+
+def _filter_controls(df, key):
+    """Renders the filter widgets and returns matching row positions, or None when unfiltered."""
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        filter_col = column_selectbox("Filter column", [NO_FILTER] + list(df.columns), key=f"{key}_filter_col")
+    if filter_col == NO_FILTER:
+        return None
+
+    series = df[filter_col]
+    with col2:
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            if series.notna().sum() == 0:
+                return np.empty(0, dtype=np.intp)
+            low_col, high_col = st.columns(2)
+            low = low_col.number_input("Min", value=float(series.min()), key=f"{key}_filter_min_{filter_col}")
+            high = high_col.number_input("Max", value=float(series.max()), key=f"{key}_filter_max_{filter_col}")
+            return _range_positions(df, filter_col, low, high)
+        value = st.text_input("Equals", key=f"{key}_filter_value_{filter_col}")
+        if not value:
+            return None
+        return _value_positions(df, filter_col, value)
+
+
+def paged_dataframe(df, key, mask=None, page_size=None):
+    """Displays df one page at a time with sort and filter, sending only the visible rows.
+
+    mask optionally restricts the view to a boolean subset of df's rows (e.g. outliers).
+    Sort orders and value lookups are built once per frame and reused across reruns.
+    """
+    n_rows = len(df)
+    wanted = None if mask is None else np.asarray(mask, dtype=bool)
+
+    with st.expander("↕️ Sort & filter", expanded=False):
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            sort_col = column_selectbox("Sort by", [NO_SORT] + list(df.columns), key=f"{key}_sort_col")
+        with col2:
+            ascending = st.radio(
+                "Order", ["Ascending", "Descending"], horizontal=True, key=f"{key}_sort_dir"
+            ) == "Ascending"
+        with col3:
+            if page_size is None:
+                page_size = st.selectbox("Rows per page", ROW_PAGE_SIZES, index=1, key=f"{key}_page_size")
+        filtered = _filter_controls(df, key)
+
+    if filtered is not None:
+        keep = np.zeros(n_rows, dtype=bool)
+        keep[filtered] = True
+        wanted = keep if wanted is None else wanted & keep
+
+    if sort_col != NO_SORT:
+        positions = _sort_order(df, sort_col, ascending)
+        if wanted is not None:
+            positions = positions[wanted[positions]]
+    elif wanted is not None:
+        positions = np.flatnonzero(wanted)
+    else:
+        positions = None
+
+    total = n_rows if positions is None else len(positions)
+    if total == 0:
+        st.info("No rows to display.")
+        return
+
+    start, stop = _page_controls(total, page_size, key)
+    page = df.iloc[start:stop] if positions is None else df.iloc[positions[start:stop]]
+    st.dataframe(page, use_container_width=True)
+    st.caption(f"Showing rows {start + 1:,}–{stop:,} of {total:,}")
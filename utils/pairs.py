@@ -0,0 +1,138 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from matplotlib import colormaps
+from PIL import Image, ImageDraw
+
+DENSITY_BINS = 24
+THUMBNAIL_PIXELS = 144
+PAIR_CHUNK_ROWS = 65536
+THUMBNAIL_WORKERS = int(os.environ.get("AUTO_EDA_THUMBNAIL_WORKERS", 4))
+
+
+def bivariate_columns(df):
+    """Numeric columns offered by the bivariate section."""
+    return df.select_dtypes(include=["float", "int"]).columns.tolist()
+
+
+def pair_statistics(df, columns, chunk_rows=PAIR_CHUNK_ROWS):
+    """Pearson r, OLS trend and overlap count for every pair of numeric columns.
+
+    Uses pairwise-complete rows like DataFrame.corr(), but all pairs come out
+    of a handful of matrix products instead of one pass per pair. The sums
+    are accumulated over chunks of chunk_rows rows, so temporary memory does
+    not grow with the frame. Returns one row per pair (x before y in column order).
+    """
+    means = np.nan_to_num(np.array([df[col].mean() for col in columns], dtype="float64"))
+    size = len(columns)
+    n, sx, sxx, sxy = (np.zeros((size, size)) for _ in range(4))
+    for start in range(0, len(df), chunk_rows):
+        values = df.iloc[start:start + chunk_rows][columns].to_numpy(dtype="float64", na_value=np.nan)
+        present = ~np.isnan(values)
+        # Centering first keeps the sums of squares from cancelling on large-magnitude columns
+        centered = np.where(present, values - means, 0.0)
+        mask = present.astype("float64")
+        n += mask.T @ mask                  # rows where both columns are present
+        sx += centered.T @ mask             # sum of x over those rows
+        sxx += (centered ** 2).T @ mask
+        sxy += centered.T @ centered
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = n * sxy - sx * sx.T
+        var_x = n * sxx - sx ** 2
+        var_y = var_x.T
+        r = cov / np.sqrt(var_x * var_y)
+        slope = cov / var_x                 # y on x, for row x / column y
+        mean_x = means[:, None] + sx / n
+        mean_y = means[None, :] + sx.T / n
+        intercept = mean_y - slope * mean_x
+
+    i, j = np.triu_indices(size, k=1)
+    return pd.DataFrame({
+        "x": np.asarray(columns, dtype=object)[i],
+        "y": np.asarray(columns, dtype=object)[j],
+        "r": r[i, j],
+        "slope": slope[i, j],
+        "intercept": intercept[i, j],
+        "n": n[i, j].astype(np.int64),
+    })
+
+
+def correlation_matrix(stats, columns):
+    """Square Pearson matrix (like DataFrame.corr()) assembled from pair_statistics() rows."""
+    index = pd.Index(list(columns))
+    i, j = index.get_indexer(stats["x"]), index.get_indexer(stats["y"])
+    values = np.eye(len(index))
+    values[i, j] = values[j, i] = stats["r"].to_numpy()
+    return pd.DataFrame(values, index=index, columns=index)
+
+
+def top_pairs(stats, k):
+    """The k pairs with the strongest correlation in either direction."""
+    order = stats["r"].abs().sort_values(ascending=False, na_position="last").index
+    return stats.loc[order[:k]].reset_index(drop=True)
+
+
+def bin_codes(df, columns, bins=DENSITY_BINS):
+    """Each column mapped once to equal-width bin codes over its range; -1 marks missing values."""
+    codes = {}
+    for col in columns:
+        values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        finite = np.isfinite(values)
+        low, high = (values[finite].min(), values[finite].max()) if finite.any() else (0.0, 1.0)
+        scale = bins / (high - low) if high > low else 0.0
+        code = np.full(len(values), -1, dtype=np.int32)
+        code[finite] = np.minimum(((values[finite] - low) * scale).astype(np.int32), bins - 1)
+        codes[col] = (code, low, high)
+    return codes
+
+
+def pair_density(codes, x, y, bins=DENSITY_BINS):
+    """2D histogram of a pair from the precomputed bin codes, as a (y, x) grid."""
+    code_x, code_y = codes[x][0], codes[y][0]
+    both = (code_x >= 0) & (code_y >= 0)
+    counts = np.bincount(code_y[both] * bins + code_x[both], minlength=bins * bins)
+    return counts.reshape(bins, bins)
+
+
+def render_thumbnail(density, x_range, y_range, row, size=THUMBNAIL_PIXELS):
+    """PNG bytes of one pair: log-scaled density with the trend line drawn over it.
+
+    Drawn with NumPy and PIL rather than a matplotlib figure, which costs
+    tens of milliseconds per thumbnail in layout alone.
+    """
+    shade = np.log1p(density)
+    if shade.max() > 0:
+        shade = shade / shade.max()
+    # Row 0 of the grid is the lowest y bin; images start at the top
+    rgb = (colormaps["Purples"](shade[::-1])[..., :3] * 255).astype(np.uint8)
+    image = Image.fromarray(rgb).resize((size, size), Image.NEAREST)
+
+    (x0, x1), (y0, y1) = x_range, y_range
+    if np.isfinite(row["slope"]) and x1 > x0 and y1 > y0:
+        def to_pixels(x, y):
+            return (x - x0) / (x1 - x0) * size, size - (y - y0) / (y1 - y0) * size
+        line = [to_pixels(x, row["intercept"] + row["slope"] * x) for x in (x0, x1)]
+        ImageDraw.Draw(image).line(line, fill="#f5576c", width=2)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def render_thumbnails(df, pairs, bins=DENSITY_BINS):
+    """Thumbnails for the given pair rows, rendered in parallel; returns PNG bytes in pair order.
+
+    Every column is binned once and shared by all of its pairs.
+    """
+    columns = list(dict.fromkeys(list(pairs["x"]) + list(pairs["y"])))
+    codes = bin_codes(df, columns, bins)
+
+    def render(row):
+        density = pair_density(codes, row["x"], row["y"], bins)
+        return render_thumbnail(density, codes[row["x"]][1:], codes[row["y"]][1:], row)
+
+    with ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS) as pool:
+        return list(pool.map(render, [row for _, row in pairs.iterrows()]))
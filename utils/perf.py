@@ -0,0 +1,182 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pandas as pd
+import streamlit as st
+
+# Set AUTO_EDA_PERF_LOG to a file path to append one JSON line per rerun
+PERF_LOG_PATH = os.environ.get("AUTO_EDA_PERF_LOG")
+
+_local = threading.local()
+_log_lock = threading.Lock()
+_cache_lock = threading.Lock()
+CACHE_STATS = {"calls": Counter(), "misses": Counter()}
+
+
+def _rss_mb():
+    """Current resident set size in MB, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _current_run():
+    return getattr(_local, "run", None)
+
+
+def start_run(page):
+    """Begins collecting spans for this script run; call at the top of each page."""
+    previous = _current_run()
+    if previous is not None:
+        # A run on this thread was cut short by st.rerun()/st.stop(); keep it anyway
+        _finish(previous, interrupted=True)
+    _local.run = {
+        "page": page,
+        "session": st.session_state.setdefault("perf_session_id", os.urandom(6).hex()),
+        "started": time.perf_counter(),
+        "rss_start": _rss_mb(),
+        "spans": [],
+        "cache": Counter(),
+        "depth": 0,
+    }
+
+
+def finish_run():
+    """Closes the current run, stores it for the sidebar panel and appends it to the log."""
+    run = _current_run()
+    if run is not None:
+        _finish(run, interrupted=False)
+
+
+def _finish(run, interrupted):
+    _local.run = None
+    rss_end = _rss_mb()
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "session": run["session"],
+        "page": run["page"],
+        "interrupted": interrupted,
+        "total_ms": round((time.perf_counter() - run["started"]) * 1000, 3),
+        "rss_mb": round(rss_end, 1) if rss_end is not None else None,
+        "rss_delta_mb": round(rss_end - run["rss_start"], 1) if rss_end is not None and run["rss_start"] is not None else None,
+        "spans": run["spans"],
+        "cache": dict(run["cache"]),
+    }
+    try:
+        st.session_state.perf_last_run = record
+    except Exception:
+        pass
+    if PERF_LOG_PATH:
+        os.makedirs(os.path.dirname(PERF_LOG_PATH) or ".", exist_ok=True)
+        with _log_lock, open(PERF_LOG_PATH, "a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+
+@contextmanager
+def span(name):
+    """Times a block (wall clock and RSS change) within the current run; a no-op outside one."""
+    run = _current_run()
+    if run is None:
+        yield
+        return
+    entry = {"name": name, "depth": run["depth"]}
+    run["spans"].append(entry)
+    run["depth"] += 1
+    rss_before = _rss_mb()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry["ms"] = round((time.perf_counter() - start) * 1000, 3)
+        rss_after = _rss_mb()
+        if rss_before is not None and rss_after is not None:
+            entry["rss_delta_mb"] = round(rss_after - rss_before, 1)
+        run["depth"] -= 1
+
+
+def timed(func=None, name=None):
+    """Decorator form of span(); defaults to the function's qualified name."""
+    if func is None:
+        return functools.partial(timed, name=name)
+    label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with span(label):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _count(kind, name):
+    with _cache_lock:
+        CACHE_STATS[kind][name] += 1
+    run = _current_run()
+    if run is not None:
+        run["cache"][f"{name}:{kind}"] += 1
+
+
+def cache_data(func=None, **cache_kwargs):
+    """st.cache_data with hit/miss counters and a timing span around each call."""
+    if func is None:
+        return functools.partial(cache_data, **cache_kwargs)
+    name = func.__name__
+
+    @functools.wraps(func)
+    def on_miss(*args, **kwargs):
+        _count("misses", name)
+        return func(*args, **kwargs)
+
+    cached = st.cache_data(on_miss, **cache_kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _count("calls", name)
+        with span(f"cache.{name}"):
+            return cached(*args, **kwargs)
+
+    wrapper.clear = cached.clear
+    return wrapper
+
+
+def cache_summary():
+    """Process-wide calls, misses and hit rate per cached function."""
+    with _cache_lock:
+        rows = [
+            {
+                "Function": name,
+                "Calls": calls,
+                "Misses": CACHE_STATS["misses"][name],
+                "Hit Rate": 1 - CACHE_STATS["misses"][name] / calls if calls else 0.0,
+            }
+            for name, calls in CACHE_STATS["calls"].items()
+        ]
+    return pd.DataFrame(rows, columns=["Function", "Calls", "Misses", "Hit Rate"])
+
+
+def render_perf_panel():
+    """Sidebar breakdown of the previous rerun, shown when the user opts in."""
+    with st.sidebar:
+        if not st.checkbox("⏱️ Show performance panel", key="perf_panel_enabled"):
+            return
+        record = st.session_state.get("perf_last_run")
+        if not record:
+            st.caption("No completed rerun recorded yet.")
+            return
+        st.markdown(f"**Last rerun:** {record['total_ms']:.0f} ms on `{record['page']}`")
+        if record["rss_delta_mb"] is not None:
+            st.caption(f"RSS {record['rss_mb']:.0f} MB ({record['rss_delta_mb']:+.1f} MB this rerun)")
+        if record["spans"]:
+            spans = pd.DataFrame(record["spans"])
+            spans["name"] = ["  " * depth + name for depth, name in zip(spans["depth"], spans["name"])]
+            st.dataframe(spans.drop(columns="depth"), use_container_width=True, hide_index=True)
+        st.markdown("**Cache hit rates (process)**")
+        st.dataframe(cache_summary(), use_container_width=True, hide_index=True)
@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.density import fine_histogram
+from utils.frame_refs import frame_ref, resolve, same_frame
+
+ORDER_STATS = ["min", "25%", "50%", "75%", "max"]
+QUANTILES = [0.0, 0.25, 0.5, 0.75, 1.0]
+PROFILE_COLUMNS = ["dtype", "numeric", "count", "nulls", "shift", "s1", "s2"] + ORDER_STATS + ["order_stale"]
+
+
+def _numeric_values(series):
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _is_numeric(series):
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+def _profile_columns(df):
+    """Full statistics for every column of df; one row per column."""
+    stats = pd.DataFrame(index=df.columns, columns=PROFILE_COLUMNS, dtype=object)
+    stats["dtype"] = df.dtypes.astype(str).to_numpy()
+    stats["count"] = df.count().to_numpy()
+    stats["nulls"] = len(df) - stats["count"]
+    stats["numeric"] = [_is_numeric(df.iloc[:, i]) for i in range(df.shape[1])]
+    stats["order_stale"] = False
+    for i in np.flatnonzero(stats["numeric"].to_numpy(dtype=bool)):
+        values = _numeric_values(df.iloc[:, i])
+        valid = values[~np.isnan(values)]
+        # Power sums are kept around a per-column shift so removing rows later
+        # does not suffer from cancellation on large-magnitude columns
+        shift = float(valid.mean()) if valid.size else 0.0
+        centered = valid - shift
+        stats.iloc[i, stats.columns.get_indexer(["shift", "s1", "s2"])] = [shift, centered.sum(), (centered ** 2).sum()]
+        order = np.quantile(valid, QUANTILES) if valid.size else [np.nan] * len(QUANTILES)
+        stats.iloc[i, stats.columns.get_indexer(ORDER_STATS)] = list(order)
+    return stats
+
+
+def build_profile(df):
+    # value_counts and histograms are filled lazily, one column at a time
+    return {"rows": len(df), "stats": _profile_columns(df), "value_counts": {}, "histograms": {}}
+
+
+def _removed_rows(old_df, new_df):
+    """Rows of old_df that new_df dropped, or None if new_df is not a row subset of old_df."""
+    if not (old_df.index.is_unique and new_df.index.is_unique):
+        return None
+    if len(new_df) == len(old_df) and new_df.index.equals(old_df.index):
+        return old_df.iloc[:0]
+    if not new_df.index.isin(old_df.index).all():
+        return None
+    return old_df.loc[old_df.index.difference(new_df.index, sort=False)]
+
+
+def update_profile(profile, old_df, new_df, changed_columns):
+    """Applies the delta between old_df and new_df to profile; returns None if a full rebuild is needed.
+
+    Dropped rows are subtracted from the counts and power sums of every column,
+    dropped columns are removed and only changed_columns are recomputed.
+    Quantiles and extremes cannot be maintained under deletion, so they are
+    only marked stale for columns that lost a non-null value. Cached value
+    counts and histograms of untouched columns have the dropped rows' counts
+    subtracted; histogram edges keep spanning the old range.
+    """
+    if not (old_df.columns.is_unique and new_df.columns.is_unique):
+        return None
+    if not set(new_df.columns) <= set(old_df.columns) or not set(changed_columns) <= set(new_df.columns):
+        return None
+    removed = _removed_rows(old_df, new_df)
+    if removed is None:
+        return None
+
+    kept = [col for col in new_df.columns if col not in set(changed_columns)]
+    stats = profile["stats"].loc[kept].copy()
+    counts = {col: vc for col, vc in profile["value_counts"].items() if col in set(kept)}
+    histograms = {col: hist for col, hist in profile["histograms"].items() if col in set(kept)}
+    if len(removed):
+        removed = removed[kept]
+        removed_counts = removed.count().to_numpy()
+        stats["count"] = stats["count"].to_numpy() - removed_counts
+        stats["nulls"] = stats["nulls"].to_numpy() - (len(removed) - removed_counts)
+        for i in np.flatnonzero(stats["numeric"].to_numpy(dtype=bool)):
+            values = _numeric_values(removed.iloc[:, i])
+            centered = values[~np.isnan(values)] - stats.iat[i, stats.columns.get_loc("shift")]
+            if centered.size:
+                stats.iat[i, stats.columns.get_loc("s1")] -= centered.sum()
+                stats.iat[i, stats.columns.get_loc("s2")] -= (centered ** 2).sum()
+                stats.iat[i, stats.columns.get_loc("order_stale")] = True
+        for col, vc in counts.items():
+            vc = vc.sub(removed[col].value_counts(), fill_value=0)
+            counts[col] = vc[vc > 0].astype("int64").sort_values(ascending=False, kind="stable")
+        for col, hist in histograms.items():
+            if hist is not None:
+                values = _numeric_values(removed[col])
+                dropped, _ = np.histogram(values[np.isfinite(values)], bins=hist[1])
+                hist = (hist[0] - dropped, hist[1])
+                histograms[col] = hist if hist[0].sum() else None
+
+    if changed_columns:
+        stats = pd.concat([stats, _profile_columns(new_df[list(changed_columns)])])
+    return {
+        "rows": len(new_df),
+        "stats": stats.loc[new_df.columns],
+        "value_counts": counts,
+        "histograms": histograms
+    }
+
+
+def _cache():
+    return st.session_state.get("_profile_cache")
+
+
+def get_profile(df):
+    """Profile of df, reused across reruns while df is the same frame object."""
+    cache = _cache()
+    if cache is None or not same_frame(cache["ref"], df):
+        cache = {"ref": frame_ref(df), "profile": build_profile(df)}
+        st.session_state["_profile_cache"] = cache
+    return cache["profile"]
+
+
+def seed_profile(df, profile):
+    """Installs a profile of df built off the script thread, keeping whatever is already cached for df."""
+    cache = _cache()
+    if cache is not None and same_frame(cache["ref"], df):
+        for part in ("value_counts", "histograms"):
+            for col, value in profile[part].items():
+                cache["profile"][part].setdefault(col, value)
+        return
+    st.session_state["_profile_cache"] = {"ref": frame_ref(df), "profile": profile}
+
+
+def carried_profile(new_df, changed_columns):
+    """The cached profile moved over to new_df, the frame replacing the profiled one.
+
+    Returns None when it cannot be carried, including with changed_columns=None
+    (unknown); the next get_profile() call then rebuilds it from scratch.
+    """
+    cache = _cache()
+    if cache is None or new_df is None or changed_columns is None:
+        return None
+    old_df = resolve(cache["ref"])
+    if old_df is None:
+        return None
+    return update_profile(cache["profile"], old_df, new_df, changed_columns)
+
+
+def keep_profile(df, profile):
+    """Caches profile as the profile of df, the new working frame; None drops the cache."""
+    if profile is None or df is None:
+        st.session_state.pop("_profile_cache", None)
+    else:
+        st.session_state["_profile_cache"] = {"ref": frame_ref(df), "profile": profile}
+
+
+def _refresh_order_stats(df, profile, columns):
+    stats = profile["stats"]
+    stale = [col for col in columns if stats.at[col, "order_stale"]]
+    for col in stale:
+        values = _numeric_values(df[col])
+        valid = values[~np.isnan(values)]
+        order = np.quantile(valid, QUANTILES) if valid.size else [np.nan] * len(QUANTILES)
+        stats.loc[col, ORDER_STATS] = list(order)
+        stats.at[col, "order_stale"] = False
+
+
+def null_counts(df):
+    """Missing values per column."""
+    return get_profile(df)["stats"]["nulls"].astype("int64")
+
+
+def value_counts(df, col):
+    """df[col].value_counts(), computed once per column and kept with the profile."""
+    if not df.columns.is_unique:
+        return df[col].value_counts()
+    counts = get_profile(df)["value_counts"]
+    if col not in counts:
+        counts[col] = df[col].value_counts()
+    return counts[col]
+
+
+def histogram(df, col):
+    """Fine-grained (counts, edges) of a numeric column, computed once; None if it has no finite values."""
+    if not df.columns.is_unique:
+        return fine_histogram(_numeric_values(df[col]))
+    histograms = get_profile(df)["histograms"]
+    if col not in histograms:
+        histograms[col] = fine_histogram(_numeric_values(df[col]))
+    return histograms[col]
+
+
+def non_null_counts(df):
+    return get_profile(df)["stats"]["count"].astype("int64")
+
+
+def describe(df, columns=None):
+    """Equivalent of df.describe() for the numeric columns, served from the profile."""
+    if not df.columns.is_unique:
+        return df[columns].describe() if columns is not None else df.describe()
+    profile = get_profile(df)
+    stats = profile["stats"]
+    numeric = [col for col in (columns if columns is not None else df.columns) if stats.at[col, "numeric"]]
+    if not numeric:
+        return df[columns].describe() if columns is not None else df.describe()
+    _refresh_order_stats(df, profile, numeric)
+
+    rows = stats.loc[numeric]
+    n = rows["count"].astype("float64")
+    s1 = rows["s1"].astype("float64")
+    s2 = rows["s2"].astype("float64")
+    mean = rows["shift"].astype("float64") + s1 / n.where(n > 0)
+    variance = (s2 - s1 ** 2 / n.where(n > 0)) / (n - 1).where(n > 1)
+    table = pd.DataFrame({
+        "count": n,
+        "mean": mean,
+        "std": np.sqrt(variance.clip(lower=0)),
+        **{stat: rows[stat].astype("float64") for stat in ORDER_STATS}
+    })
+    return table.T
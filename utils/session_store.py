@@ -0,0 +1,302 @@
+import os
+import pickle
+import shutil
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import streamlit as st
+
+from utils.profile import carried_profile, keep_profile
+
+# The spill backend is opt-in: set AUTO_EDA_SPILL_DIR to enable it.
+SPILL_ROOT = os.environ.get("AUTO_EDA_SPILL_DIR")
+SESSION_BUDGET_BYTES = int(float(os.environ.get("AUTO_EDA_SESSION_BUDGET_MB", 512)) * 1024 ** 2)
+GLOBAL_BUDGET_BYTES = int(float(os.environ.get("AUTO_EDA_GLOBAL_BUDGET_MB", 4096)) * 1024 ** 2)
+SESSION_IDLE_SECONDS = int(os.environ.get("AUTO_EDA_SESSION_IDLE_SECONDS", 6 * 3600))
+
+NPY_KINDS = "biufcmM"
+
+
+def _column_kind(series):
+    """Picks the on-disk layout for a column: mmap-able .npy or an Arrow IPC file."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in NPY_KINDS:
+        return "npy"
+    return "arrow"
+
+
+def _write_column(series, path_base):
+    kind = _column_kind(series)
+    if kind == "npy":
+        np.save(path_base + ".npy", series.to_numpy())
+        return kind
+    try:
+        table = pa.Table.from_pandas(series.to_frame(name="values"), preserve_index=False)
+        feather.write_feather(table, path_base + ".arrow", compression="uncompressed")
+        return "arrow"
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns have no Arrow type
+        series.reset_index(drop=True).to_pickle(path_base + ".pkl")
+        return "pickle"
+
+
+def _read_column(kind, path_base):
+    if kind == "npy":
+        return np.load(path_base + ".npy", mmap_mode="r")
+    if kind == "arrow":
+        return feather.read_table(path_base + ".arrow", memory_map=True).to_pandas()["values"]
+    return pd.read_pickle(path_base + ".pkl")
+
+
+def _nbytes(values):
+    if isinstance(values, np.memmap):
+        return 0
+    if isinstance(values, pd.Series):
+        return int(values.memory_usage(index=False, deep=True))
+    return int(values.nbytes)
+
+
+class SessionDataStore:
+    """Working dataset of one session, kept in memory or spilled to per-column files.
+
+    Numeric columns are memory-mapped from .npy files and cost no resident memory
+    until the OS pages them in. Other columns are Arrow IPC files that are loaded
+    lazily on first use and tracked in an LRU so the session stays within budget.
+    """
+
+    def __init__(self, session_id, root):
+        self.session_id = session_id
+        self.directory = os.path.join(root, session_id)
+        self.lock = threading.RLock()
+        self.last_used = time.time()
+        self.version = 0
+        self._frame = None
+        self._frame_bytes = 0
+        self._meta = None
+        self._loaded = OrderedDict()
+        self._issued = []
+        # Removes the spill files once the session that owns the store is gone
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.directory, ignore_errors=True)
+
+    @property
+    def resident_bytes(self):
+        with self.lock:
+            if self._frame is not None:
+                return self._frame_bytes
+            return sum(nbytes for _, nbytes in self._loaded.values())
+
+    @property
+    def spilled(self):
+        return self._meta is not None
+
+    def _version_dir(self, version):
+        return os.path.join(self.directory, f"v{version}")
+
+    def put(self, df):
+        """Replaces the working dataset; spills straight to disk if it exceeds the session budget."""
+        with self.lock:
+            self.last_used = time.time()
+            self.version += 1
+            self._drop_spill_files()
+            frame_bytes = int(df.memory_usage(deep=True).sum()) if df is not None else 0
+            self._frame, self._frame_bytes, self._meta = df, frame_bytes, None
+            self._loaded.clear()
+            self._issued = []
+            if df is not None:
+                self._issue(df)
+            if df is not None and frame_bytes > SESSION_BUDGET_BYTES:
+                self.spill()
+
+    def spill(self):
+        """Writes the in-memory frame to per-column files and keeps only lazy views."""
+        with self.lock:
+            if self._frame is None or self._meta is not None:
+                return
+            df = self._frame
+            directory = self._version_dir(self.version)
+            os.makedirs(directory, exist_ok=True)
+            kinds = [_write_column(df.iloc[:, i], os.path.join(directory, f"c{i}")) for i in range(df.shape[1])]
+            if isinstance(df.index, pd.RangeIndex):
+                index = ("range", df.index.start, df.index.stop, df.index.step, df.index.name)
+            else:
+                index = ("column", _write_column(df.index.to_series(), os.path.join(directory, "index")), df.index.name)
+            meta = {"columns": df.columns, "kinds": kinds, "dtypes": list(df.dtypes), "index": index}
+            with open(os.path.join(directory, "meta.pkl"), "wb") as f:
+                pickle.dump(meta, f)
+            self._frame, self._frame_bytes, self._meta = None, 0, meta
+            self._loaded.clear()
+
+    def _drop_spill_files(self):
+        if self._meta is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _column(self, position):
+        if position in self._loaded:
+            self._loaded.move_to_end(position)
+            return self._loaded[position][0]
+        values = _read_column(self._meta["kinds"][position], os.path.join(self._version_dir(self.version), f"c{position}"))
+        if self._meta["dtypes"][position] == object and values.dtype != object:
+            # Arrow reads plain object string columns back as the string dtype
+            values = values.astype(object)
+        self._loaded[position] = (values, _nbytes(values))
+        return values
+
+    def _enforce_session_budget(self, keep):
+        # Drop least recently used materialized columns that the current request does not need
+        total = self.resident_bytes
+        for position in list(self._loaded):
+            if total <= SESSION_BUDGET_BYTES:
+                break
+            if position not in keep:
+                total -= self._loaded.pop(position)[1]
+
+    def _index(self):
+        index = self._meta["index"]
+        if index[0] == "range":
+            return pd.RangeIndex(index[1], index[2], index[3], name=index[4])
+        values = _read_column(index[1], os.path.join(self._version_dir(self.version), "index"))
+        return pd.Index(np.asarray(values), name=index[2])
+
+    def _issue(self, df):
+        self._issued = [ref for ref in self._issued if ref() is not None] + [weakref.ref(df)]
+        return df
+
+    def issued(self, df, version):
+        """Whether df is a full frame this store handed out for the given version."""
+        with self.lock:
+            return version == self.version and any(ref() is df for ref in self._issued)
+
+    def frame(self, columns=None):
+        """Returns the working frame, or only the requested columns, loading them lazily.
+
+        Full frames are remembered weakly (see issued()), so caches can tell
+        them apart from other frames even when every call assembles a new one.
+        """
+        with self.lock:
+            self.last_used = time.time()
+            if self._frame is not None:
+                return self._issue(self._frame) if columns is None else self._frame[columns]
+            if self._meta is None:
+                return None
+
+            names = self._meta["columns"]
+            if columns is None:
+                positions = range(len(names))
+            else:
+                wanted = set(columns)
+                positions = [i for i, name in enumerate(names) if name in wanted]
+
+            positions = list(positions)
+            data = {}
+            for i in positions:
+                values = self._column(i)
+                data[i] = values.reset_index(drop=True) if isinstance(values, pd.Series) else values
+            self._enforce_session_budget(set(positions))
+            df = pd.DataFrame(data, copy=False)
+            df.index = self._index()
+            df.columns = names[positions]
+
+            frame_bytes = sum(self._loaded[i][1] if i in self._loaded else _nbytes(data[i]) for i in positions)
+            if columns is None and frame_bytes <= SESSION_BUDGET_BYTES:
+                # Cache the assembled frame so reruns see the same object
+                self._frame, self._frame_bytes = df, frame_bytes
+                self._loaded.clear()
+            return self._issue(df) if columns is None else df
+
+    def release(self):
+        """Drops everything held in memory; spilled files stay on disk."""
+        with self.lock:
+            if self._meta is None and self._frame is not None:
+                self.spill()
+            self._frame, self._frame_bytes = None, 0
+            self._loaded.clear()
+
+# Process-wide registry of every session's store. Entries go away with their
+# session, so other sessions' data is only ever spilled here, never dropped
+_STORES = weakref.WeakValueDictionary()
+_STORES_LOCK = threading.Lock()
+
+
+def _touch(store):
+    with _STORES_LOCK:
+        _STORES[store.session_id] = store
+
+
+def _enforce_global_budget(current):
+    """Spills least recently used sessions until the process fits the global budget."""
+    with _STORES_LOCK:
+        stores = sorted(_STORES.values(), key=lambda store: store.last_used)
+
+    total = sum(store.resident_bytes for store in stores)
+    for store in stores:
+        if total <= GLOBAL_BUDGET_BYTES:
+            break
+        if store is current:
+            continue
+        before = store.resident_bytes
+        store.release()
+        total -= before - store.resident_bytes
+
+
+def spill_enabled():
+    return bool(SPILL_ROOT)
+
+
+def idle_timeout_hours():
+    """Hours without activity after which a session's spilled dataset is cleared."""
+    return round(SESSION_IDLE_SECONDS / 3600, 1)
+
+
+def _session_store():
+    if "dataset_store" not in st.session_state:
+        session_id = uuid.uuid4().hex
+        st.session_state.dataset_store = SessionDataStore(session_id, SPILL_ROOT)
+    return st.session_state.dataset_store
+
+
+def get_working_df(columns=None):
+    """Returns the session's working dataset (or a column subset), or None if nothing is loaded."""
+    if not spill_enabled():
+        df = st.session_state.get("df")
+        if df is None or columns is None:
+            return df
+        return df[columns]
+
+    store = _session_store()
+    if store.version and time.time() - store.last_used > SESSION_IDLE_SECONDS:
+        # Only the session's own data expires, and it is told so
+        store.put(None)
+        st.session_state.dataset_version = st.session_state.get("dataset_version", 0) + 1
+        st.warning(
+            f"⚠️ Your dataset was cleared after {idle_timeout_hours():g} hours without activity. "
+            "Please upload it again."
+        )
+    df = store.frame(columns)
+    _touch(store)
+    _enforce_global_budget(store)
+    return df
+
+
+def set_working_df(df, changed_columns=None):
+    """Replaces the session's working dataset and bumps its version.
+
+    Pass the columns whose values the operation changed (an empty list for pure
+    row/column drops) to update the cached profile incrementally.
+    """
+    # The profile is carried against the old frame, then keyed on the new one once it is stored
+    profile = carried_profile(df, changed_columns)
+    st.session_state.dataset_version = st.session_state.get("dataset_version", 0) + 1
+    if not spill_enabled():
+        st.session_state.df = df
+    else:
+        store = _session_store()
+        store.put(df)
+        _touch(store)
+        _enforce_global_budget(store)
+    keep_profile(df, profile)
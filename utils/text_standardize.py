@@ -0,0 +1,110 @@
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+OPERATIONS = {
+    "Unicode normalize (NFKC)": lambda s: unicodedata.normalize("NFKC", s),
+    "Trim whitespace": str.strip,
+    "Collapse whitespace": lambda s: _WHITESPACE.sub(" ", s),
+    "Case fold": str.casefold,
+    "Lowercase": str.lower,
+    "Uppercase": str.upper,
+    "Title case": str.title,
+}
+
+
+def text_columns(df):
+    """Columns the standardization engine can work on."""
+    return df.select_dtypes(include=["object", "string", "category"]).columns.tolist()
+
+
+def _compose(operations, mapping):
+    steps = [OPERATIONS[name] for name in operations]
+
+    def transform(value):
+        if not isinstance(value, str):
+            return value
+        for step in steps:
+            value = step(value)
+        return mapping.get(value, value) if mapping else value
+
+    return transform
+
+
+def _remap(uniques, transform):
+    """Transforms the distinct values and returns (codes into merged uniques, merged uniques)."""
+    transformed = [transform(value) for value in uniques]
+    new_codes, merged = pd.factorize(pd.Series(transformed, dtype=object), use_na_sentinel=True)
+    return new_codes, merged
+
+
+def standardize_series(series, operations, mapping=None):
+    """Applies the operation chain and value mapping to each distinct value once.
+
+    The column is factorized, only the distinct labels are transformed, and the
+    original codes are remapped onto the (possibly merged) result.
+    """
+    transform = _compose(operations, mapping or {})
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if len(series.cat.categories) == 0:
+            return series.copy()
+        new_codes, merged = _remap(series.cat.categories, transform)
+        codes = series.cat.codes.to_numpy()
+        remapped = np.where(codes >= 0, new_codes[np.maximum(codes, 0)], -1)
+        return pd.Series(
+            pd.Categorical.from_codes(remapped, categories=merged.dropna()),
+            index=series.index,
+            name=series.name
+        )
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return series.copy()
+    new_codes, merged = _remap(uniques, transform)
+    remapped = np.where(codes >= 0, new_codes[np.maximum(codes, 0)], -1)
+    values = merged.take(remapped, allow_fill=True, fill_value=np.nan)
+    return pd.Series(values, index=series.index, name=series.name, dtype=series.dtype)
+
+
+def standardize_columns(df, columns, operations, mappings=None):
+    """Returns a copy of df with every selected column standardized in one pass each."""
+    mappings = mappings or {}
+    updated = df.copy()
+    for col in columns:
+        updated[col] = standardize_series(df[col], operations, mappings.get(col))
+    return updated
+
+
+def _fingerprint(value):
+    value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
+    tokens = _PUNCTUATION.sub(" ", value.casefold()).split()
+    return " ".join(sorted(set(tokens)))
+
+
+def suggest_merges(series, operations=()):
+    """Groups near-identical labels by fingerprint and proposes the most frequent spelling.
+
+    Labels are compared after the selected operations, so the suggested mapping
+    plugs straight into the end of the chain. Returns (Value, Count, Replace With)
+    rows for the labels that would change.
+    """
+    transform = _compose(operations, {})
+    counts = series.value_counts(dropna=True)
+    counts.index = [transform(value) for value in counts.index]
+    counts = counts.groupby(level=0, sort=False).sum().sort_values(ascending=False, kind="stable")
+    labels = [value for value in counts.index if isinstance(value, str)]
+    if not labels:
+        return pd.DataFrame(columns=["Value", "Count", "Replace With"])
+
+    table = pd.DataFrame({"Value": labels, "Count": counts.loc[labels].to_numpy()})
+    table["Key"] = [_fingerprint(value) for value in labels]
+    # value_counts is sorted by frequency, so the first label per key is the canonical one
+    table["Replace With"] = table.groupby("Key", sort=False)["Value"].transform("first")
+    merges = table[(table["Value"] != table["Replace With"]) & (table["Key"] != "")]
+    return merges[["Value", "Count", "Replace With"]].reset_index(drop=True)
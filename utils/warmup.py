@@ -0,0 +1,153 @@
+import os
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.compare import snapshot_from_profile
+from utils.density import fine_histogram
+from utils.frame_refs import frame_ref, resolve, seed_frame_cache
+from utils.jobs import find_job, submit_job
+from utils.pairs import PAIR_CHUNK_ROWS, bivariate_columns, pair_statistics
+from utils.profile import build_profile, seed_profile
+
+# Set AUTO_EDA_WARMUP=0 to leave the warm-up off by default
+WARMUP_ENABLED = os.environ.get("AUTO_EDA_WARMUP", "1") != "0"
+WARMUP_BUDGET_BYTES = int(float(os.environ.get("AUTO_EDA_WARMUP_BUDGET_MB", 64)) * 1024 ** 2)
+PAIR_ROW_BYTES = 64  # x, y, r, slope, intercept, n
+# Hash table slot, unique value and count per distinct value of a value_counts() call
+COUNT_ENTRY_BYTES = 40
+
+
+def _nbytes(value):
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, tuple):
+        return sum(part.nbytes for part in value)
+    return 0
+
+
+def _pair_cost(rows, columns):
+    """Peak bytes of pair_statistics(): one chunk with its mask copies, four p x p sums and the pair table."""
+    p = len(columns)
+    return min(rows, PAIR_CHUNK_ROWS) * p * 8 * 4 + p * p * 8 * 4 + p * (p - 1) // 2 * PAIR_ROW_BYTES
+
+
+def warm_up(handoff, df_ref, budget=WARMUP_BUDGET_BYTES, progress=None):
+    """Profiles a freshly loaded frame once for both the comparison baseline and the EDA caches.
+
+    handoff is a one-element list holding the frame. It is taken out so the
+    job keeps the frame alive only until the baseline parts are done: the
+    profile, value counts of the categorical columns and fine histograms of
+    the numeric ones. After the snapshot is built from those, only df_ref
+    (see frame_refs) is held, so replacing the dataset ends the rest of the
+    warm-up instead of pinning the old frame in memory.
+
+    The remaining steps (pairwise correlations, then value counts of the
+    numeric columns, the largest and least used) only start when their
+    cost, estimated from the frame's shape, fits what is left of budget.
+    Kept results add up to at most budget bytes.
+    """
+    def report(fraction, message):
+        if progress is not None:
+            progress(fraction, message)
+
+    df = handoff.pop()
+    report(0.0, "Profiling columns")
+    profile = build_profile(df)
+    rows, stats = profile["rows"], profile["stats"]
+    numeric = stats.index[stats["numeric"].to_numpy(dtype=bool)].tolist()
+    categorical = stats.index.difference(numeric, sort=False).tolist()
+    pair_columns = bivariate_columns(df)
+    optional = [("pair_statistics", None)] if len(pair_columns) >= 2 else []
+    optional += [("value_counts", col) for col in numeric]
+    steps = len(categorical) + len(numeric) + len(optional) + 1
+
+    counts = {}
+    for i, col in enumerate(categorical):
+        report((i + 1) / steps, f"Value counts of {col}")
+        counts[col] = df[col].value_counts()
+    for i, col in enumerate(numeric):
+        report((len(categorical) + i + 1) / steps, f"Histogram of {col}")
+        profile["histograms"][col] = fine_histogram(df[col].to_numpy(dtype="float64", na_value=np.nan))
+    del df
+    result = {
+        "snapshot": snapshot_from_profile(profile, counts),
+        "profile": profile,
+        "pair_statistics": None,
+        "skipped": []
+    }
+
+    used = _nbytes(stats) + sum(_nbytes(hist) for hist in profile["histograms"].values() if hist is not None)
+    for col, value in counts.items():
+        size = _nbytes(value)
+        if used + size > budget:
+            result["skipped"].append(("value_counts", col))
+            continue
+        used += size
+        profile["value_counts"][col] = value
+    del counts
+
+    for i, (kind, col) in enumerate(optional):
+        report((steps - len(optional) + i) / steps, "Correlations" if col is None else f"Value counts of {col}")
+        if kind == "pair_statistics":
+            cost = _pair_cost(rows, pair_columns)
+        else:
+            cost = int(stats.at[col, "count"]) * COUNT_ENTRY_BYTES
+        if used + cost > budget:
+            result["skipped"].append((kind, col))
+            continue
+        df = resolve(df_ref, pair_columns if col is None else [col])
+        if df is None:
+            # The dataset was replaced; what is left would describe a frame nobody uses
+            break
+        value = pair_statistics(df, pair_columns) if kind == "pair_statistics" else df[col].value_counts()
+        del df
+        size = _nbytes(value)
+        if used + size > budget:
+            result["skipped"].append((kind, col))
+            continue
+        used += size
+        if kind == "pair_statistics":
+            result["pair_statistics"] = (tuple(pair_columns), value)
+        else:
+            profile["value_counts"][col] = value
+    result["bytes"] = used
+    return result
+
+
+def _apply_warmup(df_ref, version, on_snapshot, result):
+    if on_snapshot is not None:
+        on_snapshot(result["snapshot"])
+    # The baseline stays valid after cleaning; the caches only describe the frame as loaded
+    if st.session_state.get("dataset_version", 0) != version:
+        return
+    df = resolve(df_ref)
+    if df is None:
+        return
+    seed_profile(df, result["profile"])
+    if result["pair_statistics"] is not None:
+        seed_frame_cache("pair_statistics", df, *result["pair_statistics"])
+
+
+def start_warmup(df, key, on_snapshot=None):
+    """Queues the profiling and warm-up of a freshly loaded frame, cancelling any earlier one still running.
+
+    on_snapshot(snapshot) receives the baseline snapshot (see utils.compare)
+    when the job finishes. Returns the job.
+    """
+    previous = st.session_state.get("warmup_key")
+    job = find_job(previous) if previous else None
+    if job is not None and job.active:
+        job.cancel()
+    st.session_state.warmup_key = key
+    df_ref = frame_ref(df)
+    version = st.session_state.get("dataset_version", 0)
+    return submit_job(
+        "Profile data and warm up EDA caches", warm_up, [df], df_ref, key=key,
+        on_success=partial(_apply_warmup, df_ref, version, on_snapshot),
+        with_progress=True, background=True
+    )